@@ -0,0 +1 @@
+"""Parser and pipeline benchmarks that replay recorded probe output (run with `python -m benchmarks`)."""
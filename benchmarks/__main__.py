@@ -0,0 +1,229 @@
+"""Times every section parser and the whole pipeline against replayed probe output.
+
+    python -m benchmarks                              # all built-in fixture sets
+    python -m benchmarks --output bench.json          # save machine-readable results
+    python -m benchmarks --compare bench.json         # fail if anything got slower
+    python -m benchmarks --record host.json           # record this host's probe output
+    python -m benchmarks --fixtures host.json         # replay a recorded host
+    python -m benchmarks --live                       # also time the real probes on this host
+
+With probes replayed, a collector's time is its parse time; --live measures the same
+collectors against the real host, so the difference is subprocess and I/O latency.
+"""
+import argparse
+import base64
+import json
+import platform
+import statistics
+import sys
+import time
+
+from pc_info import probes
+from pc_info.core import collectors_for, run_collectors
+from pc_info.diskstats import parse_diskstats
+from pc_info.formats import to_json, to_msgpack
+from pc_info.interrupts import parse_interrupts
+from pc_info.meminfo import parse_meminfo, parse_vmstat
+from pc_info.netstats import interface_filter, parse_net_dev
+from pc_info.pci import PCI_DEVICES, PciIds, build_index, parse_pci_ids
+from pc_info.smbios import DMI_TABLE, decode as decode_smbios
+from pc_info.watch import _parse_proc_stat
+
+from .fixtures import FIXTURE_SETS, pci_ids
+
+# Sections that talk to the host directly (netlink, os.listdir, the /proc process
+# scan) rather than through probes, so replaying fixtures can't make them deterministic.
+UNREPLAYABLE = {('Linux', 'network'), ('Linux', 'processes')}
+
+
+class _MissTracker(dict):
+    """Fixture table that remembers probes the collectors asked for but the fixtures lack."""
+
+    def __init__(self, table, misses):
+        super().__init__(table)
+        self.misses = misses
+
+    def get(self, key, default=None):
+        if key not in self:
+            self.misses.add(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        found = super().__contains__(key)
+        if not found:
+            self.misses.add(key)
+        return found
+
+
+def _time(function, repeat):
+    """Returns per-call wall times in milliseconds (one warm-up call is discarded)."""
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _summary(timings, **extra):
+    result = {
+        'runs': len(timings),
+        'min_ms': round(min(timings), 4),
+        'median_ms': round(statistics.median(timings), 4),
+        'mean_ms': round(statistics.mean(timings), 4),
+    }
+    result.update(extra)
+    return result
+
+
+def _bench_fixture_set(name, system, fixtures, repeat):
+    """Benchmarks each section collector and the full pipeline of `system` replaying `fixtures`.
+
+    UNREPLAYABLE sections are left out of both, so every number is fixture-only.
+    """
+    results = {}
+    collectors = [entry for entry in collectors_for(None, system) if (system, entry[0]) not in UNREPLAYABLE]
+    for section, function, _ in collectors:
+        misses = set()
+        tracked = {kind: _MissTracker(table, misses) for kind, table in fixtures.items()}
+        with probes.replaying(tracked):
+            timings = _time(function, repeat)
+        results[f"parse.{name}.{section}"] = _summary(timings, misses=sorted(misses))
+
+    with probes.replaying(fixtures):
+        timings = _time(lambda: run_collectors(collectors), repeat)
+        info = run_collectors(collectors)
+    results[f"pipeline.{name}"] = _summary(timings)
+    for label, encode in (("json", to_json), ("msgpack", to_msgpack)):
+        results[f"format.{name}.{label}"] = _summary(_time(lambda: encode(info), repeat), bytes=len(encode(info)))
+
+    files = fixtures.get('files', {})
+    if system == "Linux":
+        raw = {path: files[path].encode() for path in ("/proc/stat", "/proc/interrupts", "/proc/vmstat") if path in files}
+        for label, path, parser in (("proc_stat", "/proc/stat", _parse_proc_stat),
+                                    ("interrupts", "/proc/interrupts", parse_interrupts),
+                                    ("vmstat", "/proc/vmstat", lambda data, out=parse_vmstat(b""): parse_vmstat(data, out))):
+            if path in raw:
+                data = raw[path]
+                results[f"parse.{name}.watch.{label}"] = _summary(_time(lambda: parser(data), repeat))
+        if "/proc/meminfo" in files:
+            meminfo = files["/proc/meminfo"]
+            results[f"parse.{name}.meminfo"] = _summary(_time(lambda: parse_meminfo(meminfo), repeat))
+        if "/proc/net/dev" in files:
+            net_dev = files["/proc/net/dev"]
+            no_veths = interface_filter("!veth*")
+            results[f"parse.{name}.net_dev"] = _summary(_time(lambda: parse_net_dev(net_dev), repeat))
+            results[f"parse.{name}.net_dev_filtered"] = _summary(_time(lambda: parse_net_dev(net_dev, no_veths), repeat))
+        if "/proc/diskstats" in files:
+            diskstats = files["/proc/diskstats"]
+            results[f"parse.{name}.diskstats"] = _summary(_time(lambda: parse_diskstats(diskstats), repeat))
+        addresses = fixtures.get('dirs', {}).get(PCI_DEVICES)
+        if addresses:
+            ids_text = pci_ids()
+            results[f"parse.{name}.pci_ids_index"] = _summary(
+                _time(lambda: build_index(parse_pci_ids(ids_text)), max(1, repeat // 10)), bytes=len(ids_text))
+            ids = PciIds(build_index(parse_pci_ids(ids_text)))
+            hex_file = lambda address, attribute: int(files[f"{PCI_DEVICES}/{address}/{attribute}"], 16)
+            wanted = [(hex_file(address, "vendor"), hex_file(address, "device"), hex_file(address, "class"))
+                      for address in addresses]
+
+            def lookups():
+                for vendor, device, code in wanted:
+                    ids.vendor_name(vendor), ids.device_name(vendor, device), ids.class_name(code)
+            results[f"parse.{name}.pci_ids_lookup"] = _summary(_time(lookups, repeat), lookups=3 * len(wanted))
+        table = fixtures.get('blobs', {}).get(DMI_TABLE)
+        if table is not None:
+            table = base64.b64decode(table)
+            results[f"parse.{name}.smbios"] = _summary(_time(lambda: decode_smbios(table), repeat), bytes=len(table))
+    return results
+
+
+def _bench_live(repeat):
+    """Times each collector and the pipeline against the real host (probe latency included)."""
+    results = {}
+    for section, collector, _ in collectors_for():
+        results[f"live.{section}"] = _summary(_time(collector, repeat))
+    collectors = collectors_for()
+    results["live.pipeline"] = _summary(_time(lambda: run_collectors(collectors), repeat))
+    return results
+
+
+def _compare(baseline, current, threshold):
+    """Prints median ratios against a baseline run; returns True if anything regressed past threshold."""
+    regressed = False
+    print(f"{'benchmark':<48} {'baseline':>10} {'current':>10} {'ratio':>7}", file=sys.stderr)
+    for name, result in sorted(current['results'].items()):
+        before = baseline.get('results', {}).get(name)
+        if before is None or before['median_ms'] <= 0:
+            continue
+        ratio = result['median_ms'] / before['median_ms']
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{name:<48} {before['median_ms']:>10.3f} {result['median_ms']:>10.3f} {ratio:>7.2f}{flag}", file=sys.stderr)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument('--sets', metavar='NAMES', help=f"comma-separated built-in fixture sets (default: {','.join(FIXTURE_SETS)})")
+    parser.add_argument('--fixtures', metavar='FILE', action='append', default=[],
+                        help="replay a fixture file written by --record (may be repeated)")
+    parser.add_argument('--record', metavar='FILE', help="record every probe this host answers to FILE and exit")
+    parser.add_argument('--live', action='store_true', help="also time the collectors against this host")
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per benchmark (default: 20)")
+    parser.add_argument('--output', metavar='FILE', help="write results as JSON to FILE instead of stdout")
+    parser.add_argument('--compare', metavar='FILE', help="compare against an earlier --output and exit 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed median slowdown before --compare fails (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        with probes.recording() as fixtures:
+            run_collectors(collectors_for())
+        with open(args.record, "w") as f:
+            json.dump({'system': platform.system(), 'fixtures': fixtures}, f)
+        return 0
+
+    results = {}
+    names = args.sets.split(",") if args.sets else list(FIXTURE_SETS)
+    for name in names:
+        system, build = FIXTURE_SETS[name]
+        results.update(_bench_fixture_set(name, system, build(), args.repeat))
+    for path in args.fixtures:
+        with open(path) as f:
+            recorded = json.load(f)
+        name = path.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+        results.update(_bench_fixture_set(name, recorded['system'], recorded['fixtures'], args.repeat))
+    if args.live:
+        results.update(_bench_live(max(1, args.repeat // 4)))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'repeat': args.repeat,
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=1, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if _compare(baseline, report, args.threshold):
+            return 1
+    return 0
+
+
+sys.exit(main())
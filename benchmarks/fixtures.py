@@ -0,0 +1,683 @@
+"""Synthetic fixture sets shaped like probe output from large hosts.
+
+Each builder returns {kind: {key: result}} in the format pc_info.probes.replaying()
+expects (and pc_info.probes.recording() produces), so the collectors can be run
+against a 256-CPU Linux server, a 32-DIMM Windows workstation or a macOS host with
+hundreds of interfaces on any machine, with no root and no network. The output is
+deterministic so timings are comparable between runs.
+"""
+import base64
+import json
+import struct
+
+
+def _sys_block(fixtures, num_loops=64):
+    """Three NVMe disks (the first partitioned) with udev records, plus a pile of loop devices."""
+    files, dirs = fixtures['files'], fixtures['dirs']
+    disks = {'nvme0n1': ("259:0", ["nvme0n1p1", "nvme0n1p2"]), 'nvme1n1': ("259:3", []), 'nvme2n1': ("259:4", [])}
+    disks.update({f"loop{i}": (f"7:{i}", []) for i in range(num_loops)})
+    dirs["/sys/block"] = sorted(disks)
+    for disk, (dev, partitions) in disks.items():
+        base = f"/sys/block/{disk}"
+        dirs[base] = sorted(["alignment_offset", "bdi", "capability", "dev", "device", "holders", "inflight",
+                             "queue", "range", "removable", "size", "slaves", "stat", "subsystem", "uevent"]
+                            + partitions)
+        files[f"{base}/dev"] = dev + "\n"
+        files[f"{base}/queue/rotational"] = "0\n"
+        files[f"{base}/queue/logical_block_size"] = "512\n"
+        files[f"{base}/queue/nr_requests"] = "1023\n" if disk.startswith("nvme") else "128\n"
+        major, minor = dev.split(":")
+        for i, partition in enumerate(partitions, 1):
+            files[f"{base}/{partition}/dev"] = f"{major}:{int(minor) + i}\n"
+        if disk.startswith("nvme"):
+            serial = f"S64HNE0T{sum(map(ord, disk)) * 7919 % 10 ** 6:06d}"
+            files[f"{base}/device/model"] = "SAMSUNG MZQL23T8HCLS-00A07\n"
+            files[f"{base}/device/serial"] = serial + "\n"
+            for number in [dev] + [f"{major}:{int(minor) + i}" for i in range(1, len(partitions) + 1)]:
+                files[f"/run/udev/data/b{number}"] = (
+                    "S:disk/by-id/nvme-SAMSUNG_MZQL23T8HCLS-00A07_" + serial + "\n"
+                    "I:4511234\n"
+                    "E:ID_SERIAL_SHORT=" + serial + "\n"
+                    "E:ID_WWN=eui.36344830529000230025384500000001\n"
+                    "E:ID_MODEL=SAMSUNG MZQL23T8HCLS-00A07\n"
+                    "E:ID_SERIAL=SAMSUNG_MZQL23T8HCLS-00A07_" + serial + "\n"
+                    "E:ID_PATH=pci-0000:41:00.0-nvme-1\n"
+                    "G:systemd\n"
+                )
+
+
+def _proc_cpuinfo(num_cpus):
+    blocks = []
+    for cpu in range(num_cpus):
+        blocks.append(
+            f"processor\t: {cpu}\n"
+            "vendor_id\t: AuthenticAMD\n"
+            "cpu family\t: 25\n"
+            "model\t\t: 1\n"
+            "model name\t: AMD EPYC 7763 64-Core Processor\n"
+            "stepping\t: 1\n"
+            "microcode\t: 0xa0011d1\n"
+            f"cpu MHz\t\t: {1500 + (cpu * 37) % 1900}.{cpu % 1000:03d}\n"
+            "cache size\t: 512 KB\n"
+            f"physical id\t: {cpu // 128}\n"
+            "siblings\t: 128\n"
+            f"core id\t\t: {cpu % 64}\n"
+            "cpu cores\t: 64\n"
+            f"apicid\t\t: {cpu}\n"
+            "fpu\t\t: yes\n"
+            "fpu_exception\t: yes\n"
+            "cpuid level\t: 16\n"
+            "wp\t\t: yes\n"
+            "flags\t\t: fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov pat pse36 clflush mmx fxsr "
+            "sse sse2 ht syscall nx mmxext fxsr_opt pdpe1gb rdtscp lm constant_tsc rep_good nopl nonstop_tsc cpuid "
+            "extd_apicid aperfmperf rapl pni pclmulqdq monitor ssse3 fma cx16 pcid sse4_1 sse4_2 x2apic movbe popcnt "
+            "aes xsave avx f16c rdrand lahf_lm cmp_legacy svm extapic cr8_legacy abm sse4a misalignsse 3dnowprefetch "
+            "osvw ibs skinit wdt tce topoext perfctr_core perfctr_nb bpext perfctr_llc mwaitx cpb cat_l3 cdp_l3 "
+            "invpcid_single hw_pstate ssbd mba ibrs ibpb stibp vmmcall fsgsbase bmi1 avx2 smep bmi2 erms invpcid cqm "
+            "rdt_a rdseed adx smap clflushopt clwb sha_ni xsaveopt xsavec xgetbv1 xsaves cqm_llc cqm_occup_llc "
+            "cqm_mbm_total cqm_mbm_local clzero irperf xsaveerptr rdpru wbnoinvd amd_ppin arat npt lbrv svm_lock "
+            "nrip_save tsc_scale vmcb_clean flushbyasid decodeassists pausefilter pfthreshold v_vmsave_vmload vgif "
+            "v_spec_ctrl umip pku ospke vaes vpclmulqdq rdpid overflow_recov succor smca\n"
+            "bugs\t\t: sysret_ss_attrs spectre_v1 spectre_v2 spec_store_bypass srso\n"
+            "bogomips\t: 4890.73\n"
+            "TLB size\t: 2560 4K pages\n"
+            "clflush size\t: 64\n"
+            "cache_alignment\t: 64\n"
+            "address sizes\t: 48 bits physical, 48 bits virtual\n"
+            "power management: ts ttp tm hwpstate cpb eff_freq_ro [13] [14]\n"
+        )
+    return "\n".join(blocks) + "\n"
+
+
+def _proc_stat(num_cpus):
+    lines = [f"cpu  {num_cpus * 91234} {num_cpus * 12} {num_cpus * 40211} {num_cpus * 9912345} {num_cpus * 4411} 0 {num_cpus * 812} 0 0 0"]
+    for cpu in range(num_cpus):
+        lines.append(f"cpu{cpu} {91234 + cpu * 17} 12 {40211 + cpu * 3} {9912345 - cpu * 20} 4411 0 812 0 0 0")
+    lines.append("intr 987654321 " + " ".join(str(i * 3) for i in range(512)))
+    lines += ["ctxt 123456789012", "btime 1700000000", "processes 4567890", "procs_running 12",
+              "procs_blocked 0", "softirq 456789012 1 2 3 4 5 6 7 8 9 10"]
+    return "\n".join(lines) + "\n"
+
+
+def _proc_interrupts(num_cpus, num_irqs=200):
+    width = len(str(10 ** 9))
+    lines = [" " * 5 + "".join(f"CPU{cpu}".rjust(width + 1) for cpu in range(num_cpus))]
+    for irq in range(num_irqs):
+        counts = "".join(str((irq * 7919 + cpu * 104729) % 10 ** 9).rjust(width + 1) for cpu in range(num_cpus))
+        if irq < 16:
+            label = f"IO-APIC   {irq}-edge      timer" if irq == 0 else f"IO-APIC   {irq}-edge      i8042"
+        else:
+            label = f"IR-PCI-MSI-0000:{irq % 256:02x}:00.0 {irq * 4096}-edge      nvme{irq % 24}q{irq % 64}"
+        lines.append(f"{str(irq).rjust(4)}:{counts}  {label}")
+    for name, desc in (("NMI", "Non-maskable interrupts"), ("LOC", "Local timer interrupts"),
+                       ("SPU", "Spurious interrupts"), ("PMI", "Performance monitoring interrupts"),
+                       ("RES", "Rescheduling interrupts"), ("CAL", "Function call interrupts"),
+                       ("TLB", "TLB shootdowns"), ("MCE", "Machine check exceptions")):
+        counts = "".join(str(123456 + cpu).rjust(width + 1) for cpu in range(num_cpus))
+        lines.append(f"{name}:{counts}   {desc}")
+    lines += ["ERR:          0", "MIS:          0"]
+    return "\n".join(lines) + "\n"
+
+
+_MEMINFO = """MemTotal:       1056473088 kB
+MemFree:        12345678 kB
+MemAvailable:   734567890 kB
+Buffers:         2345678 kB
+Cached:         701234567 kB
+SwapCached:        12345 kB
+Active:         456789012 kB
+Inactive:       345678901 kB
+Active(anon):   123456789 kB
+Inactive(anon):  1234567 kB
+Active(file):   333332223 kB
+Inactive(file): 344444334 kB
+Unevictable:       12345 kB
+Mlocked:           12345 kB
+SwapTotal:      67108860 kB
+SwapFree:       66108860 kB
+Dirty:             12345 kB
+Writeback:             0 kB
+AnonPages:      124691356 kB
+Mapped:          4567890 kB
+Shmem:           1234567 kB
+KReclaimable:   23456789 kB
+Slab:           34567890 kB
+SReclaimable:   23456789 kB
+SUnreclaim:     11111101 kB
+KernelStack:      345678 kB
+PageTables:      1234567 kB
+NFS_Unstable:          0 kB
+Bounce:                0 kB
+WritebackTmp:          0 kB
+CommitLimit:    595345404 kB
+Committed_AS:   234567890 kB
+VmallocTotal:   34359738367 kB
+VmallocUsed:     1234567 kB
+VmallocChunk:          0 kB
+Percpu:           567890 kB
+HardwareCorrupted:     0 kB
+AnonHugePages:  23456768 kB
+ShmemHugePages:        0 kB
+ShmemPmdMapped:        0 kB
+FileHugePages:         0 kB
+FilePmdMapped:         0 kB
+HugePages_Total:    1024
+HugePages_Free:      512
+HugePages_Rsvd:        0
+HugePages_Surp:        0
+Hugepagesize:       2048 kB
+Hugetlb:         2097152 kB
+DirectMap4k:     12345678 kB
+DirectMap2M:    234567890 kB
+DirectMap1G:    814743552 kB
+"""
+
+# /proc/vmstat of a 5.15 kernel: the counters we keep are scattered among ~170 others.
+_VMSTAT_NAMES = (
+    "nr_free_pages nr_zone_inactive_anon nr_zone_active_anon nr_zone_inactive_file nr_zone_active_file "
+    "nr_zone_unevictable nr_zone_write_pending nr_mlock nr_bounce nr_zspages nr_free_cma numa_hit numa_miss "
+    "numa_foreign numa_interleave numa_local numa_other nr_inactive_anon nr_active_anon nr_inactive_file "
+    "nr_active_file nr_unevictable nr_slab_reclaimable nr_slab_unreclaimable nr_isolated_anon nr_isolated_file "
+    "workingset_nodes workingset_refault_anon workingset_refault_file workingset_activate_anon "
+    "workingset_activate_file workingset_restore_anon workingset_restore_file workingset_nodereclaim "
+    "nr_anon_pages nr_mapped nr_file_pages nr_dirty nr_writeback nr_writeback_temp nr_shmem nr_shmem_hugepages "
+    "nr_shmem_pmdmapped nr_file_hugepages nr_file_pmdmapped nr_anon_transparent_hugepages nr_vmscan_write "
+    "nr_vmscan_immediate_reclaim nr_dirtied nr_written nr_kernel_misc_reclaimable nr_foll_pin_acquired "
+    "nr_foll_pin_released nr_kernel_stack nr_page_table_pages nr_swapcached nr_dirty_threshold "
+    "nr_dirty_background_threshold pgpgin pgpgout pswpin pswpout pgalloc_dma pgalloc_dma32 pgalloc_normal "
+    "pgalloc_movable allocstall_dma allocstall_dma32 allocstall_normal allocstall_movable pgskip_dma pgskip_dma32 "
+    "pgskip_normal pgskip_movable pgfree pgactivate pgdeactivate pglazyfree pgfault pgmajfault pglazyfreed "
+    "pgrefill pgreuse pgsteal_kswapd pgsteal_direct pgscan_kswapd pgscan_direct pgscan_direct_throttle "
+    "pgscan_anon pgscan_file pgsteal_anon pgsteal_file zone_reclaim_failed pginodesteal slabs_scanned "
+    "kswapd_inodesteal kswapd_low_wmark_hit_quickly kswapd_high_wmark_hit_quickly pageoutrun pgrotated "
+    "drop_pagecache drop_slab oom_kill numa_pte_updates numa_huge_pte_updates numa_hint_faults "
+    "numa_hint_faults_local numa_pages_migrated pgmigrate_success pgmigrate_fail thp_migration_success "
+    "thp_migration_fail thp_migration_split compact_migrate_scanned compact_free_scanned compact_isolated "
+    "compact_stall compact_fail compact_success compact_daemon_wake compact_daemon_migrate_scanned "
+    "compact_daemon_free_scanned htlb_buddy_alloc_success htlb_buddy_alloc_fail unevictable_pgs_culled "
+    "unevictable_pgs_scanned unevictable_pgs_rescued unevictable_pgs_mlocked unevictable_pgs_munlocked "
+    "unevictable_pgs_cleared unevictable_pgs_stranded thp_fault_alloc thp_fault_fallback thp_fault_fallback_charge "
+    "thp_collapse_alloc thp_collapse_alloc_failed thp_file_alloc thp_file_fallback thp_file_fallback_charge "
+    "thp_file_mapped thp_split_page thp_split_page_failed thp_deferred_split_page thp_split_pmd thp_split_pud "
+    "thp_zero_page_alloc thp_zero_page_alloc_failed thp_swpout thp_swpout_fallback balloon_inflate "
+    "balloon_deflate balloon_migrate swap_ra swap_ra_hit direct_map_level2_splits direct_map_level3_splits "
+    "nr_unstable"
+).split()
+_VMSTAT_KEPT = {'pgfault': 98765432109, 'pgmajfault': 1234567, 'pswpin': 23456, 'pswpout': 34567, 'oom_kill': 2}
+_VMSTAT = "".join(f"{name} {_VMSTAT_KEPT.get(name, i * 2654435761 % 10 ** (3 + i % 9))}\n"
+                  for i, name in enumerate(_VMSTAT_NAMES))
+
+
+def _sys_memory(fixtures, sockets=2):
+    """Per-node meminfo and the 2 MB and 1 GB hugepage pools, system-wide and per node."""
+    files, dirs = fixtures['files'], fixtures['dirs']
+    pools = {2048: 1024, 1048576: 16}
+    for directory, share in [("/sys/kernel/mm/hugepages", 1)] + [
+            (f"/sys/devices/system/node/node{node}/hugepages", sockets) for node in range(sockets)]:
+        dirs[directory] = [f"hugepages-{size}kB" for size in pools]
+        for size, count in pools.items():
+            for filename, value in (("nr_hugepages", count // share), ("free_hugepages", count // share // 2),
+                                    ("resv_hugepages", 0), ("surplus_hugepages", 0)):
+                files[f"{directory}/hugepages-{size}kB/{filename}"] = f"{value}\n"
+    for node in range(sockets):  # the system's memory split evenly between the nodes
+        lines = []
+        for line in _MEMINFO.splitlines():
+            key, _, value = line.partition(":")
+            if key in ("MemTotal", "MemFree", "Active", "Inactive", "Dirty", "AnonPages", "Shmem", "Slab",
+                       "HugePages_Total", "HugePages_Free"):
+                number, _, unit = value.strip().partition(" ")
+                lines.append(f"Node {node} {key + ':':<16}{int(number) // sockets:>10} {unit}".rstrip())
+        files[f"/sys/devices/system/node/node{node}/meminfo"] = "\n".join(lines) + "\n"
+
+
+def _smbios_structure(kind, handle, length, fields, strings=()):
+    """One SMBIOS structure: `fields` is {offset: (struct format, value)} within its `length`-byte formatted area."""
+    formatted = bytearray(length)
+    struct.pack_into("<BBH", formatted, 0, kind, length, handle)
+    for offset, (fmt, value) in fields.items():
+        struct.pack_into("<" + fmt, formatted, offset, value)
+    text = b"".join(string.encode() + b"\0" for string in strings)
+    return bytes(formatted) + (text + b"\0" if text else b"\0\0")
+
+
+def _smbios_table(num_dimms):
+    """A raw DMI table: BIOS, baseboard, chassis and `num_dimms` populated DDR4 slots (plus as many empty ones)."""
+    table = [
+        _smbios_structure(0, 0x0000, 0x1A, {4: ("B", 1), 5: ("B", 2), 8: ("B", 3), 9: ("B", 0xFF), 0x14: ("B", 5),
+                                            0x15: ("B", 22), 0x18: ("H", 32)},
+                          ("American Megatrends Inc.", "2.4a", "06/14/2023")),
+        _smbios_structure(2, 0x0002, 0x0F, {4: ("B", 1), 5: ("B", 2), 6: ("B", 3), 7: ("B", 4), 8: ("B", 5)},
+                          ("Supermicro", "H12DSi-NT6", "1.02A", "OM21BS012345", "To be filled by O.E.M.")),
+        _smbios_structure(3, 0x0003, 0x16, {4: ("B", 1), 5: ("B", 0x17), 6: ("B", 2), 7: ("B", 3), 8: ("B", 4)},
+                          ("Supermicro", "0123456789", "C21900K12A3456", "Default string")),
+    ]
+    for slot in range(num_dimms * 2):
+        fields = {4: ("H", 0x1000), 6: ("H", 0xFFFE), 8: ("H", 72), 0x0A: ("H", 64), 0x0E: ("B", 0x09),
+                  0x10: ("B", 1), 0x11: ("B", 2), 0x12: ("B", 0x1A)}
+        strings = [f"CPU{slot // 32 + 1}_DIMM_{'ABCDEFGH'[slot // 2 % 8]}{slot % 2 + 1}",
+                   f"P{slot // 32}_Node{slot // 32}_Channel{slot // 2 % 8}_Dimm{slot % 2}"]
+        if slot % 2 == 0:  # populated: 32 GB through the extended size field, every fourth 16 GB in the size word
+            dimm = slot // 2
+            fields.update({0x0C: ("H", 16384 if dimm % 4 == 0 else 0x7FFF), 0x1C: ("I", 32768), 0x15: ("H", 3200),
+                           0x20: ("H", 3200), 0x17: ("B", 3), 0x18: ("B", 4), 0x19: ("B", 5), 0x1A: ("B", 6)})
+            strings += ["Samsung", f"{0x35A1B000 + dimm * 7:08X}", f"P{dimm // 16}-DIMM{dimm}-AssetTag",
+                        "M393A4K40DB3-CWE    "]
+        table.append(_smbios_structure(17, 0x1100 + slot, 0x5C, fields, strings))
+    table.append(_smbios_structure(127, 0xFFFF, 4, {}))
+    return b"".join(table)
+
+
+def _smbios(fixtures, num_dimms):
+    """The SMBIOS table as root reads it, and the privileged helper's answer for replays as a normal user."""
+    from pc_info import probes
+    from pc_info.privileged import helper_command
+    from pc_info.smbios import DMI_ENTRY_POINT, DMI_TABLE, decode
+
+    table = _smbios_table(num_dimms)
+    entry_point = b"_SM3_" + bytes([0, 24, 3, 3, 0]) + bytes(14)
+    fixtures['blobs'] = {DMI_TABLE: base64.b64encode(table).decode(),
+                         DMI_ENTRY_POINT: base64.b64encode(entry_point).decode()}
+    smbios = dict(decode(table), version="3.3.0")
+    fixtures['commands'][probes.command_key(helper_command())] = json.dumps({'smbios': smbios}) + "\n"
+
+
+def _proc_net_dev(num_veths):
+    """/proc/net/dev of a Kubernetes node: lo, two bonded NICs and a veth per pod."""
+    lines = ["Inter-|   Receive                                                |  Transmit",
+             " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed"]
+    names = ["lo", "eno1", "eno2", "bond0"] + [f"veth{i:05x}a{i % 7}" for i in range(num_veths)]
+    for i, name in enumerate(names):
+        rx, tx = 1234567890123 // (i + 1), 987654321098 // (i + 1)
+        lines.append(f"{name:>6}: {rx} {rx // 1400} {i % 3} {i % 11} 0 0 0 {i * 3} {tx} {tx // 1400} 0 {i % 5} 0 0 0 0")
+    return "\n".join(lines) + "\n"
+
+
+def _proc_diskstats(num_loops):
+    """/proc/diskstats (20 columns, as since 5.5) of three NVMe drives, the root disk's partitions and a loop device per snap."""
+    names = [(259, 0, "nvme0n1"), (259, 1, "nvme0n1p1"), (259, 2, "nvme0n1p2"), (259, 3, "nvme1n1"), (259, 4, "nvme2n1")]
+    names += [(7, i, f"loop{i}") for i in range(num_loops)]
+    lines = []
+    for i, (major, minor, name) in enumerate(names):
+        reads, writes = 98765432 // (i + 1), 45678901 // (i + 1)
+        lines.append(f"{major:4} {minor:7} {name} {reads} {reads // 9} {reads * 24} {reads // 3} {writes} {writes // 5} "
+                     f"{writes * 40} {writes // 2} {i % 4} {reads // 4} {reads // 2 + writes // 2} 0 0 0 0 {i * 17} {i * 3}")
+    return "\n".join(lines) + "\n"
+
+
+_PCI_IDS_HEAD = """#
+#	List of PCI ID's
+#
+# Vendors, devices and subsystems. Please keep sorted.
+
+# Syntax:
+# vendor  vendor_name
+#	device  device_name				<-- single tab
+#		subvendor subdevice  subsystem_name	<-- two tabs
+
+"""
+
+_PCI_IDS_CLASSES = """
+# List of known device classes, subclasses and programming interfaces
+
+C 01  Mass storage controller
+\t08  Non-Volatile memory controller
+\t\t02  NVM Express
+C 02  Network controller
+\t00  Ethernet controller
+C 03  Display controller
+\t00  VGA compatible controller
+\t\t00  VGA controller
+\t02  3D controller
+C 06  Bridge
+\t00  Host bridge
+\t04  PCI bridge
+\t\t00  Normal decode
+"""
+
+
+def pci_ids(num_vendors=2500, devices_per_vendor=16):
+    """A pci.ids of about the real one's size (it has ~2,500 vendors and ~40,000 devices), with the devices of
+    _sys_pci() among them."""
+    lines = []
+    known = {0x1022: ("Advanced Micro Devices, Inc. [AMD]", {0x1480: "Starship/Matisse Root Complex"}),
+             0x10de: ("NVIDIA Corporation", {0x20b2: "GA100 [A100 SXM4 80GB]"}),
+             0x144d: ("Samsung Electronics Co Ltd", {0xa80a: "NVMe SSD Controller PM9A1/PM9A3/980PRO"}),
+             0x15b3: ("Mellanox Technologies", {0x101d: "MT2892 Family [ConnectX-6 Dx]"})}
+    for vendor in sorted(set(range(0x1000, 0x1000 + num_vendors * 7, 7)) | set(known)):
+        name, devices = known.get(vendor, (f"Vendor Corporation {vendor:04x}", {}))
+        lines.append(f"{vendor:04x}  {name}")
+        for device in sorted(set(range(0x0010, 0x0010 + devices_per_vendor * 13, 13)) | set(devices)):
+            lines.append(f"\t{device:04x}  {devices.get(device, f'Controller {device:04x} [Series {device % 9}]')}")
+            if device in devices or device % 3 == 0:
+                lines.append(f"\t\t{vendor:04x} {device + 0x1000:04x}  Board {device:04x} rev A")
+    return _PCI_IDS_HEAD + "\n".join(lines) + "\n" + _PCI_IDS_CLASSES
+
+
+def _sys_pci(fixtures, num_gpus):
+    """sysfs PCI devices of an 8-GPU server: root complexes, then per GPU a PCIe switch, the GPU, a ConnectX NIC and
+    an NVMe drive, half of them on each NUMA node."""
+    files, dirs, links = fixtures['files'], fixtures['dirs'], fixtures['links']
+    base = "/sys/bus/pci/devices"
+    devices = []
+
+    def add(address, code, vendor, device, driver, numa_node, bars):
+        path = f"{base}/{address}"
+        devices.append(address)
+        files[f"{path}/class"] = f"0x{code:06x}\n"
+        files[f"{path}/vendor"] = f"0x{vendor:04x}\n"
+        files[f"{path}/device"] = f"0x{device:04x}\n"
+        files[f"{path}/subsystem_vendor"] = f"0x{vendor:04x}\n"
+        files[f"{path}/subsystem_device"] = f"0x{device + 0x1000:04x}\n"
+        files[f"{path}/revision"] = "0xa1\n"
+        files[f"{path}/numa_node"] = f"{numa_node}\n"
+        resource = []
+        for start, size, flags in bars:
+            resource.append(f"0x{start:016x} 0x{start + size - 1:016x} 0x{flags:016x}")
+        resource += ["0x0000000000000000 0x0000000000000000 0x0000000000000000"] * (13 - len(resource))
+        files[f"{path}/resource"] = "\n".join(resource) + "\n"
+        if driver:
+            links[f"{path}/driver"] = f"../../../../bus/pci/drivers/{driver}"
+
+    for node in range(2):
+        add(f"0000:{node * 0xc0:02x}:00.0", 0x060000, 0x1022, 0x1480, None, node, [])
+    for gpu in range(num_gpus):
+        bus, node = 0x10 + gpu * 0x10, gpu * 2 // num_gpus
+        add(f"0000:{bus:02x}:00.0", 0x060400, 0x1022, 0x1483, "pcieport", node, [])
+        add(f"0000:{bus + 1:02x}:00.0", 0x030200, 0x10de, 0x20b2, "nvidia", node,
+            [(0xe0000000 + gpu * 0x1000000, 16 << 20, 0x40200),
+             (0x38000000000 + gpu * 0x2000000000, 128 << 30, 0x14220c),
+             (0x38800000000 + gpu * 0x2000000000, 32 << 20, 0x14220c)])
+        add(f"0000:{bus + 2:02x}:00.0", 0x020000, 0x15b3, 0x101d, "mlx5_core", node,
+            [(0x3f000000000 + gpu * 0x4000000, 32 << 20, 0x14220c)])
+        add(f"0000:{bus + 3:02x}:00.0", 0x010802, 0x144d, 0xa80a, "nvme", node, [(0xf0000000 + gpu * 0x4000, 16 << 10, 0x40200)])
+    dirs[base] = sorted(devices)
+    files["/sys/module/nvidia/version"] = "550.54.15\n"
+
+
+def _cpulist(cpus):
+    """Renders CPU numbers the way sysfs lists them ("0-7,128-135")."""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(f"{first}-{last}" if first != last else str(first) for first, last in ranges) + "\n"
+
+
+def _sys_cpu(fixtures, num_cpus, sockets=2, ccx_cores=8):
+    """sysfs CPU topology of an SMT-2, `sockets`-socket part with an L3 per `ccx_cores` cores, one NUMA node
+    per socket and one cpufreq policy per CPU. CPU n and n + num_cpus/2 are the two threads of a core."""
+    files, dirs = fixtures['files'], fixtures['dirs']
+    base = "/sys/devices/system/cpu"
+    num_cores = num_cpus // 2
+    cores_per_socket = num_cores // sockets
+    files[f"{base}/online"] = f"0-{num_cpus - 1}\n"
+    dirs[f"{base}/cpufreq"] = [f"policy{cpu}" for cpu in range(num_cpus)]
+    for cpu in range(num_cpus):
+        core = cpu % num_cores
+        socket = core // cores_per_socket
+        ccx = core // ccx_cores
+        threads = [core, core + num_cores]
+        socket_cpus = [c for s in range(socket * cores_per_socket, (socket + 1) * cores_per_socket) for c in (s, s + num_cores)]
+        ccx_cpus = [c for s in range(ccx * ccx_cores, (ccx + 1) * ccx_cores) for c in (s, s + num_cores)]
+        topology = f"{base}/cpu{cpu}/topology"
+        files[f"{topology}/thread_siblings_list"] = _cpulist(threads)
+        files[f"{topology}/package_cpus_list"] = _cpulist(socket_cpus)
+        files[f"{topology}/physical_package_id"] = f"{socket}\n"
+        files[f"{topology}/core_id"] = f"{core % cores_per_socket}\n"
+        dirs[f"{base}/cpu{cpu}/cache"] = ["index0", "index1", "index2", "index3", "uevent"]
+        for index, (level, kind, size, shared) in enumerate((("1", "Data", "32K", threads), ("1", "Instruction", "32K", threads),
+                                                            ("2", "Unified", "1024K", threads), ("3", "Unified", "32768K", ccx_cpus))):
+            cache = f"{base}/cpu{cpu}/cache/index{index}"
+            files[f"{cache}/level"] = level + "\n"
+            files[f"{cache}/type"] = kind + "\n"
+            files[f"{cache}/size"] = size + "\n"
+            files[f"{cache}/shared_cpu_list"] = _cpulist(shared)
+        policy = f"{base}/cpufreq/policy{cpu}"
+        files[f"{policy}/related_cpus"] = f"{cpu}\n"
+        files[f"{policy}/scaling_cur_freq"] = f"{1500000 + cpu * 7919 % 2000000}\n"
+        files[f"{policy}/cpuinfo_min_freq"] = "1500000\n"
+        files[f"{policy}/cpuinfo_max_freq"] = "3529052\n"
+    dirs["/sys/devices/system/node"] = [f"node{s}" for s in range(sockets)] + ["possible", "online"]
+    for socket in range(sockets):
+        cpus = [c for s in range(socket * cores_per_socket, (socket + 1) * cores_per_socket) for c in (s, s + num_cores)]
+        files[f"/sys/devices/system/node/node{socket}/cpulist"] = _cpulist(cpus)
+
+
+def linux_large(num_cpus=256, num_mounts=400):
+    """A 2-socket, 256-thread Linux server with 32 DIMMs, 8 GPUs, hundreds of container mounts and 5,000 veths."""
+    fixtures = {'commands': {}, 'files': {}, 'registry': {}, 'statvfs': {}, 'dirs': {}, 'blobs': {}, 'links': {}}
+    files = fixtures['files']
+    files["/proc/cpuinfo"] = _proc_cpuinfo(num_cpus)
+    files["/proc/stat"] = _proc_stat(num_cpus)
+    files["/proc/interrupts"] = _proc_interrupts(num_cpus)
+    files["/proc/meminfo"] = _MEMINFO
+    files["/proc/vmstat"] = _VMSTAT
+    files["/proc/net/dev"] = _proc_net_dev(5000)
+    files["/proc/diskstats"] = _proc_diskstats(200)
+    _sys_cpu(fixtures, num_cpus)
+    _sys_memory(fixtures)
+    for name, value in (("board_vendor", "Supermicro"), ("board_name", "H12DSi-NT6"),
+                        ("board_serial", "OM21BS012345"), ("board_version", "1.02A")):
+        files[f"/sys/class/dmi/id/{name}"] = value + "\n"
+    files["/proc/net/route"] = (
+        "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+        "bond0\t00000000\t0100000A\t0003\t0\t0\t100\t00000000\t0\t0\t0\n"
+        "bond0\t0000000A\t00000000\t0001\t0\t0\t100\t0000FFFF\t0\t0\t0\n"
+    )
+    files["/run/systemd/resolve/resolv.conf"] = "nameserver 10.0.0.2\nnameserver 10.0.0.3\nsearch corp.example.com\n"
+
+    mounts = [
+        "21 1 259:2 / / rw,relatime shared:1 - ext4 /dev/nvme0n1p2 rw",
+        "22 21 259:1 / /boot/efi rw,relatime shared:2 - vfat /dev/nvme0n1p1 rw",
+        "23 21 0:22 / /proc rw,nosuid,nodev,noexec,relatime shared:3 - proc proc rw",
+        "24 21 0:23 / /sys rw,nosuid,nodev,noexec,relatime shared:4 - sysfs sysfs rw",
+        "25 21 0:5 / /dev rw,nosuid,relatime shared:5 - devtmpfs udev rw,size=528236544k",
+        "26 21 0:24 / /run rw,nosuid,nodev,noexec,relatime shared:6 - tmpfs tmpfs rw,size=105647312k",
+        "27 21 259:3 / /var/lib/docker rw,relatime shared:7 - xfs /dev/nvme1n1 rw",
+        "28 21 259:4 / /data\\040volume rw,relatime shared:8 - xfs /dev/nvme2n1 rw",
+    ]
+    statvfs = fixtures['statvfs']
+    statvfs["/"] = [4096, 4096, 488281250, 300000000, 275000000, 61054976, 60000000, 60000000, 4096, 255]
+    statvfs["/boot/efi"] = [4096, 4096, 130812, 129000, 129000, 0, 0, 0, 4096, 255]
+    statvfs["/dev"] = [4096, 4096, 132059136, 132059136, 132059136, 33014784, 33014000, 33014000, 4096, 255]
+    statvfs["/run"] = [4096, 4096, 26411828, 26400000, 26400000, 33014784, 33013000, 33013000, 4096, 255]
+    statvfs["/var/lib/docker"] = [4096, 4096, 1953125000, 1500000000, 1500000000, 976562432, 970000000, 970000000, 4096, 255]
+    statvfs["/data volume"] = [4096, 4096, 3906250000, 3000000000, 3000000000, 1953124864, 1950000000, 1950000000, 4096, 255]
+    statvfs["/proc"] = statvfs["/sys"] = [4096, 4096, 0, 0, 0, 0, 0, 0, 4096, 255]
+    for i in range(num_mounts):
+        container = f"{i * 2654435761 % 16 ** 12:012x}"
+        if i % 2:
+            mount_point = f"/var/lib/docker/overlay2/{container}/merged"
+            mounts.append(f"{100 + i} 27 0:{100 + i} / {mount_point} rw,relatime - overlay overlay "
+                          f"rw,lowerdir=/var/lib/docker/overlay2/l/{container}:/var/lib/docker/overlay2/l/base,"
+                          f"upperdir=/var/lib/docker/overlay2/{container}/diff,workdir=/var/lib/docker/overlay2/{container}/work")
+            statvfs[mount_point] = statvfs["/var/lib/docker"]
+        else:
+            mount_point = f"/run/containerd/io.containerd.runtime.v2.task/k8s.io/{container}/shm"
+            mounts.append(f"{100 + i} 26 0:{100 + i} / {mount_point} rw,nosuid,nodev,noexec,relatime - tmpfs shm rw,size=65536k")
+            statvfs[mount_point] = [4096, 4096, 16384, 16384, 16384, 33014784, 33014783, 33014783, 4096, 255]
+    files["/proc/self/mountinfo"] = "\n".join(mounts) + "\n"
+
+    _smbios(fixtures, 32)
+    _sys_pci(fixtures, 8)
+    _sys_block(fixtures)
+    return fixtures
+
+
+def _wmic(records):
+    """Renders records the way `wmic ... /Value` prints them (CRCRLF line endings)."""
+    out = ["", ""]
+    for record in records:
+        out += [f"{key}={value}" for key, value in record.items()] + ["", ""]
+    return "\r\r\n".join(out)
+
+
+def windows_large():
+    """A 2-socket Windows workstation with 32 DIMMs, 24 disks, 4 GPUs, 50 network adapters and 5,000 processes."""
+    fixtures = {'commands': {}, 'files': {}, 'registry': {}, 'statvfs': {}}
+    fixtures['registry']["HARDWARE\\DESCRIPTION\\System\\CentralProcessor\\0\\ProcessorNameString"] = \
+        "Intel(R) Xeon(R) w9-3495X"
+    commands = fixtures['commands']
+    commands["wmic cpu get CurrentClockSpeed, L2CacheSize, L3CacheSize, MaxClockSpeed, DataWidth, NumberOfCores, "
+             "NumberOfLogicalProcessors, SocketDesignation, Manufacturer, Family, DeviceID /Value"] = _wmic(
+        {'CurrentClockSpeed': 1900, 'DataWidth': 64, 'DeviceID': f"CPU{socket}", 'Family': 179, 'L2CacheSize': 114688,
+         'L3CacheSize': 107520, 'Manufacturer': "GenuineIntel", 'MaxClockSpeed': 1900, 'NumberOfCores': 56,
+         'NumberOfLogicalProcessors': 112, 'SocketDesignation': f"CPU{socket}"} for socket in range(2))
+    commands["wmic computersystem get TotalPhysicalMemory"] = "TotalPhysicalMemory  \r\r\n1099511627776        \r\r\n\r\r\n"
+    commands["wmic memorychip get Capacity, Speed, Manufacturer, PartNumber, SerialNumber, FormFactor, MemoryType, "
+             "ConfiguredClockSpeed /Value"] = _wmic(
+        {'Capacity': 34359738368, 'ConfiguredClockSpeed': 4800, 'FormFactor': 8, 'Manufacturer': "Samsung",
+         'MemoryType': 0, 'PartNumber': "M321R4GA3BB6-CQKET  ", 'SerialNumber': f"{0x8A1B2000 + dimm:08X}",
+         'Speed': 4800} for dimm in range(32))
+    commands["wmic pagefile get AllocatedBaseSize, CurrentUsage, Name /Value"] = _wmic(
+        [{'AllocatedBaseSize': 65536, 'CurrentUsage': 1024, 'Name': "C:\\pagefile.sys"}])
+    commands["wmic diskdrive get Caption,Size, InterfaceType, MediaType, Model, SerialNumber, Partitions, Index, "
+             "FirmwareRevision, BytesPerSector, SectorsPerTrack, TotalCylinders, TotalSectors, TotalTracks /Value"] = _wmic(
+        {'BytesPerSector': 512, 'Caption': f"SAMSUNG MZQL27T6HBLA-00A07 #{disk}", 'FirmwareRevision': "GDC5902Q",
+         'Index': disk, 'InterfaceType': "SCSI", 'MediaType': "Fixed hard disk media",
+         'Model': "SAMSUNG MZQL27T6HBLA-00A07", 'Partitions': 1 + disk % 3,
+         'SerialNumber': f"S6CKNT0W{600000 + disk}", 'SectorsPerTrack': 63, 'Size': 7681501126656,
+         'TotalCylinders': 933896, 'TotalSectors': 15002931888, 'TotalTracks': 238143480} for disk in range(24))
+    commands["wmic diskdrive get Status, Availability, ErrorDescription /Value"] = _wmic(
+        {'Availability': "", 'ErrorDescription': "", 'Status': "OK"} for disk in range(24))
+    commands["wmic path win32_VideoController get Name, AdapterRAM, DriverVersion, DriverDate, Status, AdapterDACType, "
+             "MaxRefreshRate, MinRefreshRate, InstalledDisplayDrivers, VideoModeDescription, VideoProcessor /Value"] = _wmic(
+        {'AdapterDACType': "Integrated RAMDAC", 'AdapterRAM': 4293918720, 'DriverDate': "20240110000000.000000-000",
+         'DriverVersion': "31.0.15.4633", 'InstalledDisplayDrivers': "C:\\Windows\\System32\\DriverStore\\nvldumdx.dll",
+         'MaxRefreshRate': 240, 'MinRefreshRate': 50, 'Name': "NVIDIA RTX 6000 Ada Generation", 'Status': "OK",
+         'VideoModeDescription': "3840 x 2160 x 4294967296 colors", 'VideoProcessor': "NVIDIA RTX 6000 Ada Generation"}
+        for gpu in range(4))
+    commands["wmic baseboard get Manufacturer, Product, SerialNumber, Version, HostingBoard, PoweredOn, Removable, "
+             "Replaceable /Value"] = _wmic(
+        [{'HostingBoard': "TRUE", 'Manufacturer': "ASUSTeK COMPUTER INC.", 'PoweredOn': "TRUE",
+          'Product': "Pro WS W790E-SAGE SE", 'Removable': "FALSE", 'Replaceable': "TRUE",
+          'SerialNumber': "230512345678901", 'Version': "Rev 1.xx"}])
+
+    lines = ["", "Windows IP Configuration", "",
+             "   Host Name . . . . . . . . . . . . : WS-RENDER-01",
+             "   Primary Dns Suffix  . . . . . . . : corp.example.com",
+             "   Node Type . . . . . . . . . . . . : Hybrid",
+             "   IP Routing Enabled. . . . . . . . : No", ""]
+    for adapter in range(50):
+        kind = "Ethernet adapter" if adapter % 5 else "Wireless LAN adapter"
+        lines += [f"{kind} Ethernet {adapter}:", "",
+                  "   Connection-specific DNS Suffix  . : corp.example.com",
+                  f"   Description . . . . . . . . . . . : Intel(R) Ethernet Controller X710 #{adapter}",
+                  f"   Physical Address. . . . . . . . . : 3C-FD-FE-{adapter:02X}-1A-2B",
+                  "   DHCP Enabled. . . . . . . . . . . : Yes",
+                  "   Autoconfiguration Enabled . . . . : Yes",
+                  f"   Link-local IPv6 Address . . . . . : fe80::1c2d:{adapter:x}%{adapter + 4}(Preferred) ",
+                  f"   IPv4 Address. . . . . . . . . . . : 10.{adapter}.0.15(Preferred) ",
+                  "   Subnet Mask . . . . . . . . . . . : 255.255.255.0",
+                  "   Lease Obtained. . . . . . . . . . : Monday, January 8, 2024 9:15:02 AM",
+                  "   Lease Expires . . . . . . . . . . : Tuesday, January 9, 2024 9:15:02 AM",
+                  f"   Default Gateway . . . . . . . . . : 10.{adapter}.0.1",
+                  f"   DHCP Server . . . . . . . . . . . : 10.{adapter}.0.1",
+                  "   DNS Servers . . . . . . . . . . . : 10.0.0.2",
+                  "                                       10.0.0.3",
+                  "   NetBIOS over Tcpip. . . . . . . . : Enabled", ""]
+    commands["ipconfig /all"] = "\r\n".join(lines)
+    commands["wmic process get ProcessId, ParentProcessId, Name, ThreadCount, WorkingSetSize, VirtualSize, "
+             "ReadTransferCount, WriteTransferCount, KernelModeTime, UserModeTime, CreationDate /Value"] = _wmic(
+        {'CreationDate': f"20240108{9 + pid % 8:02d}1502.123456+060", 'KernelModeTime': str(pid * 15625),
+         'Name': f"render{pid}.exe", 'ParentProcessId': str(pid // 2), 'ProcessId': str(pid),
+         'ReadTransferCount': str(pid * 4096), 'ThreadCount': str(pid % 64 + 1), 'UserModeTime': str(pid * 31250),
+         'VirtualSize': str(2199023255552 + pid), 'WorkingSetSize': str(pid * 65536),
+         'WriteTransferCount': str(pid * 512)}
+        for pid in range(4, 20004, 4))
+    return fixtures
+
+
+def darwin_large(num_interfaces=500):
+    """A macOS host with hundreds of network interfaces and filesystems, and 5,000 processes."""
+    fixtures = {'commands': {}, 'files': {}, 'registry': {}, 'statvfs': {}}
+    commands = fixtures['commands']
+    for name, value in (("machdep.cpu.brand_string", "Apple M2 Ultra"), ("hw.cpufrequency", "3504000000"),
+                        ("hw.ncpu", "24"), ("hw.logicalcpu", "24"), ("hw.l1dcachesize", "65536"),
+                        ("hw.l1icachesize", "131072"), ("hw.l2cachesize", "4194304"), ("hw.l3cachesize", "0"),
+                        ("hw.memsize", "206158430208")):
+        commands[f"sysctl -n {name}"] = value + "\n"
+    commands["pagesize"] = "16384\n"
+    commands["vm_stat"] = (
+        "Mach Virtual Memory Statistics: (page size of 16384 bytes)\n"
+        "Pages free:                              812345.\n"
+        "Pages active:                           4567890.\n"
+        "Pages inactive:                         4456789.\n"
+        "Pages speculative:                        12345.\n"
+        "Pages throttled:                              0.\n"
+        "Pages wired down:                        987654.\n"
+        "Pages purgeable:                          23456.\n"
+        "\"Translation faults\":                 987654321.\n"
+        "Pages copy-on-write:                   12345678.\n"
+        "Pages zero filled:                    456789012.\n"
+        "Pages reactivated:                      1234567.\n"
+        "Pages purged:                            234567.\n"
+        "File-backed pages:                      3456789.\n"
+        "Anonymous pages:                        5567890.\n"
+        "Pages stored in compressor:              123456.\n"
+        "Pages occupied by compressor:             45678.\n"
+        "Decompressions:                          345678.\n"
+        "Compressions:                            456789.\n"
+        "Pageins:                                5678901.\n"
+        "Pageouts:                                 12345.\n"
+        "Swapins:                                      0.\n"
+        "Swapouts:                                     0.\n"
+    )
+    df = ["Filesystem       Size   Used  Avail Capacity iused      ifree %iused  Mounted on"]
+    for i in range(200):
+        device = f"/dev/disk{i // 4 + 3}s{i % 4 + 1}"
+        df.append(f"{device}  7.3Ti  1.2Ti  6.0Ti    17%  2345678 64012345678    0%   /Volumes/Data{i}")
+        fixtures['commands'][f"sudo -n udevadm info --name={device}"] = ""
+    commands["df -h"] = "\n".join(df) + "\n"
+
+    commands["ip route get 1"] = "1.0.0.0 via 10.0.0.1 dev en0 src 10.0.0.15 uid 501\n    cache\n"
+    addr = []
+    o4 = []
+    for index in range(num_interfaces):
+        name = "lo0" if index == 0 else f"en{index - 1}" if index < 8 else f"vlan{index}"
+        kind = "loopback" if index == 0 else "ether"
+        mac = "00:00:00:00:00:00" if index == 0 else f"3c:22:fb:{index >> 8:02x}:{index & 0xff:02x}:1e"
+        ip = "127.0.0.1" if index == 0 else f"10.{index >> 8}.{index & 0xff}.15"
+        addr += [f"{index + 1}: {name}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 9000 qdisc mq state UP group default qlen 1000",
+                 f"    link/{kind} {mac} brd ff:ff:ff:ff:ff:ff",
+                 f"    inet {ip}/24 brd 10.{index >> 8}.{index & 0xff}.255 scope global {name}",
+                 "       valid_lft forever preferred_lft forever",
+                 f"    inet6 fe80::3e22:fbff:fe{index >> 8:02x}:{index & 0xff:02x}1e/64 scope link",
+                 "       valid_lft forever preferred_lft forever"]
+        o4.append(f"{index + 1}: {name}    inet {ip}/24 brd 10.{index >> 8}.{index & 0xff}.255 scope global {name}"
+                  "\\       valid_lft forever preferred_lft forever")
+    commands["ip addr show"] = "\n".join(addr) + "\n"
+    commands["ip -o -4 a show"] = "\n".join(o4) + "\n"
+    commands["ip route"] = "default via 10.0.0.1 dev en0 proto dhcp metric 100\n" + "".join(
+        f"10.{i >> 8}.{i & 0xff}.0/24 dev vlan{i} proto kernel scope link src 10.{i >> 8}.{i & 0xff}.15\n"
+        for i in range(8, num_interfaces))
+    commands["resolvectl status"] = ("Global\n       Protocols: +LLMNR +mDNS -DNSOverTLS DNSSEC=no/unsupported\n"
+                                     "Current DNS Server: 10.0.0.2\n       DNS Servers: 10.0.0.2 10.0.0.3\n")
+    commands["system_profiler SPDisplaysDataType"] = (
+        "Graphics/Displays:\n\n    Apple M2 Ultra:\n\n      Chipset Model: Apple M2 Ultra\n      Type: GPU\n"
+        "      Bus: Built-In\n      Total Number of Cores: 76\n      Vendor: Apple (0x106b)\n"
+        "      Metal Support: Metal 3\n      Displays:\n        Pro Display XDR:\n"
+        "          Resolution: 6016 x 3384 Retina\n          Main Display: Yes\n")
+    commands["system_profiler SPHardwareDataType"] = (
+        "Hardware:\n\n    Hardware Overview:\n\n      Model Name: Mac Studio\n      Model Identifier: Mac14,14\n"
+        "      Model Number: Z17Z000LJLL/A\n      Chip: Apple M2 Ultra\n      Total Number of Cores: 24\n"
+        "      Memory: 192 GB\n      System Firmware Version: 10151.41.12\n"
+        "      Serial Number (system): C02XYZ123ABC\n      Hardware UUID: 00000000-0000-0000-0000-000000000000\n")
+    commands["diskutil info /"] = ("   Device Identifier:         disk3s1s1\n"
+                                   "   Volume Name:               Macintosh HD\n"
+                                   "   Mounted:                   Yes\n")
+    commands["ps -axo pid=,ppid=,state=,pcpu=,rss=,vsz=,user=,comm="] = "".join(
+        f"{pid:>5} {pid // 2:>5} {'RSUI'[pid % 4]}s   {pid % 97 / 10:4.1f} {pid * 16:>8} {pid * 64 + 400000000:>10} "
+        f"{'root' if pid % 3 else 'builder'} /Applications/Worker {pid}.app/Contents/MacOS/worker{pid}\n"
+        for pid in range(1, 5001))
+    return fixtures
+
+
+# Fixture set name -> (system the set belongs to, builder).
+FIXTURE_SETS = {
+    'linux-large': ('Linux', linux_large),
+    'windows-large': ('Windows', windows_large),
+    'darwin-large': ('Darwin', darwin_large),
+}
@@ -0,0 +1,51 @@
+"""Cross-platform PC hardware and software inventory, using only the standard library.
+
+    >>> import pc_info
+    >>> info = pc_info.collect(sections=['cpu', 'memory'])
+    >>> pc_info.print_pc_info(info)
+
+Importing the package is cheap: the public names below are resolved on first use,
+and the platform backend (Windows registry/wmic, macOS sysctl/system_profiler or
+Linux procfs/sysfs) is only imported when a section is first collected.
+"""
+import importlib
+
+# Public name -> submodule that defines it, or (submodule, name there) when the names differ.
+_EXPORTS = {
+    'collect': 'core',
+    'iter_collect': 'core',
+    'get_pc_info': 'core',
+    'run_collectors': 'core',
+    'SECTIONS': 'core',
+    'DEFAULT_TIMEOUT': 'core',
+    'print_pc_info': 'report',
+    'print_sample': 'report',
+    'to_json': 'formats',
+    'to_msgpack': 'formats',
+    'iter_ndjson': 'formats',
+    'collect_only': 'lazy',
+    'LazyInfo': 'lazy',
+    'collect_fleet': 'fleet',
+    'apply_delta': 'diff',
+    'SnapshotStore': 'diff',
+    'watch_samples': ('watch', 'watch'),  # not 'watch': that is the submodule's name
+    'Exporter': 'exporter',
+    'History': 'history',
+    'default_cache_path': 'cache',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = module if isinstance(module, tuple) else (module, name)
+    value = getattr(importlib.import_module(f".{module}", __name__), attribute)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
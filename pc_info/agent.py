@@ -0,0 +1,48 @@
+"""Agent mode: serves collection requests as JSON lines on stdin/stdout (`python -m pc_info --agent`).
+
+The fleet runner (see fleet.py) starts one agent per host and keeps it running, so
+every later collection on that host reuses the same interpreter and connection.
+
+    -> {"agent": "pc_info", "protocol": 1, "hostname": ...}           once, on start
+    <- {"id": 1, "sections": ["cpu", "memory"], "timeout": 60}         a request (also "deadline", "probe_timeout")
+    -> {"id": 1, "section": "memory", "data": {...}}                   as each section finishes
+    -> {"id": 1, "done": true}                                         after the last one
+    -> {"id": 1, "error": "..."}                                       instead, for a bad request
+
+The agent exits when stdin is closed.
+"""
+import json
+import socket
+import sys
+
+PROTOCOL = 1
+
+
+def _send(stdout, message):
+    stdout.write(json.dumps(message, separators=(",", ":"), default=str).encode() + b"\n")
+    stdout.flush()
+
+
+def serve(stdin=None, stdout=None):
+    """Answers requests from `stdin` until it is closed (binary streams; default: this process's)."""
+    from .core import DEFAULT_TIMEOUT, PROBE_TIMEOUT, iter_collect
+
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    _send(stdout, {'agent': 'pc_info', 'protocol': PROTOCOL, 'hostname': socket.gethostname()})
+    for line in iter(stdin.readline, b""):
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            pairs = iter_collect(request.get('sections'), max_workers=request.get('workers'),
+                                 timeout=request.get('timeout', DEFAULT_TIMEOUT), timings=request.get('timings', False),
+                                 deadline=request.get('deadline'), probe_timeout=request.get('probe_timeout', PROBE_TIMEOUT))
+            for section, data in pairs:
+                _send(stdout, {'id': request_id, 'section': section, 'data': data})
+        except Exception as e:
+            _send(stdout, {'id': request_id, 'error': str(e)})
+            continue
+        _send(stdout, {'id': request_id, 'done': True})
@@ -0,0 +1,116 @@
+"""Linux block devices from sysfs and the udev database, without running any command.
+
+Everything `sudo udevadm info` used to tell us per mount (and a bit more) is already
+exported by the kernel under /sys/block and by udev under /run/udev/data, readable
+without root. Devices are enumerated once; the per-disk details are only read for
+disks that actually back a mount.
+"""
+from . import probes
+from .common import read_sysfs
+
+
+def block_devices():
+    """Returns {'major:minor': (name, disk)} for every disk and partition in /sys/block.
+
+    `disk` is the whole-disk name a partition lives on (the device's own name for a disk).
+    """
+    devices = {}
+    try:
+        disks = probes.listdir("/sys/block")
+    except OSError:
+        return devices
+    for disk in disks:
+        dev = read_sysfs(f"/sys/block/{disk}/dev")
+        if dev:
+            devices[dev] = (disk, disk)
+        try:
+            entries = probes.listdir(f"/sys/block/{disk}")
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.startswith(disk):  # partitions show up as sda1, nvme0n1p1, ...
+                dev = read_sysfs(f"/sys/block/{disk}/{entry}/dev")
+                if dev:
+                    devices[dev] = (entry, disk)
+    return devices
+
+
+def udev_properties(dev):
+    """Returns the E: properties udev stored for block device `dev` ('major:minor')."""
+    properties = {}
+    try:
+        data = probes.read_file(f"/run/udev/data/b{dev}")
+    except OSError:
+        return properties
+    for line in data.splitlines():
+        if line.startswith("E:"):
+            key, _, value = line[2:].partition("=")
+            properties[key] = value
+    return properties
+
+
+def disk_properties(disk):
+    """Model, serial, media type, sector size and queue depth of a whole disk, from sysfs."""
+    base = f"/sys/block/{disk}"
+    properties = {
+        'model': read_sysfs(f"{base}/device/model"),
+        'serial_number': read_sysfs(f"{base}/device/serial") or read_sysfs(f"{base}/device/wwid"),
+    }
+    rotational = read_sysfs(f"{base}/queue/rotational")
+    if rotational in ("0", "1"):
+        properties['media_type'] = "HDD" if rotational == "1" else "SSD"
+    sector_size = read_sysfs(f"{base}/queue/logical_block_size")
+    if sector_size and sector_size.isdigit():
+        properties['bytes_per_sector'] = int(sector_size)
+    # SCSI/SATA report the device's tag depth; NVMe and virtio only have the block layer's request queue.
+    queue_depth = read_sysfs(f"{base}/device/queue_depth") or read_sysfs(f"{base}/queue/nr_requests")
+    if queue_depth and queue_depth.isdigit():
+        properties['queue_depth'] = int(queue_depth)
+    return properties
+
+
+def _device_details(dev, name, disk, disk_dev):
+    """Everything known about one block device: the disk's sysfs facts overlaid with udev's."""
+    details = disk_properties(disk)
+    udev = udev_properties(dev)
+    if not udev.get('ID_SERIAL') and disk_dev and disk_dev != dev:
+        udev = udev_properties(disk_dev)
+    # ID_SERIAL is what `udevadm info` reported, so it wins whenever udev knows the device.
+    details['serial_number'] = udev.get('ID_SERIAL') or details['serial_number'] or "N/A"
+    details['model'] = details['model'] or udev.get('ID_MODEL', "").replace("_", " ") or "Unknown"
+    if udev.get('ID_BUS'):
+        details['interface'] = udev['ID_BUS']
+    details['device'] = f"/dev/{name}"
+    return details
+
+
+def describe_mounts(mounts):
+    """Adds block device details to [(source, mount_point, size_bytes, dev)] mounts.
+
+    Returns one dict per mount with the source, mount point and size, plus the
+    device name, model, serial number, interface, media type, sector size and
+    queue depth when the mount is backed by a block device. Mounts are matched by
+    the major:minor from mountinfo, falling back to the source path (btrfs reports
+    an anonymous major:minor).
+    """
+    devices = block_devices()
+    by_path = {f"/dev/{name}": dev for dev, (name, _) in devices.items()}
+    for dev, (name, _) in devices.items():
+        if name.startswith("dm-"):
+            mapper_name = read_sysfs(f"/sys/block/{name}/dm/name")
+            if mapper_name:
+                by_path[f"/dev/mapper/{mapper_name}"] = dev
+
+    details = {}  # dev -> details, so each device is only read once
+    described = []
+    for source, mount_point, size_bytes, dev in mounts:
+        if dev not in devices:
+            dev = by_path.get(source)
+        info = {'name': source, 'mount_point': mount_point, 'size_bytes': size_bytes, 'serial_number': "N/A"}
+        if dev is not None:
+            if dev not in details:
+                name, disk = devices[dev]
+                details[dev] = _device_details(dev, name, disk, by_path.get(f"/dev/{disk}"))
+            info.update(details[dev])
+        described.append(info)
+    return described
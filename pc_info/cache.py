@@ -0,0 +1,207 @@
+"""Fact cache: reuse static and slow-changing facts across runs."""
+import hashlib
+import json
+import os
+import platform
+import time
+
+from .common import read_sysfs
+from .core import PROBE_TIMEOUT, backend, run_collectors
+
+CACHE_VERSION = 2
+
+# Seconds a cached fact of each class stays valid. Volatile facts are never cached.
+CACHE_TTLS = {'static': 7 * 24 * 3600, 'slow': 300, 'volatile': 0}
+
+# Class of each section, with overrides for individual fields of dict sections (and of
+# the records of list sections).
+FACT_CLASSES = {
+    'os': ('static', {}),
+    'cpu': ('static', {'current_clock_speed': 'volatile', 'current_clock_speeds': 'volatile',
+                       'context_switches': 'volatile', 'total_interrupts': 'volatile',
+                       'interrupts_per_cpu': 'volatile'}),
+    'memory': ('static', {'free_gb': 'volatile', 'available_gb': 'volatile', 'used_gb': 'volatile',
+                          'buffers_gb': 'volatile', 'cached_gb': 'volatile', 'swap_total_gb': 'volatile',
+                          'swap_free_gb': 'volatile', 'free_bytes': 'volatile', 'available_bytes': 'volatile',
+                          'used_bytes': 'volatile', 'buffers_bytes': 'volatile', 'cached_bytes': 'volatile',
+                          'swap_total_bytes': 'volatile', 'swap_free_bytes': 'volatile', 'vmstat': 'volatile', 'numa': 'volatile', 'hugepages': 'volatile',
+                          'vm_free_gb': 'volatile', 'vm_active_gb': 'volatile', 'vm_inactive_gb': 'volatile',
+                          'vm_wired_gb': 'volatile', 'virtual_memory': 'volatile', 'pagefiles': 'slow'}),
+    'disks': ('slow', {'io': 'volatile'}),
+    'network': ('volatile', {'traffic': 'volatile'}),  # traffic: named so change tracking skips it
+    'gpu': ('static', {}),
+    'motherboard': ('static', {}),
+    'processes': ('volatile', {}),
+}
+
+# Cheap probes of just the volatile fields of a section, so a cached section can be
+# served without running its full collector. Sections with volatile fields and no
+# refresher on this platform are always collected in full.
+VOLATILE_REFRESHERS = {
+    ('Linux', 'cpu'): 'get_cpu_volatile',
+    ('Linux', 'memory'): 'get_memory_volatile',
+    ('Linux', 'disks'): 'get_disk_io',
+}
+
+# List sections whose refresher returns {key: fields} rather than a dict of fields:
+# the record field the refreshed fields are joined on.
+RECORD_JOINS = {'disks': 'device'}
+
+
+def _fact_class(section, field=None):
+    default, overrides = FACT_CLASSES.get(section, ('volatile', {}))
+    return overrides.get(field, default)
+
+
+def default_cache_path():
+    """Per-user cache file location."""
+    if platform.system() == "Windows":
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser("~")
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pc-info", "facts.json")
+
+
+def _boot_id():
+    """Changes on every boot (Linux); None elsewhere, where only the TTLs apply."""
+    return read_sysfs("/proc/sys/kernel/random/boot_id")
+
+
+def _hardware_signature():
+    """Digest that changes when PCI or block devices come or go, or the CPU set changes.
+
+    The effective user is folded in as well, since what a collector can see (dmidecode,
+    udevadm) depends on its privileges.
+    """
+    digest = hashlib.sha1()
+    digest.update(str(os.geteuid() if hasattr(os, 'geteuid') else "").encode())
+    for path in ("/sys/bus/pci/devices", "/sys/block"):
+        try:
+            names = sorted(name for name in os.listdir(path) if not name.startswith(("loop", "ram")))
+        except OSError:
+            continue
+        digest.update(f"{path}:{','.join(names)}".encode())
+    digest.update(str(read_sysfs("/sys/devices/system/cpu/online")).encode())
+    return digest.hexdigest()
+
+
+def _load_cache(path, boot_id, signature):
+    """Returns the cached sections, or {} if the file is missing, stale or for another boot."""
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (cache.get('version') != CACHE_VERSION or cache.get('boot_id') != boot_id
+            or cache.get('hardware_signature') != signature):
+        return {}
+    return cache.get('sections', {})
+
+
+def _save_cache(path, sections, boot_id, signature):
+    cache = {'version': CACHE_VERSION, 'boot_id': boot_id, 'hardware_signature': signature, 'sections': sections}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)  # atomic, so concurrent runs never see a torn file
+    except OSError:
+        pass #caching is best effort
+
+
+def _is_error(value):
+    return isinstance(value, str) and value.startswith(("Error", "Unable"))
+
+
+def _cache_entry(section, value, now):
+    """Builds the cache entry for a freshly collected section, or None if nothing is cacheable."""
+    stripped = False
+    if isinstance(value, dict):
+        if any(_is_error(v) for v in value.values()):
+            return None  #don't pin a failure (e.g. dmidecode without root) for the whole TTL
+        kept = {k: v for k, v in value.items() if _fact_class(section, k) != 'volatile'}
+        classes = {_fact_class(section, k) for k in kept}
+        keys = list(value)
+    else:
+        if _is_error(value) or (isinstance(value, list) and any(_is_error(v) for v in value)):
+            return None
+        kept, classes, keys = value, {_fact_class(section)}, None
+        if isinstance(value, list):  # records: leave out their volatile fields, the entry says it did
+            kept = [{k: v for k, v in record.items() if _fact_class(section, k) != 'volatile'}
+                    if isinstance(record, dict) else record for record in value]
+            stripped = kept != value
+    ttl = min((CACHE_TTLS[c] for c in classes), default=0)
+    if not kept or ttl <= 0:
+        return None
+    entry = {'collected_at': now, 'ttl': ttl, 'keys': keys, 'value': kept}
+    if stripped:
+        entry['stripped'] = True
+    return entry
+
+
+def collect_cached(collectors, cache_path, max_workers, timeout, refresh, deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Like core.run_collectors, but serves still-valid cached sections and only refreshes their volatile fields."""
+    system = platform.system()
+    boot_id, signature = _boot_id(), _hardware_signature()
+    sections = {} if refresh else _load_cache(cache_path, boot_id, signature)
+    now = time.time()
+
+    served = {}
+    plan = []
+    for name, collector, error_value in collectors:
+        entry = sections.get(name)
+        if entry and now - entry['collected_at'] < entry['ttl']:
+            volatile_keys = [k for k in entry['keys'] or [] if k not in entry['value']]
+            refresher = VOLATILE_REFRESHERS.get((system, name))
+            if not volatile_keys and not entry.get('stripped'):
+                served[name] = entry
+                continue
+            if refresher:
+                served[name] = entry
+                plan.append((name, getattr(backend(system), refresher), error_value))
+                continue
+        plan.append((name, collector, error_value))
+
+    results = run_collectors(plan, max_workers=max_workers, timeout=timeout, deadline=deadline,
+                             probe_timeout=probe_timeout) if plan else {}
+
+    info = {}
+    changed = False
+    for name, _, _ in collectors:
+        entry = served.get(name)
+        if entry is None:
+            info[name] = results[name]
+            entry = _cache_entry(name, results[name], now)
+            if entry:
+                sections[name] = entry
+                changed = True
+        elif entry['keys'] is not None:
+            merged = dict(entry['value'])
+            fresh = results.get(name)
+            failure = (fresh if not isinstance(fresh, dict)
+                       else next((value for value in fresh.values() if _is_error(value)), None))
+            if failure is None:
+                merged.update(fresh)
+            else:  # the refresher failed or timed out: keep the cached facts, flag the volatile ones
+                error = failure if _is_error(failure) else f"Error refreshing volatile fields: {failure!r}"
+                merged.update(dict.fromkeys((k for k in entry['keys'] if k not in entry['value']), error))
+            info[name] = {k: merged[k] for k in entry['keys'] if k in merged}
+        elif entry.get('stripped'):
+            fresh, join = results.get(name), RECORD_JOINS.get(name)
+            items = fresh if isinstance(fresh, list) else fresh.values() if isinstance(fresh, dict) else [fresh]
+            failure = None if isinstance(fresh, dict) else fresh
+            failure = next((item for item in items if _is_error(item)), failure)
+            if failure is not None:  # as for dict sections: the records' volatile fields carry the error
+                error = failure if _is_error(failure) else f"Error refreshing volatile fields: {failure!r}"
+                volatile = [k for k, c in FACT_CLASSES[name][1].items() if c == 'volatile']
+                fresh = {record.get(join): dict.fromkeys(volatile, error)
+                         for record in entry['value'] if isinstance(record, dict) and record.get(join) is not None}
+            info[name] = [dict(record, **fresh.get(record.get(join), {})) if isinstance(record, dict) else record
+                          for record in entry['value']]
+        else:
+            info[name] = entry['value']
+
+    if changed:
+        _save_cache(cache_path, sections, boot_id, signature)
+    return info
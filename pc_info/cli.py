@@ -0,0 +1,319 @@
+"""Command-line interface (python -m pc_info, or the pc-info.py script)."""
+import argparse
+import json
+import platform
+import sys
+
+from .cache import default_cache_path
+from .core import DEFAULT_TIMEOUT, PROBE_TIMEOUT, SECTIONS, iter_collect
+from .formats import FORMATS, to_json, to_msgpack
+from .report import print_changes, print_pc_info, print_sample, print_timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gathers and displays information about this PC.")
+    parser.add_argument('--sections', metavar='NAMES',
+                        help=f"comma-separated sections to collect (default: all of {','.join(SECTIONS)})")
+    parser.add_argument('--only', metavar='PATHS',
+                        help="comma-separated sections or section.field paths (e.g. network.ip_address,memory.total_gb) "
+                             "to collect and print; only the probes they need are run")
+    parser.add_argument('--interfaces', metavar='PATTERNS',
+                        help="comma-separated globs of the network interfaces to list and count, '!' to "
+                             "exclude (e.g. 'eth*,bond*' or '!veth*,!cali*'; Linux, default: all)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of collector threads (default: one per section)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds each section may take before it is reported as timed out (default: {DEFAULT_TIMEOUT}, 0 disables)")
+    parser.add_argument('--deadline', type=float, default=None,
+                        help="seconds the whole scan may take; commands still running then are killed and "
+                             "the sections report what they had (default: none)")
+    parser.add_argument('--probe-timeout', type=float, default=PROBE_TIMEOUT,
+                        help=f"seconds a single command may run before it is killed (default: {PROBE_TIMEOUT}, 0 disables)")
+    parser.add_argument('--watch', type=float, metavar='INTERVAL',
+                        help="keep running and print per-second rates every INTERVAL seconds (Linux only)")
+    parser.add_argument('--count', type=int, default=None,
+                        help="with --watch, stop after this many samples")
+    parser.add_argument('--cache', action='store_true',
+                        help="reuse static and slow-changing facts from earlier runs")
+    parser.add_argument('--cache-file', metavar='PATH',
+                        help=f"cache file to use (implies --cache, default: {default_cache_path()})")
+    parser.add_argument('--refresh', action='store_true',
+                        help="with --cache, probe everything again and rewrite the cache")
+    parser.add_argument('--format', choices=FORMATS, default='text',
+                        help="text report (default), compact JSON, NDJSON with one line per section as it "
+                             "finishes, or MessagePack (one map per section) on stdout")
+    parser.add_argument('--timings', action='store_true',
+                        help="time every command and file probe and print the slowest after the report "
+                             "(other formats include them as a '_meta' record)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="write the probe timings to FILE as Chrome trace-event JSON (implies timing)")
+    parser.add_argument('--changes', action='store_true',
+                        help="print only what changed since the last --changes run, and keep this run as "
+                             "the new snapshot (other formats write the delta)")
+    parser.add_argument('--snapshot-dir', metavar='DIR',
+                        help="snapshot store for --changes (implies --changes, default: a 'snapshots' "
+                             "directory next to the cache file)")
+    parser.add_argument('--history', action='store_true',
+                        help="append this run's volatile metrics (or every --watch sample) to the history store")
+    parser.add_argument('--history-dir', metavar='DIR',
+                        help="history store to use (implies --history, default: a 'history' directory next "
+                             "to the cache file)")
+    parser.add_argument('--query', metavar='METRICS',
+                        help="print the stored history of these comma-separated metrics ('list' to see "
+                             "them) instead of collecting")
+    parser.add_argument('--since', type=float, default=3600,
+                        help="with --query, how many seconds back to go (default: 3600)")
+    parser.add_argument('--step', type=float, default=None,
+                        help="with --query, aggregate into buckets of this many seconds (min/max/avg)")
+    parser.add_argument('--serve', metavar='[HOST:]PORT',
+                        help="run an HTTP exporter serving the facts as OpenMetrics under /metrics "
+                             "(recollected in the background, through the fact cache)")
+    parser.add_argument('--serve-interval', type=float, default=None, metavar='SECONDS',
+                        help="with --serve, seconds between collections (default: 15)")
+    parser.add_argument('--fleet', metavar='INVENTORY',
+                        help="collect from every host listed in INVENTORY (one per line, '-' for stdin) "
+                             "instead of this PC")
+    parser.add_argument('--transport', choices=('ssh', 'local'), default='ssh',
+                        help="with --fleet, how to reach the hosts: ssh (default) or local, which runs "
+                             "each 'host' as a local subprocess (for testing)")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="with --fleet, hosts to collect from at once (default: 32)")
+    parser.add_argument('--agent', action='store_true', help=argparse.SUPPRESS)  # started by --fleet
+    args = parser.parse_args(argv)
+
+    if args.agent:
+        from .agent import serve
+        serve()
+        return
+
+    if args.interfaces:
+        from .netstats import set_interface_filter
+        set_interface_filter(args.interfaces)
+
+    history = None
+    if args.history or args.history_dir or args.query:
+        from .history import History
+        history = History(args.history_dir)
+    if args.query:
+        _query_history(args, history)
+        return
+
+    if args.watch:
+        if platform.system() != "Linux":
+            parser.error("--watch is only supported on Linux")
+        from .watch import watch
+        try:
+            for sample in watch(args.watch, args.count):
+                if history is not None:
+                    from .history import sample_metrics
+                    history.append(sample_metrics(sample), sample['timestamp'])
+                if args.format == 'text':
+                    print_sample(sample)
+                else:
+                    _write(args.format, sample)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.serve:
+        _serve(args, parser)
+        return
+
+    if args.only:
+        if args.sections or args.fleet or args.changes or args.snapshot_dir or args.cache or args.cache_file:
+            parser.error("--only can't be combined with --sections, --fleet, --changes or --cache")
+        _only(args, parser)
+        return
+
+    sections = [name.strip() for name in args.sections.split(",") if name.strip()] if args.sections else None
+    store = None
+    if args.changes or args.snapshot_dir:
+        if args.sections:
+            parser.error("--changes compares whole reports; it can't be combined with --sections")
+        from .diff import SnapshotStore
+        store = SnapshotStore(args.snapshot_dir)
+    if args.fleet:
+        _fleet(args, sections, store)
+        return
+    cache_path = args.cache_file or (default_cache_path() if args.cache else None)
+    pairs = iter_collect(sections, max_workers=args.workers, timeout=args.timeout or None,
+                         cache_path=cache_path, refresh=args.refresh, timings=args.timings or bool(args.trace),
+                         deadline=args.deadline, probe_timeout=args.probe_timeout or None)
+    pc_info = {}
+    try:
+        for section, data in pairs:
+            pc_info[section] = data
+            if args.format in ('ndjson', 'msgpack') and store is None:
+                _write(args.format, {'section': section, 'data': data})  # stream it as soon as it's ready
+    except ValueError as e:
+        parser.error(str(e))
+
+    if history is not None:
+        from .history import info_metrics
+        history.append(info_metrics(pc_info))
+    if store is not None:
+        _report_changes(args, store, platform.node(), pc_info)
+        return
+
+    if args.format == 'text':
+        print_pc_info({name: pc_info[name] for name in SECTIONS if name in pc_info})
+    elif args.format == 'json':
+        _write('json', dict(sorted(pc_info.items(), key=lambda item: _report_order(item[0]))))
+
+    if '_meta' in pc_info:
+        timings = pc_info['_meta']['timings']
+        if args.timings and args.format == 'text':
+            print()
+            print_timings(timings)
+        if args.trace:
+            from .probes import chrome_trace
+            with open(args.trace, "w") as f:
+                json.dump(chrome_trace(timings), f)
+
+
+def _fleet(args, sections, store=None):
+    """--fleet: streams {host, section, data} records (ndjson/msgpack) or prints the merged dataset.
+
+    With a snapshot store, each host's changes are reported instead, once the host has
+    answered (hosts that couldn't be reached are left out of the store).
+    """
+    import asyncio
+    from .fleet import DEFAULT_CONCURRENCY, FleetPool, read_inventory
+
+    hosts = read_inventory(args.fleet)
+
+    async def run():
+        dataset = {host: {} for host in hosts}
+        async with FleetPool(hosts, args.transport, args.concurrency or DEFAULT_CONCURRENCY) as pool:
+            async for host, section, data in pool.stream(sections, args.timeout or None, args.timings):
+                if args.format in ('ndjson', 'msgpack') and store is None:
+                    _write(args.format, {'host': host, 'section': section, 'data': data})
+                if section is None:
+                    dataset[host] = data
+                else:
+                    dataset[host][section] = data
+        return dataset
+
+    dataset = asyncio.run(run())
+    if store is not None:
+        for host, info in dataset.items():
+            if isinstance(info, dict):
+                _report_changes(args, store, host, info, heading=True)
+            elif args.format == 'text':
+                print(f"===== {host} =====\n{info}\n")
+        return
+    if args.format == 'json':
+        _write('json', {host: dict(sorted(info.items(), key=lambda item: _report_order(item[0])))
+                        if isinstance(info, dict) else info for host, info in dataset.items()})
+    elif args.format == 'text':
+        for host, info in dataset.items():
+            print(f"===== {host} =====")
+            if isinstance(info, dict):
+                print_pc_info({name: info[name] for name in SECTIONS if name in info})
+                if args.timings and '_meta' in info:
+                    print()
+                    print_timings(info['_meta']['timings'])
+            else:
+                print(info)
+            print()
+
+
+def _serve(args, parser):
+    """--serve: runs the OpenMetrics exporter until interrupted."""
+    from .exporter import DEFAULT_INTERVAL, serve
+    host, _, port = args.serve.rpartition(":")
+    if not port.isdigit():
+        parser.error(f"--serve expects [HOST:]PORT, not {args.serve!r}")
+    sections = [name.strip() for name in args.sections.split(",") if name.strip()] if args.sections else None
+    try:
+        serve(host.strip("[]"), int(port), interval=args.serve_interval or DEFAULT_INTERVAL, sections=sections,
+              cache_path=args.cache_file or default_cache_path(), timeout=args.timeout or None,
+              probe_timeout=args.probe_timeout or None)
+    except ValueError as e:
+        parser.error(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+def _only(args, parser):
+    """--only: collects just the requested paths and prints one `path: value` line each (or the dict)."""
+    from .lazy import collect_only, parse_paths
+    paths = args.only.split(",")
+    try:
+        info = collect_only(paths, max_workers=args.workers, timeout=args.timeout or None, deadline=args.deadline,
+                            probe_timeout=args.probe_timeout or None)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.format != 'text':
+        _write(args.format, info)
+        return
+    for section, fields in parse_paths(paths).items():
+        if fields is None or not isinstance(info[section], dict):
+            value = info[section]
+            print(f"{section}: {value if isinstance(value, str) else to_json(value)}")
+            continue
+        for field in fields:
+            value = info[section][field]
+            print(f"{section}.{field}: {value if isinstance(value, (str, int, float)) else to_json(value)}")
+
+
+def _report_changes(args, store, host, info, heading=False):
+    """Records `info` as the latest snapshot of `host` and prints or writes what changed."""
+    from .diff import diff
+    previous = store.load(host)
+    delta = store.record(host, info)
+    if args.format != 'text':
+        _write(args.format, {'host': host, 'delta': delta} if delta is not None else {'host': host, 'snapshot': info})
+        return
+    if heading:
+        print(f"===== {host} =====")
+    if previous is None:
+        print(f"First snapshot of {host} stored; later runs with --changes report what changed.")
+    else:
+        print_changes(diff(previous, info))
+    if heading:
+        print()
+
+
+def _query_history(args, history):
+    """--query: prints stored metric values (or per-bucket min/max/avg with --step) from the last --since seconds."""
+    import time
+    if args.query == 'list':
+        for metric in history.metrics():
+            print(metric)
+        return
+    start = time.time() - args.since
+    for metric in (name.strip() for name in args.query.split(",") if name.strip()):
+        try:
+            if args.step:
+                rows = history.downsample(metric, args.step, start)
+            else:
+                rows = [{'time': t, 'value': v} for t, v in zip(*history.query(metric, start))]
+        except KeyError as e:
+            rows = f"Error: {e.args[0]}"
+        if args.format != 'text':
+            _write(args.format, {'metric': metric, 'rows': rows})
+            continue
+        print(f"----- {metric} -----")
+        if isinstance(rows, str):
+            print(f"  {rows}")
+        for row in rows if isinstance(rows, list) else []:
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row.get('start', row.get('time'))))
+            if 'value' in row:
+                print(f"  {when}  {row['value']}")
+            else:
+                print(f"  {when}  n={row['count']}  min={row['min']}  max={row['max']}  avg={round(row['avg'], 3)}")
+
+
+def _report_order(section):
+    return SECTIONS.index(section) if section in SECTIONS else len(SECTIONS)
+
+
+def _write(output_format, value):
+    """Writes one JSON document / NDJSON line / MessagePack object to stdout and flushes it."""
+    if output_format == 'msgpack':
+        sys.stdout.buffer.write(to_msgpack(value))
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(to_json(value) + "\n")  # json and ndjson alike: one document per line
+        sys.stdout.flush()
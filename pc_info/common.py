@@ -0,0 +1,47 @@
+"""Probes shared by every platform backend."""
+import platform
+import socket
+
+from . import probes
+
+
+def read_sysfs(path, default=None):
+    """Returns the stripped contents of a small procfs/sysfs file, or default if it can't be read."""
+    try:
+        return probes.read_file(path).strip()
+    except OSError:
+        return default
+
+
+def get_os_info():
+    """Collects operating system information."""
+
+    os_info = {}
+    os_info['system'] = platform.system()
+    os_info['version'] = platform.version()
+    os_info['release'] = platform.release()
+    os_info['architecture'] = platform.machine()
+    os_info['processor'] = platform.processor()
+    os_info['name'] = platform.node()
+    return os_info
+
+
+def host_names():
+    """Hostname and fully qualified domain name, the start of every network section."""
+    names = {}
+    names['hostname'] = socket.gethostname()  # Use socket for a more reliable hostname
+    try:
+        names['fqdn'] = socket.getfqdn()  # Fully qualified domain name if available
+    except:
+        names['fqdn'] = 'N/A'
+    return names
+
+
+def udevadm_serial(filesystem):
+    """Disk serial number from udev (requires sudo)."""
+    try:
+        # -n: fail rather than wait for a password nobody will type
+        serial_output = probes.run(["sudo", "-n", "udevadm", "info", f"--name={filesystem}"])
+        return serial_output.split("ID_SERIAL=")[1].split("\n")[0].strip() if "ID_SERIAL=" in serial_output else "N/A"
+    except:
+        return "N/A (requires sudo and correct disk name)" #if can't get disk info.
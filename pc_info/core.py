@@ -0,0 +1,174 @@
+"""Section registry and the concurrent collector scheduler."""
+import contextlib
+import importlib
+import platform
+import time
+
+from . import probes
+
+# Backend module per platform.system(); any other system takes the Linux path, as it always has.
+BACKENDS = {'Windows': 'windows', 'Darwin': 'darwin', 'Linux': 'linux'}
+
+# Section registry: (section, backend function, error_value) in report order.
+# error_value builds the placeholder stored for a section whose collector
+# crashed or ran past its timeout, shaped like that section's own error path.
+COLLECTORS = [
+    ('os', 'get_os_info', lambda e: {'system': platform.system(), 'version': e, 'release': e, 'architecture': e, 'name': e}),
+    ('cpu', 'get_cpu_info', lambda e: {'name': e}),
+    ('memory', 'get_memory_info', lambda e: {'total_gb': e, 'modules': e}),
+    ('disks', 'get_disk_info', lambda e: [e]),
+    ('network', 'get_network_info', lambda e: {'hostname': e, 'ip_address': e, 'mac_address': e}),
+    ('gpu', 'get_gpu_info', lambda e: {'gpus': [e]}),
+    ('motherboard', 'get_motherboard_info', lambda e: e),
+    ('processes', 'get_process_info', lambda e: e),
+]
+
+SECTIONS = tuple(name for name, _, _ in COLLECTORS)
+
+DEFAULT_TIMEOUT = 60  # seconds a single collector may run before it is abandoned
+PROBE_TIMEOUT = probes.PROBE_TIMEOUT  # seconds a single command may run before it is killed
+
+# Seconds a collector is given past its deadline, once its commands have been killed,
+# to hand back what it did collect before the whole section is reported as timed out.
+DEADLINE_GRACE = 0.5
+
+
+def backend(system=None):
+    """Returns the backend module for `system` (default: this host), importing it on first use."""
+    return importlib.import_module(f".{BACKENDS.get(system or platform.system(), 'linux')}", __package__)
+
+
+def collectors_for(sections=None, system=None):
+    """Resolves the requested sections to [(section, collector, error_value)] in report order."""
+    if sections is None:
+        sections = SECTIONS
+    unknown = [name for name in sections if name not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown section(s): {', '.join(unknown)} (choose from {', '.join(SECTIONS)})")
+    module = backend(system)
+    return [(name, getattr(module, function), error_value)
+            for name, function, error_value in COLLECTORS if name in sections]
+
+
+def _collector_deadline(start, timeout, run_deadline):
+    """When a collector that started at `start` must be done, or None for never."""
+    ends = [end for end in (start + timeout if timeout is not None else None, run_deadline) if end is not None]
+    return min(ends) if ends else None
+
+
+def _run_timed(collector, deadlines, name, timeout, run_deadline, probe_timeout, registry):
+    """Runs a collector under its deadline, recording it (the collector may have queued for a worker)."""
+    deadline = deadlines[name] = _collector_deadline(time.monotonic(), timeout, run_deadline)
+    with probes.section(name), probes.limits(deadline, probe_timeout), probes.sharing(registry):
+        return collector()
+
+
+def iter_collectors(collectors, max_workers=None, timeout=DEFAULT_TIMEOUT, deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Runs the collectors concurrently on a thread pool, yielding (section, result) as each finishes.
+
+    Each collector gets `timeout` seconds from the moment it starts running, and all of
+    them must be done `deadline` seconds after the call. Commands a collector runs are
+    killed at its deadline (or after `probe_timeout` seconds on their own), so it can
+    still return the rest of its section with those fields marked as timed out; one
+    that hasn't returned DEADLINE_GRACE seconds later is reported through its
+    error_value and left to finish in the background.
+
+    The collectors of one call share a probes.Registry: a file, command or parsed
+    view several of them need is fetched once for all of them.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    run_deadline = time.monotonic() + deadline if deadline is not None else None
+    deadlines = {}
+    registry = probes.active_registry() or probes.Registry()  # a collector running collectors joins its run
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(collectors) or 1)
+    try:
+        pending = {}
+        for name, collector, error_value in collectors:
+            future = executor.submit(_run_timed, collector, deadlines, name, timeout, run_deadline, probe_timeout,
+                                     registry)
+            pending[future] = (name, error_value)
+
+        def expiry(name):
+            end = deadlines[name] if name in deadlines else run_deadline  # queued ones still count against the run
+            return end + DEADLINE_GRACE if end is not None else None
+
+        while pending:
+            now = time.monotonic()
+            expiries = [end - now for end in map(expiry, (name for name, _ in pending.values())) if end is not None]
+            wait_for = max(0, min(expiries)) if expiries else (timeout if timeout is not None else None)
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name, error_value = pending.pop(future)
+                try:
+                    yield name, future.result()
+                except Exception as e:
+                    yield name, error_value(f"Error getting {name} info: {e}")
+
+            now = time.monotonic()
+            for future, (name, error_value) in list(pending.items()):
+                end = expiry(name)
+                if end is not None and now >= end:
+                    del pending[future]
+                    if run_deadline is not None and deadlines.get(name, run_deadline) >= run_deadline:
+                        reason = f"deadline of {deadline}s reached"
+                    else:
+                        reason = f"timed out after {timeout}s"
+                    yield name, error_value(f"Error getting {name} info: {reason}")
+    finally:
+        executor.shutdown(wait=False)  # don't block on collectors that timed out
+
+
+def run_collectors(collectors, max_workers=None, timeout=DEFAULT_TIMEOUT, deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Runs the collectors concurrently (see iter_collectors) and returns {section: result} in report order."""
+    results = dict(iter_collectors(collectors, max_workers=max_workers, timeout=timeout, deadline=deadline,
+                                   probe_timeout=probe_timeout))
+    return {name: results[name] for name, _, _ in collectors}
+
+
+def collect(sections=None, max_workers=None, timeout=DEFAULT_TIMEOUT, cache_path=None, refresh=False, timings=False,
+            deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Collects the requested sections (default: all of SECTIONS) and returns {section: info}.
+
+    The sections are collected concurrently, so a scan takes about as long as the
+    slowest collector rather than the sum of all of them. With a cache_path, static
+    and slow-changing facts are reused from earlier runs (see cache.FACT_CLASSES)
+    and only volatile facts are probed again; refresh=True ignores the cached facts.
+    With timings=True, every command, file read and other probe is timed and the
+    records (see probes.timing) are added to the result under info['_meta']['timings'].
+    `deadline` bounds the whole scan and `probe_timeout` any single command (see
+    iter_collectors).
+    """
+    results = dict(iter_collect(sections, max_workers, timeout, cache_path, refresh, timings, deadline, probe_timeout))
+    info = {name: results.pop(name) for name in SECTIONS if name in results}
+    info.update(results)  # _meta goes last
+    return info
+
+
+def iter_collect(sections=None, max_workers=None, timeout=DEFAULT_TIMEOUT, cache_path=None, refresh=False, timings=False,
+                 deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Like collect(), but yields (section, info) pairs as the sections finish, fastest first.
+
+    With timings=True a final ('_meta', {'timings': [...]}) pair follows the sections.
+    With a cache_path the sections are yielded together once the cached collection is done.
+    """
+    collectors = collectors_for(sections)
+    with contextlib.ExitStack() as stack:
+        records = stack.enter_context(probes.timing()) if timings else None
+        if cache_path:
+            from .cache import collect_cached
+            yield from collect_cached(collectors, cache_path, max_workers, timeout, refresh, deadline, probe_timeout).items()
+        else:
+            yield from iter_collectors(collectors, max_workers=max_workers, timeout=timeout, deadline=deadline,
+                                       probe_timeout=probe_timeout)
+    if records is not None:
+        # Collectors that timed out may still be probing; report what had finished by now.
+        yield '_meta', {'timings': list(records)}
+
+
+def get_pc_info(max_workers=None, timeout=DEFAULT_TIMEOUT, cache_path=None, refresh=False, timings=False,
+                deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Gathers and organizes comprehensive information about the PC."""
+    return collect(None, max_workers=max_workers, timeout=timeout, cache_path=cache_path, refresh=refresh,
+                   timings=timings, deadline=deadline, probe_timeout=probe_timeout)
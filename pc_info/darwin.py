@@ -0,0 +1,199 @@
+"""macOS backend: sysctl, vm_stat and system_profiler probes."""
+import platform
+import re
+
+from . import probes
+from .common import get_os_info, host_names, udevadm_serial  # get_os_info is re-exported as the 'os' collector
+from .parsers import leading_number, parse_record
+from .processes import summarize
+
+
+def get_cpu_info():
+    """Collects CPU information."""
+
+    cpu = {}
+    try:
+        cpu_name = probes.run("sysctl -n machdep.cpu.brand_string").strip()
+        cpu['name'] = cpu_name
+
+        cpu['current_clock_speed'] = probes.run("sysctl -n hw.cpufrequency").strip()
+        cpu['architecture'] = platform.machine()
+        cpu['cores'] = int(probes.run("sysctl -n hw.ncpu").strip())
+        cpu['threads'] = int(probes.run("sysctl -n hw.logicalcpu").strip())
+        cpu['l1d_cache_size'] = probes.run("sysctl -n hw.l1dcachesize").strip()
+        cpu['l1i_cache_size'] = probes.run("sysctl -n hw.l1icachesize").strip()
+        cpu['l2_cache_size'] = probes.run("sysctl -n hw.l2cachesize").strip()
+        cpu['l3_cache_size'] = probes.run("sysctl -n hw.l3cachesize").strip()
+
+    except Exception as e:
+        cpu['name'] = f"Error getting CPU info: {e}"
+    return cpu
+
+
+def get_memory_info():
+    """Collects memory information (total, modules, virtual memory stats)."""
+
+    memory = {}
+    try:
+        output = probes.run("sysctl -n hw.memsize")
+        mem_bytes = int(output.strip())
+        memory['total_gb'] = round(mem_bytes / (1024 ** 3), 2)
+        memory['total_bytes'] = mem_bytes
+        #macOS doesn't give easily accessible details for each memory module.
+        memory['modules'] = "Details unavailable without 3rd-party tools."
+
+        #get virtual memory details
+        try:
+            vm_stat = parse_record(probes.run("vm_stat"), ":", ("Pages free", "Pages active", "Pages inactive", "Pages wired down"))
+            page_size = int(probes.run("pagesize").strip())
+
+            for key, field in (('vm_free_gb', "Pages free"), ('vm_active_gb', "Pages active"),
+                               ('vm_inactive_gb', "Pages inactive"), ('vm_wired_gb', "Pages wired down")):
+                pages = leading_number(vm_stat.get(field))
+                memory[key] = round(pages * page_size / (1024**3), 2) if pages is not None else "N/A"
+
+        except Exception as e:
+            memory['virtual_memory'] = f"Error getting virtual memory stats: {e}"
+
+
+    except Exception as e:
+        memory['total_gb'] = f"Error getting memory info: {e}"
+    return memory
+
+
+def get_disk_info():
+    """Collects disk information."""
+
+    disks = []
+    try:
+        output = probes.run("df -h")
+        lines = output.strip().split('\n')[1:]
+        for line in lines:
+            parts = line.split()
+            if len(parts) >= 5:
+                filesystem = parts[0]
+                size = parts[1]
+                mounted_on = parts[5]  # Get the mount point
+                disk_info = {'name': filesystem, 'size': size, 'mount_point': mounted_on} #store in disk_info var
+
+                disk_info['serial_number'] = udevadm_serial(filesystem)
+
+                disks.append(disk_info) #add serial to disks
+
+    except Exception as e:
+        disks.append(f"Error getting disk info: {e}")
+    return disks
+
+
+def get_network_info():
+    """Collects network information."""
+
+    network = {}
+    try:
+        network.update(host_names())
+
+        ip_route_output = probes.run("ip route get 1")
+        ip_match = re.search(r"src ([0-9.]+)", ip_route_output)
+        network['ip_address'] = ip_match.group(1) if ip_match else "Not Found" #get source IP
+
+        #Get MAC address from ip addr show
+        ip_addr_output = probes.run("ip addr show")
+        mac_match = re.search(r"link/ether ([0-9A-Fa-f:]+)", ip_addr_output)
+        network['mac_address'] = mac_match.group(1) if mac_match else "Not Found"
+
+        try: #get DNS from resolvectl (systemd)
+            resolve_output = probes.run("resolvectl status")
+            dns_match = re.search(r"Current DNS Server:\s*(.+)", resolve_output)
+            if dns_match:
+                network['dns_servers'] = [dns_match.group(1).strip()]
+            else:
+                network['dns_servers'] = "N/A"
+        except:
+            network['dns_servers'] = "N/A" #If resolvectl isn't available
+
+        try: #default gateway
+            route_output = probes.run("ip route")
+            default_gateway_match = re.search(r"default via (.+?) dev", route_output)
+            network['default_gateway'] = default_gateway_match.group(1).strip() if default_gateway_match else "N/A"
+        except:
+            network['default_gateway'] = "N/A"
+        try: # get interface names and details using ip command
+            ip_output = probes.run("ip -o -4 a show")
+            interfaces = []
+            for line in ip_output.splitlines():
+                parts = line.split()
+                if len(parts) > 3:
+                    interface_name = parts[1]
+                    ip_address = parts[3].split('/')[0]  # Extract IP address without the subnet
+                    interfaces.append({'name': interface_name, 'ip_address': ip_address})
+            network['interfaces'] = interfaces
+        except Exception as e:
+            network['interfaces'] = f"Error getting network interfaces: {e}"
+    except Exception as e:
+        network['hostname'] = f"Error getting hostname: {e}"
+        network['ip_address'] = f"Error getting IP address: {e}"
+        network['mac_address'] = f"Error getting MAC address: {e}"
+    return network
+
+
+def get_gpu_info():
+    """Collects graphics card (GPU) information."""
+
+    gpu = {}
+    try:
+        output = probes.run("system_profiler SPDisplaysDataType")
+        gpu_match = re.search(r"Chipset Model: (.*)", output)
+        if gpu_match:
+            gpu['gpus'] = [gpu_match.group(1).strip()]
+        else:
+            gpu['gpus'] = ["Not Found"]
+    except Exception as e:
+        gpu['gpus'] = [f"Error getting GPU info: {e}"]
+    return gpu
+
+
+def get_motherboard_info():
+    """Collects motherboard information."""
+
+    motherboard = {}
+    try:
+        hardware = parse_record(probes.run("system_profiler SPHardwareDataType"), ":", ("Model Identifier", "Serial Number (system)"))
+        motherboard['manufacturer'] = "Apple" #Hardcoded.
+        motherboard['product'] = hardware.get('Model Identifier') or "Unknown"
+        motherboard['serial_number'] = hardware.get('Serial Number (system)') or "Unknown"
+
+        #get boot volume
+        try:
+            boot_volume = next(line for line in probes.run("diskutil info /").splitlines() if "Volume Name" in line)
+            motherboard['boot_volume'] = boot_volume.split(":")[1].strip()
+        except:
+            motherboard['boot_volume'] = "N/A"
+    except Exception as e:
+        motherboard = f"Error getting motherboard info: {e}"
+    return motherboard
+
+
+def get_process_info():
+    """Collects process counts and the heaviest processes by CPU and memory, from ps."""
+    try:
+        records = []
+        for line in probes.run("ps -axo pid=,ppid=,state=,pcpu=,rss=,vsz=,user=,comm=").splitlines():
+            fields = line.split(None, 7)
+            if len(fields) < 8 or not fields[0].isdigit():
+                continue
+            records.append({
+                'pid': int(fields[0]),
+                'ppid': int(fields[1]),
+                'name': fields[7].rsplit("/", 1)[-1],  # comm is the executable's full path
+                'user': fields[6],
+                'state': fields[2][0],
+                'threads': "N/A",
+                'cpu_percent': float(fields[3]),
+                'rss_mb': round(int(fields[4]) / 1024, 1),  # ps reports KB
+                'vms_mb': round(int(fields[5]) / 1024, 1),
+                'read_bytes': "N/A",
+                'write_bytes': "N/A",
+            })
+        return summarize(records, "decaying average (ps)")
+    except Exception as e:
+        return f"Error getting process info: {e}"
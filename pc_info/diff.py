@@ -0,0 +1,253 @@
+"""Change detection between two info dicts, and a per-host snapshot store.
+
+    changes = diff(previous, info)       # [{'op': 'change', 'path': [...], 'old': ..., 'value': ...}, ...]
+    print(format_path(changes[0]['path']))   # memory.modules[locator=DIMM 1].serial_number
+
+A path is a list of dict keys, list positions and, for lists of records, the record's
+identity: {'locator': 'DIMM 1'} rather than its position, so a DIMM moving slots or
+a disk being added doesn't make every later record look changed. Records are told
+apart by the first of IDENTITY_FIELDS whose values are present and unique in both
+lists; lists without one are compared position by position.
+
+Fields that change on every run (free memory, clock speed, counters: the ones the
+fact cache never caches, whether in a section or in each record of one) are left
+out, as are the process table and the '_meta' record.
+
+delta() packs the changes without their old values plus digests of both snapshots,
+and apply_delta() rebuilds the new snapshot from the old one, so a receiver that
+already holds the previous report only needs the delta.
+"""
+import copy
+import hashlib
+import json
+import os
+import re
+import time
+
+from .cache import FACT_CLASSES
+
+# Fields that identify a record in a list, most specific first.
+IDENTITY_FIELDS = ('locator', 'mount_point', 'device', 'serial_number', 'name')
+
+# section -> fields whose changes are noise for change tracking.
+IGNORED_FIELDS = {
+    section: frozenset(field for field, fact_class in overrides.items() if fact_class == 'volatile')
+    for section, (_, overrides) in FACT_CLASSES.items()
+}
+IGNORED_SECTIONS = frozenset({'_meta', 'processes'})
+
+
+def comparable(info):
+    """Returns `info` without the ignored sections and fields."""
+    stripped = {}
+    for section, value in info.items():
+        if section in IGNORED_SECTIONS:
+            continue
+        ignored = IGNORED_FIELDS.get(section)
+        if ignored and isinstance(value, dict):
+            value = {k: v for k, v in value.items() if k not in ignored}
+        elif ignored and isinstance(value, list):  # disks: the same fields of each record
+            value = [{k: v for k, v in item.items() if k not in ignored} if isinstance(item, dict) else item
+                     for item in value]
+        stripped[section] = value
+    return stripped
+
+
+def digest(info):
+    """SHA-1 of the comparable part of `info` in canonical JSON."""
+    canonical = json.dumps(comparable(info), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+def _identity_field(old, new):
+    """The IDENTITY_FIELDS entry that tells apart the records of both lists, or None."""
+    if not all(isinstance(item, dict) for item in old + new):
+        return None
+    for field in IDENTITY_FIELDS:
+        for items in (old, new):
+            values = [item.get(field) for item in items]
+            if None in values or len(set(map(repr, values))) != len(values):
+                break
+        else:
+            return field
+    return None
+
+
+def _diff_value(old, new, path, changes):
+    if type(old) is not type(new) or not isinstance(new, (dict, list)):
+        if old != new:
+            changes.append({'op': 'change', 'path': path, 'old': old, 'value': new})
+    elif isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                changes.append({'op': 'remove', 'path': path + [key], 'old': value})
+            else:
+                _diff_value(value, new[key], path + [key], changes)
+        for key, value in new.items():
+            if key not in old:
+                changes.append({'op': 'add', 'path': path + [key], 'value': value})
+    else:
+        _diff_list(old, new, path, changes)
+
+
+def _diff_list(old, new, path, changes):
+    """Lists of records are matched by identity; anything else by position.
+
+    Changes come out in the order apply_delta() needs them: removals, then changes
+    to surviving items, then insertions by ascending position.
+    """
+    field = _identity_field(old, new)
+    if field is None:
+        for index in range(min(len(old), len(new))):
+            _diff_value(old[index], new[index], path + [index], changes)
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            changes.append({'op': 'remove', 'path': path + [index], 'old': old[index]})
+        for index in range(len(old), len(new)):
+            changes.append({'op': 'add', 'path': path + [index], 'value': new[index]})
+        return
+
+    old_by_key = {repr(item[field]): item for item in old}
+    new_keys = {repr(item[field]) for item in new}
+    kept_in_old = [repr(item[field]) for item in old if repr(item[field]) in new_keys]
+    kept_in_new = [repr(item[field]) for item in new if repr(item[field]) in old_by_key]
+    if kept_in_old != kept_in_new:  # reordered: positions can't be rebuilt from insertions alone
+        changes.append({'op': 'change', 'path': path, 'old': old, 'value': new})
+        return
+    for item in old:
+        if repr(item[field]) not in new_keys:
+            changes.append({'op': 'remove', 'path': path + [{field: item[field]}], 'old': item})
+    for item in new:
+        if repr(item[field]) in old_by_key:
+            _diff_value(old_by_key[repr(item[field])], item, path + [{field: item[field]}], changes)
+    for index, item in enumerate(new):
+        if repr(item[field]) not in old_by_key:
+            changes.append({'op': 'add', 'path': path + [{field: item[field]}], 'value': item, 'index': index})
+
+
+def diff(old, new):
+    """Returns the changes that turn info dict `old` into `new`, ignored fields aside."""
+    changes = []
+    _diff_value(comparable(old), comparable(new), [], changes)
+    return changes
+
+
+def delta(old, new):
+    """A compact delta from `old` to `new`: the changes without old values, plus both digests."""
+    changes = [{k: v for k, v in change.items() if k != 'old'} for change in diff(old, new)]
+    return {'base': digest(old), 'digest': digest(new), 'changes': changes}
+
+
+def _locate(container, step):
+    """Resolves one path step in `container`: returns the position/key to use, or raises KeyError."""
+    if isinstance(step, dict):
+        (field, value), = step.items()
+        for index, item in enumerate(container):
+            if isinstance(item, dict) and item.get(field) == value:
+                return index
+        raise KeyError(format_path([step]))
+    if isinstance(container, list) and not 0 <= step < len(container):
+        raise KeyError(step)
+    if isinstance(container, dict) and step not in container:
+        raise KeyError(step)
+    return step
+
+
+def apply_delta(old, delta):
+    """Returns the info dict `delta` (from delta() or a list of diff() changes) turns `old` into.
+
+    Ignored fields keep their values from `old`. Raises ValueError if the delta was
+    made against a different snapshot or doesn't apply.
+    """
+    changes = delta['changes'] if isinstance(delta, dict) else delta
+    if isinstance(delta, dict) and delta.get('base') not in (None, digest(old)):
+        raise ValueError("Delta was made against a different snapshot")
+    new = copy.deepcopy(old)
+    try:
+        for change in changes:
+            *parents, last = change['path']
+            container = new
+            for step in parents:
+                container = container[_locate(container, step)]
+            op = change['op']
+            if op == 'add':
+                value = copy.deepcopy(change['value'])
+                if isinstance(container, dict):
+                    container[last] = value
+                elif isinstance(last, dict):
+                    container.insert(change.get('index', len(container)), value)
+                else:
+                    container.insert(last, value)
+            elif op == 'remove':
+                del container[_locate(container, last)]
+            else:
+                container[_locate(container, last)] = copy.deepcopy(change['value'])
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise ValueError(f"Delta doesn't apply: {e}")
+    if isinstance(delta, dict) and delta.get('digest') not in (None, digest(new)):
+        raise ValueError("Delta doesn't reproduce the snapshot it was made from")
+    return new
+
+
+def format_path(path):
+    """Renders a change path for people: disks[mount_point=/].serial_number, modules[0], ..."""
+    text = ""
+    for step in path:
+        if isinstance(step, dict):
+            (field, value), = step.items()
+            text += f"[{field}={value}]"
+        elif isinstance(step, int):
+            text += f"[{step}]"
+        else:
+            text += f".{step}" if text else str(step)
+    return text
+
+
+def default_snapshot_dir():
+    """Per-user snapshot store location, next to the fact cache."""
+    from .cache import default_cache_path
+    return os.path.join(os.path.dirname(default_cache_path()), "snapshots")
+
+
+class SnapshotStore:
+    """The latest snapshot of each host, plus an append-only log of the deltas between them.
+
+    <host>.json holds the full latest snapshot and <host>.deltas.ndjson one
+    {"time": ..., "base": ..., "digest": ..., "changes": [...]} line per change, so
+    any earlier snapshot can be rebuilt from the first one without storing it.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_snapshot_dir()
+
+    def _path(self, host, suffix):
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", host).lstrip(".") or "_"
+        return os.path.join(self.directory, safe + suffix)
+
+    def load(self, host):
+        """Returns the latest snapshot of `host`, or None if there is none."""
+        try:
+            with open(self._path(host, ".json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def record(self, host, info):
+        """Stores `info` as the latest snapshot of `host` and returns the delta from the previous one.
+
+        Returns None for the first snapshot of a host. The snapshot is only rewritten
+        when something changed, so it keeps the volatile fields of that first run.
+        """
+        previous = self.load(host)
+        changes = delta(previous, info) if previous is not None else None
+        if changes is not None and not changes['changes']:
+            return changes
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(host, ".json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info, f, default=str)
+        os.replace(tmp_path, path)  # atomic, like the fact cache
+        if changes is not None:
+            with open(self._path(host, ".deltas.ndjson"), "a") as f:
+                f.write(json.dumps({'time': time.time(), **changes}, separators=(",", ":"), default=str) + "\n")
+        return changes
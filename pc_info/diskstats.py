@@ -0,0 +1,138 @@
+"""Block device I/O performance from /proc/diskstats (Linux).
+
+One read of /proc/diskstats covers every disk and partition; /sys/block/<disk>/stat
+(and /sys/class/block/<partition>/stat) hold the same counters one device at a
+time, for when only one is of interest. Two samples give what iostat -x reports:
+
+    sampler = DiskSampler()
+    sampler.sample()                 # {'nvme0n1': {'reads': ..., 'write_bytes': ..., 'io_time_ms': ...}, ...}
+    time.sleep(1)
+    sampler.sample()['nvme0n1']      # ... plus read_iops, write_iops, read/write_bytes_per_sec,
+                                     # read/write_latency_ms, avg_queue_depth and util_percent
+"""
+import threading
+import time
+
+from . import probes
+
+SECTOR_SIZE = 512  # diskstats counts 512-byte sectors whatever the device's own sector size
+
+# The counters we keep, in this order in every tuple, and their columns in a
+# /proc/diskstats line (major, minor and name come first; /sys/block/*/stat starts
+# at reads, so its columns are three less).
+FIELDS = ('reads', 'read_sectors', 'read_ms', 'writes', 'write_sectors', 'write_ms', 'in_flight', 'io_ms',
+          'weighted_ms')
+_COLUMNS = (3, 5, 6, 7, 9, 10, 11, 12, 13)
+
+
+def parse_diskstats(data):
+    """{device: (counters in FIELDS order)} from /proc/diskstats text."""
+    counters = {}
+    for line in data.splitlines():
+        columns = line.split(None, 14)
+        if len(columns) >= 14:
+            counters[columns[2]] = (int(columns[3]), int(columns[5]), int(columns[6]), int(columns[7]),
+                                    int(columns[9]), int(columns[10]), int(columns[11]), int(columns[12]),
+                                    int(columns[13]))
+    return counters
+
+
+def parse_block_stat(data):
+    """The counters (FIELDS order) of one device from its sysfs stat file."""
+    columns = data.split()
+    return tuple(int(columns[i - 3]) for i in _COLUMNS)
+
+
+def read_diskstats():
+    """Reads and parses /proc/diskstats."""
+    return parse_diskstats(probes.read_file("/proc/diskstats"))
+
+
+def read_block_stat(device):
+    """Counters of one disk or partition from /sys/class/block/<device>/stat."""
+    return parse_block_stat(probes.read_file(f"/sys/class/block/{device}/stat"))
+
+
+def counters(counts):
+    """A device's cumulative counters as a record: operations, bytes and milliseconds since boot."""
+    reads, read_sectors, read_ms, writes, write_sectors, write_ms, in_flight, io_ms, _ = counts
+    return {
+        'reads': reads,
+        'writes': writes,
+        'read_bytes': read_sectors * SECTOR_SIZE,
+        'write_bytes': write_sectors * SECTOR_SIZE,
+        'read_time_ms': read_ms,
+        'write_time_ms': write_ms,
+        'io_time_ms': io_ms,
+        'in_flight': in_flight,
+    }
+
+
+def performance(before, after, elapsed):
+    """iostat -x style figures of one device between two counter tuples taken `elapsed` seconds apart.
+
+    Latencies are the average time each completed read or write took (queueing
+    included); avg_queue_depth is the average number of requests in flight; util_percent
+    the share of the time the device had any request in flight.
+
+    A counter that went backwards (the device was re-added, or a 32-bit counter
+    wrapped) counts from zero; in_flight is a gauge, so it never resets the others:
+
+    >>> performance((100, 800, 50, 0, 0, 0, 3, 900, 1000), (200, 1600, 150, 0, 0, 0, 0, 1900, 2000), 1.0)['read_iops']
+    100.0
+    >>> performance((100, 800, 50, 0, 0, 0, 0, 900, 1000), (20, 160, 10, 0, 0, 0, 0, 1900, 2000), 1.0)['read_iops']
+    20.0
+    """
+    reads, read_sectors, read_ms, writes, write_sectors, write_ms, _, io_ms, weighted_ms = (
+        now - then if now >= then else now for now, then in zip(after, before))  # in_flight (a gauge) unused
+    return {
+        'read_iops': round(reads / elapsed, 1),
+        'write_iops': round(writes / elapsed, 1),
+        'read_bytes_per_sec': round(read_sectors * SECTOR_SIZE / elapsed, 1),
+        'write_bytes_per_sec': round(write_sectors * SECTOR_SIZE / elapsed, 1),
+        'read_latency_ms': round(read_ms / reads, 2) if reads else 0.0,
+        'write_latency_ms': round(write_ms / writes, 2) if writes else 0.0,
+        'avg_queue_depth': round(weighted_ms / (elapsed * 1000), 2),
+        'util_percent': round(min(100.0, io_ms / (elapsed * 10)), 1),
+    }
+
+
+class DiskSampler:
+    """Consecutive sample() calls give each device's counters plus its performance since the previous call."""
+
+    def __init__(self):
+        self.window = None  # seconds the last sample's figures cover; None on the first
+        self._previous = None
+        self._previous_time = None
+
+    def sample(self):
+        """{device: counters record, with performance() figures from the second sample on}."""
+        now = time.monotonic()
+        current = read_diskstats()
+        previous = self._previous if self._previous is not None and now > self._previous_time else None
+        self.window = now - self._previous_time if previous is not None else None
+        self._previous, self._previous_time = current, now
+        stats = {}
+        for device, counts in current.items():
+            record = counters(counts)
+            if previous is not None:
+                record.update(performance(previous.get(device, (0,) * len(counts)), counts, self.window))
+            stats[device] = record
+        return stats
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def io_stats():
+    """Every device's counters, with performance since the previous call in this process.
+
+    Like the process table and network rates, the per-second figures only appear
+    from the second collection on (watch, --serve, the library).
+    """
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = DiskSampler()
+        return _sampler.sample()
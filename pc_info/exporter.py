@@ -0,0 +1,347 @@
+"""Exporter mode: serves the collected facts as OpenMetrics over HTTP (`python -m pc_info --serve 9184`).
+
+A background thread collects every `interval` seconds through the fact cache, so
+after the first round only the volatile fields are probed again, and renders the
+response bodies once per round (plain and gzipped, OpenMetrics and Prometheus
+text). Scrapes are answered from those pre-rendered bytes by a
+ThreadingHTTPServer: a scrape never waits on the SMBIOS helper, a slow command or
+sudo, and concurrent scrapes only copy bytes.
+
+    GET /metrics    OpenMetrics 1.0 when the scraper asks for it, Prometheus text 0.0.4 otherwise
+"""
+import gzip
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .core import DEFAULT_TIMEOUT, PROBE_TIMEOUT, collect
+
+DEFAULT_PORT = 9184
+DEFAULT_INTERVAL = 15  # seconds between collections
+
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_GB = 1024 ** 3
+_SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4, 'P': 1024 ** 5}
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _size_bytes(disk):
+    """Bytes of a disk record: size_bytes, size_gb (Windows) or a df-style size like "3.0G" / "500Gi"."""
+    if _is_number(disk.get('size_bytes')):
+        return disk['size_bytes']
+    if _is_number(disk.get('size_gb')):
+        return disk['size_gb'] * _GB
+    match = re.fullmatch(r"([\d.]+)\s*([KMGTP]?)i?B?", str(disk.get('size', "")).strip(), re.IGNORECASE)
+    return float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()] if match else None
+
+
+def _memory_bytes(record, name):
+    """<name>_bytes of a memory record, else its <name>_gb (rounded to 10 MB) in bytes; None if it has neither."""
+    if _is_number(record.get(f"{name}_bytes")):
+        return record[f"{name}_bytes"]
+    if _is_number(record.get(f"{name}_gb")):
+        return round(record[f"{name}_gb"] * _GB)
+    return None
+
+
+def _failed(value):
+    """Whether a collected value is, or holds, an error placeholder."""
+    if isinstance(value, str):
+        return value.startswith(("Error", "Unable"))
+    if isinstance(value, dict):
+        return any(_failed(item) for item in value.values())
+    if isinstance(value, list):
+        return any(isinstance(item, str) and _failed(item) for item in value)
+    return False
+
+
+class _Family:
+    """One metric family: its samples are (name suffix, {label: value}, number)."""
+
+    def __init__(self, name, kind, help_text, unit=None):
+        self.name, self.kind, self.help, self.unit = name, kind, help_text, unit
+        self.samples = []
+
+    def add(self, value, labels=None, suffix=""):
+        if _is_number(value):
+            self.samples.append((suffix, labels or {}, value))
+        return self
+
+
+def _families(info, duration):
+    """The metric families of an info dict (sections that weren't collected are left out)."""
+    def family(*args):
+        families.append(_Family(*args))
+        return families[-1]
+
+    families = []
+    memory = info.get('memory') if isinstance(info.get('memory'), dict) else {}
+    for field, name, help_text in (('total', 'memory_total', "Installed memory."),
+                                   ('free', 'memory_free', "Free memory."),
+                                   ('available', 'memory_available', "Memory available without swapping."),
+                                   ('used', 'memory_used', "Memory in use (all but the available)."),
+                                   ('buffers', 'memory_buffers', "Memory in block device buffers."),
+                                   ('cached', 'memory_cached', "Memory in the page cache."),
+                                   ('swap_total', 'swap_total', "Swap space."),
+                                   ('swap_free', 'swap_free', "Free swap space.")):
+        value = _memory_bytes(memory, field)
+        if value is not None:
+            family(f"pc_info_{name}_bytes", 'gauge', help_text, 'bytes').add(value)
+    vmstat = memory.get('vmstat')
+    if isinstance(vmstat, dict):
+        for field, name, help_text in (('pgfault', 'page_faults', "Page faults since boot."),
+                                       ('pgmajfault', 'major_page_faults', "Page faults that needed I/O since boot."),
+                                       ('pswpin', 'swap_in_pages', "Pages swapped in since boot."),
+                                       ('pswpout', 'swap_out_pages', "Pages swapped out since boot."),
+                                       ('oom_kill', 'oom_kills', "Processes killed by the OOM killer since boot.")):
+            if _is_number(vmstat.get(field)):
+                family(f"pc_info_{name}", 'counter', help_text).add(vmstat[field], suffix="_total")
+    nodes = [node for node in memory.get('numa') or () if isinstance(node, dict)]
+    if nodes:
+        for field, name, help_text in (('total', 'total', "Memory of each NUMA node."),
+                                       ('free', 'free', "Free memory of each NUMA node.")):
+            metric = family(f"pc_info_numa_memory_{name}_bytes", 'gauge', help_text, 'bytes')
+            for node in nodes:
+                metric.add(_memory_bytes(node, field), {'node': str(node['node'])})
+    pools = [pool for pool in memory.get('hugepages') or () if isinstance(pool, dict)]
+    if pools:
+        for field, name, help_text in (('total', 'hugepages', "Hugepages in each pool."),
+                                       ('free', 'hugepages_free', "Free hugepages in each pool.")):
+            metric = family(f"pc_info_{name}", 'gauge', help_text)
+            for pool in pools:
+                metric.add(pool.get(field), {'size': f"{pool['size_kb']}kB"})
+
+    cpu = info.get('cpu') if isinstance(info.get('cpu'), dict) else {}
+    topology = cpu.get('topology')
+    cpu_ids = lambda values: (topology['cpu'] if isinstance(topology, dict) and len(topology.get('cpu', ())) == len(values)
+                              else range(len(values)))  # online CPUs, in order
+    speeds = cpu.get('current_clock_speeds')
+    if isinstance(speeds, list):
+        ids = cpu_ids(speeds)
+        frequency = family("pc_info_cpu_frequency_hertz", 'gauge', "Current clock of each CPU.", 'hertz')
+        for cpu_id, mhz in zip(ids, speeds):
+            frequency.add(mhz * 1e6 if _is_number(mhz) else None, {'cpu': str(cpu_id)})
+    elif _is_number(cpu.get('current_clock_speed')):
+        family("pc_info_cpu_frequency_hertz", 'gauge', "Current CPU clock.", 'hertz').add(cpu['current_clock_speed'] * 1e6)
+    if _is_number(cpu.get('max_clock_speed')):
+        family("pc_info_cpu_max_frequency_hertz", 'gauge', "Highest CPU clock.", 'hertz').add(cpu['max_clock_speed'] * 1e6)
+    if _is_number(cpu.get('context_switches')):
+        family("pc_info_context_switches", 'counter', "Context switches since boot.").add(cpu['context_switches'],
+                                                                                         suffix="_total")
+    per_cpu = cpu.get('interrupts_per_cpu')
+    if isinstance(per_cpu, list):
+        interrupts = family("pc_info_interrupts", 'counter', "Interrupts handled by each CPU since boot.")
+        for cpu_id, count in zip(cpu_ids(per_cpu), per_cpu):
+            interrupts.add(count, {'cpu': str(cpu_id)}, "_total")
+    elif _is_number(cpu.get('total_interrupts')):
+        family("pc_info_interrupts", 'counter', "Interrupts since boot.").add(cpu['total_interrupts'], suffix="_total")
+
+    processes = info.get('processes') if isinstance(info.get('processes'), dict) else {}
+    for field, name, help_text in (('count', 'processes', "Processes running."),
+                                   ('threads', 'threads', "Threads of all processes.")):
+        if _is_number(processes.get(field)):
+            family(f"pc_info_{name}", 'gauge', help_text).add(processes[field])
+
+    traffic = info['network'].get('traffic') if isinstance(info.get('network'), dict) else None
+    if isinstance(traffic, dict):
+        for field, name, help_text, unit in (
+                ('rx_bytes', 'receive_bytes', "Bytes received by each interface.", 'bytes'),
+                ('rx_packets', 'receive_packets', "Packets received by each interface.", None),
+                ('rx_errors', 'receive_errors', "Receive errors of each interface.", None),
+                ('rx_drops', 'receive_drops', "Received packets each interface dropped.", None),
+                ('tx_bytes', 'transmit_bytes', "Bytes sent by each interface.", 'bytes'),
+                ('tx_packets', 'transmit_packets', "Packets sent by each interface.", None),
+                ('tx_errors', 'transmit_errors', "Transmit errors of each interface.", None),
+                ('tx_drops', 'transmit_drops', "Outgoing packets each interface dropped.", None)):
+            metric = family(f"pc_info_network_{name}", 'counter', help_text, unit)
+            for interface, counters in traffic.items():
+                metric.add(counters.get(field), {'interface': interface}, "_total")
+
+    if isinstance(info.get('disks'), list):
+        sizes = family("pc_info_filesystem_size_bytes", 'gauge', "Size of each mounted filesystem.", 'bytes')
+        for disk in info['disks']:
+            if isinstance(disk, dict):
+                labels = {'mount_point': str(disk.get('mount_point', disk.get('name', ""))),
+                          'device': str(disk.get('name', ""))}
+                sizes.add(_size_bytes(disk), labels)
+        # one series per device, however many mount points it has (bind mounts, btrfs subvolumes)
+        io = {}
+        for disk in info['disks']:
+            if isinstance(disk, dict) and isinstance(disk.get('io'), dict):
+                io.setdefault(str(disk.get('device', disk.get('name', ""))), disk['io'])
+        if io:
+            for field, name, help_text, unit, scale in (
+                    ('reads', 'reads_completed', "Reads each disk completed.", None, 1),
+                    ('writes', 'writes_completed', "Writes each disk completed.", None, 1),
+                    ('read_bytes', 'read_bytes', "Bytes read from each disk.", 'bytes', 1),
+                    ('write_bytes', 'written_bytes', "Bytes written to each disk.", 'bytes', 1),
+                    ('io_time_ms', 'io_time_seconds', "Time each disk spent with I/O in flight.", 'seconds', 1000)):
+                metric = family(f"pc_info_disk_{name}", 'counter', help_text, unit)
+                for device, counters in io.items():
+                    value = counters.get(field)
+                    metric.add(value / scale if scale != 1 and _is_number(value) else value, {'device': device}, "_total")
+
+    def info_family(section, help_text, fields, records):
+        if records:
+            metric = family(f"pc_info_{section}", 'info', help_text)
+            for record in records:
+                metric.add(1, {field: str(record.get(field, "Unknown")) for field in fields}, "_info")
+
+    as_records = lambda value: [value] if isinstance(value, dict) else []
+    info_family('os', "Operating system.", ('system', 'release', 'version', 'architecture'), as_records(info.get('os')))
+    info_family('cpu', "CPU model.", ('name', 'architecture', 'cores', 'threads'), as_records(info.get('cpu')))
+    gpus = info['gpu'].get('gpus') if isinstance(info.get('gpu'), dict) else None
+    # 'device' tells identical cards apart: the PCI address where the backend has it, else the position
+    info_family('gpu', "Graphics cards.", ('device', 'name', 'driver_version', 'memory_size'),
+                [dict(gpu, device=gpu.get('pci_address', str(i))) for i, gpu in enumerate(gpus) if isinstance(gpu, dict)]
+                if isinstance(gpus, list) else [])
+    motherboard = as_records(info.get('motherboard'))
+    info_family('motherboard', "Motherboard.", ('manufacturer', 'product', 'version', 'serial_number'), motherboard)
+    info_family('bios', "BIOS firmware.", ('vendor', 'version', 'release_date'),
+                [board['bios'] for board in motherboard if isinstance(board.get('bios'), dict)])
+
+    errors = family("pc_info_section_error", 'gauge', "1 if the section, or any of its fields, could not be collected.")
+    for section, value in info.items():
+        if section != '_meta':
+            errors.add(int(_failed(value)), {'section': section})
+    family("pc_info_collect_duration_seconds", 'gauge', "How long the last collection took.", 'seconds').add(round(duration, 6))
+    family("pc_info_last_collect_timestamp_seconds", 'gauge', "When the last collection finished.", 'seconds').add(time.time())
+    return families
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render(families, openmetrics=True):
+    """Renders metric families as OpenMetrics 1.0 text, or Prometheus text 0.0.4."""
+    lines = []
+    for metric in families:
+        if not metric.samples:
+            continue
+        kind, name = metric.kind, metric.name
+        if not openmetrics:  # no info type, and counters are declared under their sample name
+            kind, name = ('gauge', name + "_info") if kind == 'info' else (kind, name + ("_total" if kind == 'counter' else ""))
+        lines.append(f"# TYPE {name} {kind}")
+        if openmetrics and metric.unit:
+            lines.append(f"# UNIT {name} {metric.unit}")
+        lines.append(f"# HELP {name} {metric.help}")
+        for suffix, labels, value in metric.samples:
+            label_text = ",".join(f'{key}="{_escape(text)}"' for key, text in labels.items())
+            lines.append(f"{metric.name}{suffix}{{{label_text}}} {_format(value)}" if labels
+                         else f"{metric.name}{suffix} {_format(value)}")
+    if openmetrics:
+        lines.append("# EOF")
+    return ("\n".join(lines) + "\n").encode()
+
+
+class Exporter:
+    """Collects in the background and keeps the rendered responses ready for scrapes."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, sections=None, cache_path=None, timeout=DEFAULT_TIMEOUT,
+                 probe_timeout=PROBE_TIMEOUT):
+        self.interval = interval
+        self._options = {'cache_path': cache_path, 'timeout': timeout, 'probe_timeout': probe_timeout,
+                         'deadline': interval}
+        self._sections = sections
+        self._bodies = {}  # (openmetrics, gzipped) -> bytes; replaced whole, never mutated
+        self._stop = threading.Event()
+
+    def refresh(self):
+        """Collects once and swaps in freshly rendered responses."""
+        start = time.monotonic()
+        info = collect(self._sections, **self._options)
+        families = _families(info, time.monotonic() - start)
+        bodies = {}
+        for openmetrics in (True, False):
+            body = render(families, openmetrics)
+            bodies[openmetrics, False] = body
+            bodies[openmetrics, True] = gzip.compress(body, 6)
+        self._bodies = bodies
+
+    def body(self, openmetrics=True, gzipped=False):
+        return self._bodies[openmetrics, gzipped]
+
+    def _run(self):
+        next_round = time.monotonic() + self.interval
+        while not self._stop.wait(max(0, next_round - time.monotonic())):
+            next_round += self.interval
+            try:
+                self.refresh()
+            except Exception:
+                pass  # keep serving the last good round
+            next_round = max(next_round, time.monotonic())  # don't try to catch up after a slow round
+
+    def start(self):
+        """Collects the first round (so there is always something to serve) and starts the refresh thread."""
+        self.refresh()
+        threading.Thread(target=self._run, name="pc-info-exporter", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+def _handler(exporter):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive: scrapers reuse their connection
+        wbufsize = -1  # buffer the headers and body; handle_one_request() flushes them in one send
+        disable_nagle_algorithm = True  # a body larger than the buffer still goes out without waiting for an ACK
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self._reply(404, "text/plain; charset=utf-8", b"Not found; metrics are under /metrics\n")
+                return
+            openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            self._reply(200, OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE,
+                        exporter.body(openmetrics, gzipped), gzipped)
+
+        def do_HEAD(self):
+            self.do_GET()
+
+        def _reply(self, status, content_type, body, gzipped=False):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # a scrape every few seconds would flood stderr
+
+    return MetricsHandler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 drops connections from scrapers arriving together
+
+
+def make_server(exporter, host="", port=DEFAULT_PORT):
+    """A ThreadingHTTPServer answering from `exporter` (call serve_forever() on it)."""
+    return _Server((host, port), _handler(exporter))
+
+
+def serve(host="", port=DEFAULT_PORT, **options):
+    """Runs the exporter until interrupted; `options` go to Exporter()."""
+    exporter = Exporter(**options).start()
+    server = make_server(exporter, host, port)
+    try:
+        server.serve_forever()
+    finally:
+        exporter.stop()
+        server.server_close()
@@ -0,0 +1,255 @@
+"""Fleet mode: collects from many hosts at once over persistent agent connections.
+
+Each host runs an agent (see agent.py) over a transport: `ssh` (the default) or
+`local`, which starts the agents as local subprocesses and stands in for real
+hosts when testing. Either way, the agent's code is shipped as a zip of this
+package over the connection itself, so hosts only need a `python3` (3.7+), and the
+connection is then kept open so later rounds skip both the SSH handshake and the
+interpreter start-up.
+
+    import asyncio
+    from pc_info.fleet import FleetPool
+
+    async def main():
+        async with FleetPool(["web1", "web2", "db1"], concurrency=64) as pool:
+            async for host, section, data in pool.stream(['cpu', 'memory']):
+                ...  # sections arrive as soon as each host has them
+
+    asyncio.run(main())
+
+collect_fleet() does the same synchronously and returns {host: info}.
+"""
+import asyncio
+import io
+import json
+import os
+import sys
+import zipfile
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_HOST_TIMEOUT = 120  # seconds for one host to answer a whole request, connecting included
+
+# Run by the remote `python3 -c`: reads a length-prefixed zip of the pc_info package
+# from stdin, imports the agent from it and serves requests on the rest of stdin.
+BOOTSTRAP = (
+    "import atexit,os,sys,tempfile\n"
+    "size=int(sys.stdin.buffer.readline())\n"
+    "fd,path=tempfile.mkstemp(suffix='.zip',prefix='pc-info-')\n"
+    "os.write(fd,sys.stdin.buffer.read(size));os.close(fd)\n"
+    "atexit.register(os.unlink,path)\n"
+    "sys.path.insert(0,path)\n"
+    "from pc_info.agent import serve\n"
+    "serve()\n"
+)
+
+SSH_OPTIONS = [
+    "-T",
+    "-o", "BatchMode=yes",  # never hang on a password prompt
+    "-o", "ControlMaster=auto",  # share one TCP connection per host with later runs
+    "-o", "ControlPath=~/.ssh/pc-info-%C",
+    "-o", "ControlPersist=120",
+    "-o", "ServerAliveInterval=30",
+]
+
+_package_zip = None
+
+
+def package_zip():
+    """Returns the pc_info package's sources as zip bytes (built once per process)."""
+    global _package_zip
+    if _package_zip is None:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in sorted(os.listdir(package_dir)):
+                if name.endswith(".py"):
+                    archive.write(os.path.join(package_dir, name), f"pc_info/{name}")
+        _package_zip = buffer.getvalue()
+    return _package_zip
+
+
+def agent_command(host, transport="ssh"):
+    """The argv that starts an agent for `host` over `transport` ('ssh' or 'local')."""
+    if transport == "ssh":
+        bootstrap = BOOTSTRAP.replace("'", "\"")
+        return ["ssh", *SSH_OPTIONS, host, f"python3 -c '{bootstrap}'"]
+    if transport == "local":
+        return [sys.executable, "-c", BOOTSTRAP]
+    raise ValueError(f"Unknown transport: {transport} (choose from ssh, local)")
+
+
+def read_inventory(path):
+    """Reads host names from an inventory file ('-' for stdin): one per line, '#' starts a comment."""
+    f = sys.stdin if path == "-" else open(path)
+    try:
+        hosts = []
+        for line in f:
+            host = line.split("#", 1)[0].strip()
+            if host and host not in hosts:
+                hosts.append(host)
+        return hosts
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+class AgentConnection:
+    """One persistent agent process for one host; requests on it are answered one at a time."""
+
+    def __init__(self, host, transport="ssh"):
+        self.host = host
+        self.transport = transport
+        self.process = None
+        self.hostname = None  # as reported by the agent
+        self.stderr_tail = []
+        self._next_id = 0
+        self._stderr_task = None
+
+    async def connect(self):
+        self.process = await asyncio.create_subprocess_exec(
+            *agent_command(self.host, self.transport),
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            limit=1 << 24,  # one section of a big host can exceed the default 64 KiB line limit
+        )
+        self._stderr_task = asyncio.ensure_future(self._drain_stderr())
+        payload = package_zip()
+        self.process.stdin.write(f"{len(payload)}\n".encode() + payload)
+        await self.process.stdin.drain()
+        hello = await self._read_message()
+        if hello.get('agent') != 'pc_info':
+            raise ConnectionError(f"unexpected greeting from agent: {hello!r}")
+        self.hostname = hello.get('hostname')
+
+    async def _drain_stderr(self):
+        """Keeps the last few stderr lines (ssh errors, collector noise) for error messages."""
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                return
+            self.stderr_tail = (self.stderr_tail + [line.decode(errors="replace").rstrip()])[-5:]
+
+    async def _read_message(self):
+        line = await self.process.stdout.readline()
+        if not line:
+            await asyncio.sleep(0)  # let the stderr drain catch up
+            detail = f": {self.stderr_tail[-1]}" if self.stderr_tail else ""
+            raise ConnectionError(f"agent exited{detail}")
+        return json.loads(line)
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def request(self, sections=None, timeout=None, timings=False):
+        """Sends one collection request; yields (section, data) as the agent reports them."""
+        if not self.alive:
+            await self.connect()
+        self._next_id += 1
+        request_id = self._next_id
+        message = {'id': request_id, 'sections': sections, 'timeout': timeout, 'timings': timings}
+        self.process.stdin.write(json.dumps(message).encode() + b"\n")
+        await self.process.stdin.drain()
+        while True:
+            reply = await self._read_message()
+            if reply.get('id') != request_id:
+                continue  # a late answer to a request we gave up on
+            if 'error' in reply:
+                raise RuntimeError(reply['error'])
+            if reply.get('done'):
+                return
+            yield reply['section'], reply['data']
+
+    async def close(self):
+        if self.process is None:
+            return
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), 5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        if self._stderr_task is not None:
+            await self._stderr_task
+        self.process = None
+
+
+class FleetPool:
+    """Persistent agent connections to a set of hosts, used at most `concurrency` at a time."""
+
+    def __init__(self, hosts, transport="ssh", concurrency=DEFAULT_CONCURRENCY, host_timeout=DEFAULT_HOST_TIMEOUT):
+        self.hosts = list(hosts)
+        self.transport = transport
+        self.concurrency = concurrency
+        self.host_timeout = host_timeout
+        self.connections = {host: AgentConnection(host, transport) for host in self.hosts}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await asyncio.gather(*(connection.close() for connection in self.connections.values()))
+
+    async def _collect_host(self, host, sections, timeout, timings, queue):
+        """Collects from one host, putting (host, section, data) on the queue as sections arrive."""
+        connection = self.connections[host]
+
+        async def run():
+            async for section, data in connection.request(sections, timeout, timings):
+                await queue.put((host, section, data))
+
+        try:
+            await asyncio.wait_for(run(), self.host_timeout)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                e = f"no answer after {self.host_timeout}s"
+            await connection.close()  # start afresh next round; the agent may be wedged
+            await queue.put((host, None, f"Error collecting from {host}: {e}"))
+
+    async def stream(self, sections=None, timeout=60, timings=False):
+        """Collects from every host; yields (host, section, data) in arrival order.
+
+        A host that can't be reached or doesn't answer in time yields one
+        (host, None, "Error collecting from ...") item instead of its sections.
+        """
+        queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(host):
+            async with semaphore:
+                await self._collect_host(host, sections, timeout, timings, queue)
+
+        tasks = [asyncio.ensure_future(bounded(host)) for host in self.hosts]
+        finished = asyncio.ensure_future(asyncio.gather(*tasks))
+        finished.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            if not finished.done():
+                finished.cancel()
+
+    async def collect(self, sections=None, timeout=60, timings=False):
+        """Collects from every host and returns {host: info}, or {host: error string} for failed hosts."""
+        dataset = {host: {} for host in self.hosts}
+        async for host, section, data in self.stream(sections, timeout, timings):
+            if section is None:
+                dataset[host] = data
+            else:
+                dataset[host][section] = data
+        return dataset
+
+
+def collect_fleet(hosts, sections=None, transport="ssh", concurrency=DEFAULT_CONCURRENCY,
+                  timeout=60, host_timeout=DEFAULT_HOST_TIMEOUT):
+    """Collects the requested sections from every host (one round) and returns {host: info}."""
+    async def run():
+        async with FleetPool(hosts, transport, concurrency, host_timeout) as pool:
+            return await pool.collect(sections, timeout)
+    return asyncio.run(run())
@@ -0,0 +1,113 @@
+"""Machine-readable serializers for the info dict: compact JSON, NDJSON and MessagePack.
+
+    json     one compact JSON document
+    ndjson   one {"section": ..., "data": ...} line per section, written as each finishes
+    msgpack  one MessagePack map (https://msgpack.org/), or one per section when streamed
+
+Values that aren't JSON types (there shouldn't be any, but collectors return whatever
+their platform hands them) are written as their str().
+"""
+import json
+import struct
+
+FORMATS = ('text', 'json', 'ndjson', 'msgpack')
+
+
+def to_json(info):
+    """Returns `info` as compact JSON text."""
+    return json.dumps(info, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def iter_ndjson(pairs):
+    """Yields an NDJSON line (with the newline) for each (section, data) pair as it arrives.
+
+    Feed it core.iter_collect() to stream sections as their collectors finish.
+    """
+    for section, data in pairs:
+        yield to_json({'section': section, 'data': data}) + "\n"
+
+
+def _pack(value, out):
+    """Appends the MessagePack encoding of `value` to the bytearray `out`."""
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)  # positive fixint
+        elif -0x20 <= value < 0:
+            out.append(value & 0xff)  # negative fixint
+        elif 0 <= value <= 0xff:
+            out += struct.pack(">BB", 0xcc, value)
+        elif 0 <= value <= 0xffff:
+            out += struct.pack(">BH", 0xcd, value)
+        elif 0 <= value <= 0xffffffff:
+            out += struct.pack(">BI", 0xce, value)
+        elif 0 <= value <= 0xffffffffffffffff:
+            out += struct.pack(">BQ", 0xcf, value)
+        elif -0x80 <= value < 0:
+            out += struct.pack(">Bb", 0xd0, value)
+        elif -0x8000 <= value < 0:
+            out += struct.pack(">Bh", 0xd1, value)
+        elif -0x80000000 <= value < 0:
+            out += struct.pack(">Bi", 0xd2, value)
+        elif -0x8000000000000000 <= value < 0:
+            out += struct.pack(">Bq", 0xd3, value)
+        else:
+            _pack(str(value), out)  # out of MessagePack's range
+    elif isinstance(value, float):
+        out += struct.pack(">Bd", 0xcb, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8", "surrogateescape")
+        size = len(data)
+        if size < 32:
+            out.append(0xa0 | size)
+        elif size <= 0xff:
+            out += struct.pack(">BB", 0xd9, size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xda, size)
+        else:
+            out += struct.pack(">BI", 0xdb, size)
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        if size <= 0xff:
+            out += struct.pack(">BB", 0xc4, size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xc5, size)
+        else:
+            out += struct.pack(">BI", 0xc6, size)
+        out += value
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xde, size)
+        else:
+            out += struct.pack(">BI", 0xdf, size)
+        for key, item in value.items():
+            _pack(key if isinstance(key, str) else str(key), out)
+            _pack(item, out)
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xdc, size)
+        else:
+            out += struct.pack(">BI", 0xdd, size)
+        for item in value:
+            _pack(item, out)
+    else:
+        _pack(str(value), out)
+
+
+def to_msgpack(value):
+    """Returns `value` (the info dict, a section or a watch sample) encoded as MessagePack bytes."""
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
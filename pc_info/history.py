@@ -0,0 +1,253 @@
+"""History store: volatile metrics appended as fixed-width columns and queried through mmap.
+
+    history = History()                        # ~/.cache/pc-info/history/
+    history.append(info_metrics(pc_info.collect()))
+    for sample in pc_info.watch_samples(1):
+        history.append(sample_metrics(sample), sample['timestamp'])
+
+    history.query('memory.free_gb', start=time.time() - 3600)       # ([timestamps], [values])
+    history.downsample('memory.free_gb', step=60)                   # [{'start', 'count', 'min', 'max', 'avg'}]
+
+Each metric is one file of native int64 ('q') or float64 ('d') values, one per row,
+next to a float64 timestamp column; columns.json maps metric names to their files.
+Appending a row writes 8 bytes per column (a week of 1-second samples is about
+4.8 MB per metric), and queries map the files and bisect the timestamp column, so
+only the rows in range are ever read. A metric missing from a row is stored as
+NaN (float columns) or MISSING_INT (int columns) and skipped by queries.
+
+Rows must be appended in timestamp order, by one writer at a time.
+"""
+import array
+import bisect
+import json
+import math
+import mmap
+import os
+import re
+import time
+
+from .cache import FACT_CLASSES
+
+MISSING_INT = -(1 << 63)
+TIMESTAMPS = "timestamp"
+
+# Watch sample fields that are per-IRQ or per-interface detail rather than one metric each.
+_SAMPLE_SKIP = frozenset({'timestamp', 'interval', 'irq_per_sec', 'irq_per_cpu_per_sec', 'network_per_sec',
+                          'disk_io'})
+
+
+def default_history_dir():
+    """Per-user history location, next to the fact cache."""
+    from .cache import default_cache_path
+    return os.path.join(os.path.dirname(default_cache_path()), "history")
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def info_metrics(info):
+    """Returns {'section.field': number} for the volatile numeric fields of an info dict."""
+    metrics = {}
+    for section, (_, overrides) in FACT_CLASSES.items():
+        data = info.get(section)
+        if not isinstance(data, dict):
+            continue
+        for field, fact_class in overrides.items():
+            if fact_class == 'volatile' and _is_number(data.get(field)):
+                metrics[f"{section}.{field}"] = data[field]
+    return metrics
+
+
+def sample_metrics(sample, prefix="watch"):
+    """Returns {'watch.name': number} for a watch sample: rates, memory and per-CPU utilization."""
+    metrics = {}
+
+    def flatten(value, name):
+        for key, item in value.items():
+            if key in _SAMPLE_SKIP:
+                continue
+            if isinstance(item, dict):
+                flatten(item, f"{name}.{key}")
+            elif _is_number(item):
+                metrics[f"{name}.{key}"] = item
+
+    flatten(sample, prefix)
+    return metrics
+
+
+def _reduce(values, is_int):
+    """{'count', 'min', 'max', 'avg'} of a column slice, skipping missing values; None if all are missing."""
+    if is_int:
+        if min(values) == MISSING_INT:
+            values = [v for v in values if v != MISSING_INT]
+        total = sum(values)
+    else:
+        total = sum(values)
+        if math.isnan(total):  # only then is it worth looking for the NaNs
+            values = [v for v in values if v == v]
+            total = sum(values)
+    if not len(values):
+        return None
+    return {'count': len(values), 'min': min(values), 'max': max(values), 'avg': total / len(values)}
+
+
+class _Column:
+    """A read-only mmap of one column file, viewed as an array of its type."""
+
+    def __init__(self, path, typecode, rows):
+        self.values = ()
+        self._map = None
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        size -= size % 8  # a torn tail left by an interrupted append is not a value
+        if size and rows:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.values = memoryview(self._map)[:size].cast(typecode)[:rows]
+
+    def close(self):
+        if self._map is not None:
+            self.values.release()
+            self._map.close()
+
+
+class History:
+    """A directory of column files; see the module docstring."""
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_history_dir()
+        self._columns = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, "columns.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, "columns.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._columns, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def metrics(self):
+        """Names of the stored metrics."""
+        return sorted(self._columns)
+
+    def __len__(self):
+        """Number of rows stored."""
+        try:
+            return os.path.getsize(self._path(TIMESTAMPS + ".f64")) // 8
+        except OSError:
+            return 0
+
+    def _column_file(self, metric, value):
+        """The (file name, typecode) of `metric`, creating the column on first sight."""
+        if metric not in self._columns:
+            typecode = 'q' if isinstance(value, int) else 'd'
+            suffix = ".i64" if typecode == 'q' else ".f64"
+            name = re.sub(r"[^A-Za-z0-9_.-]", "_", metric)
+            taken = {entry['file'] for entry in self._columns.values()} | {TIMESTAMPS + ".f64"}
+            while name + suffix in taken:
+                name += "_"
+            self._columns[metric] = {'file': name + suffix, 'type': typecode}
+            self._save_index()
+        entry = self._columns[metric]
+        return entry['file'], entry['type']
+
+    def append(self, metrics, timestamp=None):
+        """Appends one row of {metric: number} taken at `timestamp` (default: now)."""
+        timestamp = time.time() if timestamp is None else timestamp
+        os.makedirs(self.directory, exist_ok=True)
+        rows = len(self)
+        if rows:
+            with open(self._path(TIMESTAMPS + ".f64"), "rb") as f:
+                f.seek((rows - 1) * 8)
+                if timestamp < array.array('d', f.read(8))[0]:
+                    raise ValueError("History rows must be appended in timestamp order")
+        for metric in set(metrics) | set(self._columns):
+            value = metrics.get(metric)
+            if not _is_number(value):
+                if metric not in self._columns:
+                    continue
+                value = None  # "N/A" and friends are stored as missing
+            file_name, typecode = self._column_file(metric, value)
+            missing = MISSING_INT if typecode == 'q' else math.nan
+            with open(self._path(file_name), "ab") as f:
+                # Pads a column created after earlier rows, and drops what an interrupted
+                # append left beyond the last complete row, so every column stays aligned.
+                written = f.tell() // 8
+                if written > rows or f.tell() % 8:
+                    written = min(written, rows)
+                    f.truncate(written * 8)
+                column = array.array(typecode, [missing] * (rows - written))
+                if value is None:
+                    column.append(missing)
+                else:
+                    column.append(int(value) if typecode == 'q' else float(value))
+                f.write(column.tobytes())
+        # The timestamp goes last: a row only exists once its timestamp has been written.
+        with open(self._path(TIMESTAMPS + ".f64"), "ab") as f:
+            f.truncate(rows * 8)  # drops a torn tail, if any
+            f.write(array.array('d', [timestamp]).tobytes())
+
+    def _open(self, metric):
+        if metric not in self._columns:
+            raise KeyError(f"No history for metric: {metric}")
+        rows = len(self)
+        entry = self._columns[metric]
+        return (_Column(self._path(TIMESTAMPS + ".f64"), 'd', rows),
+                _Column(self._path(entry['file']), entry['type'], rows))
+
+    @staticmethod
+    def _range(timestamps, start, end):
+        lo = 0 if start is None else bisect.bisect_left(timestamps, start)
+        hi = len(timestamps) if end is None else bisect.bisect_right(timestamps, end)
+        return lo, hi
+
+    def query(self, metric, start=None, end=None):
+        """Returns ([timestamps], [values]) of `metric` between `start` and `end` (inclusive)."""
+        timestamps, column = self._open(metric)
+        try:
+            lo, hi = self._range(timestamps.values, start, end)
+            missing = MISSING_INT if self._columns[metric]['type'] == 'q' else None
+            times, values = [], []
+            with timestamps.values[lo:hi] as times_in_range, column.values[lo:hi] as values_in_range:
+                for t, value in zip(times_in_range, values_in_range):
+                    if value == value and value != missing:  # NaN != NaN
+                        times.append(t)
+                        values.append(value)
+            return times, values
+        finally:
+            timestamps.close()
+            column.close()
+
+    def downsample(self, metric, step, start=None, end=None):
+        """Aggregates `metric` into `step`-second buckets: [{'start', 'count', 'min', 'max', 'avg'}].
+
+        Buckets are aligned to multiples of `step` and empty ones are left out. Bucket
+        bounds are found by bisecting the timestamps, and each bucket is reduced with
+        min/max/sum over its slice of the mapped column.
+        """
+        timestamps, column = self._open(metric)
+        try:
+            lo, hi = self._range(timestamps.values, start, end)
+            is_int = self._columns[metric]['type'] == 'q'
+            buckets = []
+            while lo < hi:
+                bucket_start = math.floor(timestamps.values[lo] / step) * step
+                bucket_end = min(bisect.bisect_left(timestamps.values, bucket_start + step, lo, hi), hi)
+                with column.values[lo:bucket_end] as values:
+                    bucket = _reduce(values, is_int)
+                lo = bucket_end
+                if bucket is not None:
+                    buckets.append({'start': bucket_start, **bucket})
+            return buckets
+        finally:
+            timestamps.close()
+            column.close()
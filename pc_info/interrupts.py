@@ -0,0 +1,148 @@
+"""/proc/interrupts as an IRQ x CPU count matrix.
+
+The header is read once for the CPU columns; each line is then split only as far
+as its counters (the controller/device label after them may contain anything,
+digits included) and all counters are converted in one go: by NumPy into a 2-D
+uint64 array when it is installed, otherwise into a flat row-major
+array.array('Q'). Lines with a single system-wide counter (ERR, MIS) are kept
+apart from the matrix.
+
+    matrix = read_interrupts()
+    matrix.total()          # what cpu['total_interrupts'] reports
+    matrix.per_cpu()        # interrupts handled by each CPU, to spot affinity imbalance
+    matrix.row(matrix.irqs.index('LOC'))
+"""
+import array
+import operator
+
+from . import probes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_COUNTER_WRAP = 1 << 32  # the kernel's per-CPU IRQ counters are unsigned int
+
+
+class InterruptMatrix:
+    """Counts of each IRQ (row) on each CPU (column), plus the system-wide counters.
+
+    `counts` is a (len(irqs), len(cpus)) NumPy array, or a row-major array.array
+    when NumPy isn't installed; row(), per_cpu() and per_irq() work the same on both.
+    """
+
+    def __init__(self, cpus, irqs, labels, counts, system_wide):
+        self.cpus = cpus  # header names: CPU0, CPU1, ... (offline CPUs are left out)
+        self.irqs = irqs  # row names: 0, 1, ..., NMI, LOC, ...
+        self.labels = labels  # controller/device label of each row
+        self.counts = counts
+        self.system_wide = system_wide  # {name: count} for ERR, MIS, ...
+
+    def row(self, i):
+        """Counts of the i-th IRQ, one per CPU."""
+        if numpy is not None and isinstance(self.counts, numpy.ndarray):
+            return self.counts[i].tolist()
+        width = len(self.cpus)
+        return self.counts[i * width:(i + 1) * width].tolist()
+
+    def per_cpu(self):
+        """Interrupts handled by each CPU, summed over all IRQs."""
+        if numpy is not None and isinstance(self.counts, numpy.ndarray):
+            return self.counts.sum(axis=0).tolist()
+        width = len(self.cpus)
+        return [sum(self.counts[cpu::width]) for cpu in range(width)]
+
+    def per_irq(self):
+        """Count of each IRQ, summed over all CPUs, as {irq: count} including the system-wide ones."""
+        if numpy is not None and isinstance(self.counts, numpy.ndarray):
+            totals = self.counts.sum(axis=1).tolist()
+        else:
+            width = len(self.cpus)
+            totals = [sum(self.counts[i * width:(i + 1) * width]) for i in range(len(self.irqs))]
+        per_irq = dict(zip(self.irqs, totals))
+        per_irq.update(self.system_wide)
+        return per_irq
+
+    def total(self):
+        """All interrupts since boot."""
+        return int(self.counts.sum() if numpy is not None and isinstance(self.counts, numpy.ndarray)
+                   else sum(self.counts)) + sum(self.system_wide.values())
+
+    def delta(self, previous):
+        """A matrix of what happened since `previous` (IRQs that appeared since count from zero)."""
+        system_wide = {name: (count - previous.system_wide.get(name, count)) % _COUNTER_WRAP
+                       for name, count in self.system_wide.items()}
+        if previous.cpus == self.cpus and previous.irqs == self.irqs:
+            before = previous.counts
+        else:  # line the previous rows up with ours
+            zeros = [0] * len(self.cpus)
+            index = {irq: i for i, irq in enumerate(previous.irqs)}
+            rows = [previous.row(index[irq]) if irq in index and previous.cpus == self.cpus else zeros
+                    for irq in self.irqs]
+            before = _matrix([count for row in rows for count in row], len(self.irqs), len(self.cpus))
+        if numpy is not None and isinstance(self.counts, numpy.ndarray):
+            counts = (self.counts - before) % _COUNTER_WRAP  # uint64 arithmetic wraps, so this is exact
+        else:
+            counts = array.array('q', map(operator.sub, self.counts, before))
+            if counts and min(counts) < 0:
+                counts = array.array('q', (count % _COUNTER_WRAP for count in counts))
+        return InterruptMatrix(self.cpus, self.irqs, self.labels, counts, system_wide)
+
+    def as_dict(self):
+        """JSON-friendly form: {'cpus', 'irqs', 'labels', 'counts': [[...] per IRQ], 'system_wide'}."""
+        return {
+            'cpus': list(self.cpus),
+            'irqs': list(self.irqs),
+            'labels': list(self.labels),
+            'counts': [self.row(i) for i in range(len(self.irqs))],
+            'system_wide': dict(self.system_wide),
+        }
+
+
+def _matrix(values, rows, columns):
+    """Converts a flat list of counters (ints or digit strings) into the matrix storage."""
+    if numpy is not None:
+        if values and isinstance(values[0], (str, bytes)):
+            text = (b" " if isinstance(values[0], bytes) else " ").join(values)
+            flat = numpy.fromstring(text, dtype=numpy.uint64, sep=" ")
+        else:
+            flat = numpy.array(values, dtype=numpy.uint64)
+        return flat.reshape(rows, columns)
+    return array.array('Q', map(int, values))
+
+
+def parse_interrupts(data):
+    """Parses /proc/interrupts text (str or bytes) into an InterruptMatrix."""
+    lines = data.splitlines()
+    if not lines:
+        return InterruptMatrix([], [], [], _matrix([], 0, 0), {})
+    header = lines[0].split()
+    width = len(header)
+    decode = (lambda value: value.decode(errors="replace")) if isinstance(data, bytes) else (lambda value: value)
+    irqs, labels, tokens = [], [], []
+    system_wide = {}
+    for line in lines[1:]:
+        fields = line.split(None, width + 1)
+        if not fields:
+            continue
+        name = decode(fields[0].rstrip(b":" if isinstance(data, bytes) else ":"))
+        counters = fields[1:width + 1]
+        if len(counters) == width and counters[-1].isdigit():
+            tokens.extend(counters)
+            irqs.append(name)
+            labels.append(decode(fields[width + 1]).strip() if len(fields) > width + 1 else "")
+        else:  # ERR/MIS: one counter for the whole system
+            count = 0
+            for field in counters:
+                if not field.isdigit():
+                    break
+                count += int(field)
+            system_wide[name] = count
+    return InterruptMatrix([decode(cpu) for cpu in header], irqs, labels, _matrix(tokens, len(irqs), width), system_wide)
+
+
+@probes.view
+def read_interrupts():
+    """Reads and parses /proc/interrupts (once per run: treat the matrix as read-only)."""
+    return parse_interrupts(probes.read_file("/proc/interrupts"))
@@ -0,0 +1,277 @@
+"""Lazy and selective collection: only the sections and fields actually asked for are probed.
+
+    info = LazyInfo()
+    info['network']['ip_address']      # one route lookup, nothing else runs
+    info['memory']['total_gb']         # one read of /proc/meminfo: no SMBIOS table, no sudo
+    info['gpu']                        # sections without field collectors are collected whole
+
+    collect_only(['network.ip_address', 'memory.total_gb'])   # the same as a plain dict, probed concurrently
+
+Sections with FIELD_COLLECTORS on this platform come back as LazySection
+mappings: looking up a field runs the field collector that covers it, once, and
+any other field (or iterating the section) runs the full section collector.
+Other sections are collected whole on first access.
+"""
+import platform
+import threading
+from collections.abc import Mapping
+
+from .core import DEFAULT_TIMEOUT, PROBE_TIMEOUT, SECTIONS, backend, collectors_for, run_collectors
+
+# Cheap collectors of a few fields of a section, so a query for those fields needn't
+# run the whole section: (fields, backend function) per (system, section), each
+# function returning a dict of its fields (fields a host lacks are left out).
+# Sections without groups here (disks, GPU, ...) run their full collector even when
+# only one field is asked for.
+FIELD_COLLECTORS = {
+    ('Linux', 'cpu'): (
+        (('name', 'cache_size', 'architecture'), 'get_cpu_identity'),
+        (('current_clock_speed', 'current_clock_speeds', 'context_switches', 'total_interrupts',
+          'interrupts_per_cpu'), 'get_cpu_volatile'),
+        (('cores', 'threads', 'packages', 'numa_nodes', 'l2_cache_size', 'l3_cache_size', 'max_clock_speed',
+          'min_clock_speed', 'performance_cores', 'efficiency_cores', 'topology'), 'get_cpu_topology'),
+    ),
+    ('Linux', 'memory'): (
+        (('total_gb', 'total_bytes'), 'get_memory_total'),
+        (('free_gb', 'available_gb', 'used_gb', 'buffers_gb', 'cached_gb', 'swap_total_gb', 'swap_free_gb',
+          'free_bytes', 'available_bytes', 'used_bytes', 'buffers_bytes', 'cached_bytes', 'swap_total_bytes',
+          'swap_free_bytes'), 'get_memory_usage'),
+        (('vmstat',), 'get_memory_vmstat'),
+        (('numa', 'hugepages'), 'get_memory_numa'),
+        (('modules',), 'get_memory_modules'),
+    ),
+    ('Linux', 'network'): (
+        (('hostname', 'fqdn'), 'host_names'),
+        (('ip_address',), 'get_primary_address'),
+        (('mac_address', 'interfaces'), 'get_network_interfaces'),
+        (('dns_servers', 'default_gateway'), 'get_network_routing'),
+        (('traffic',), 'get_network_traffic'),
+    ),
+}
+
+
+def parse_paths(paths):
+    """Turns ['network.ip_address', 'gpu', ...] into {section: [fields] or None for all of it}, in report order."""
+    wanted = {}
+    for path in paths:
+        section, _, field = path.strip().partition(".")
+        if not section:
+            continue
+        if not field or wanted.get(section, []) is None:
+            wanted[section] = None
+        elif field not in wanted.setdefault(section, []):
+            wanted[section].append(field)
+    order = lambda name: SECTIONS.index(name) if name in SECTIONS else len(SECTIONS)
+    return {name: wanted[name] for name in sorted(wanted, key=order)}
+
+
+def _field_plan(section, fields, groups, module):
+    """[(name, collector, error_value)] of the field collectors covering `fields`, or None if some aren't covered."""
+    chosen = []
+    for field in fields:
+        group = next((group for group in groups if field in group[0]), None)
+        if group is None:
+            return None
+        if group not in chosen:
+            chosen.append(group)
+    return [(f"{section}.{','.join(names)}", getattr(module, function), lambda e, names=names: dict.fromkeys(names, e))
+            for names, function in chosen]
+
+
+def _is_error(value):
+    return isinstance(value, str) and value.startswith(("Error", "Unable"))
+
+
+def _failure(value, error_value):
+    """The error of a section that came back as its error_value placeholder (it crashed or timed out), else None."""
+    if _is_error(value):
+        return value
+    if not isinstance(value, dict):
+        return None
+    shape = error_value("")
+    if not isinstance(shape, dict) or not all(_is_error(value.get(key)) for key in shape if key != 'system'):
+        return None
+    return next(value[key] for key in shape if key != 'system')
+
+
+def _missing(value, fields, schema):
+    """The requested fields a collected section doesn't have and couldn't have: not in its `schema` (the
+    FIELD_COLLECTORS fields), or, without one, in none of its records for list sections."""
+    if isinstance(value, dict):
+        return [field for field in fields if field not in value and field not in schema]
+    records = [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+    if not records:
+        return []  # an error string, or no records to tell by
+    return [field for field in fields if field not in schema and not any(field in record for record in records)]
+
+
+def _pick(value, fields, default="N/A"):
+    """The requested fields of a collected section (`default` for those it lacks); an error string stays as it is."""
+    if isinstance(value, dict):
+        return {field: value.get(field, default) for field in fields}
+    if isinstance(value, list):  # disks: a list of records
+        return [_pick(item, fields) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def collect_only(paths, system=None, max_workers=None, timeout=DEFAULT_TIMEOUT, deadline=None,
+                 probe_timeout=PROBE_TIMEOUT):
+    """Collects just the given 'section' and 'section.field' paths: {section: value or {field: value}}.
+
+    Fields covered by FIELD_COLLECTORS are answered by those alone; a section with
+    any other field requested (and any section without field collectors, such as
+    disks or gpu) is collected in full and the fields picked from it. Everything
+    needed runs concurrently, as in core.run_collectors.
+
+    A field this host lacks is "N/A", and a section that failed or timed out gives
+    its error for every field asked of it. Raises ValueError for an unknown
+    section, or for a field the section doesn't know: one outside its
+    FIELD_COLLECTORS groups that the collected section doesn't have either.
+    """
+    wanted = parse_paths(paths)
+    system = system or platform.system()
+    module = backend(system)
+    plan, parts, error_values = [], {}, {}
+    for section, collector, error_value in collectors_for(list(wanted), system):
+        error_values[section] = error_value
+        fields = wanted[section]
+        groups = FIELD_COLLECTORS.get((system, section))
+        section_plan = _field_plan(section, fields, groups, module) if fields and groups else None
+        if section_plan is None:
+            section_plan = [(section, collector, error_value)]
+        parts[section] = [name for name, _, _ in section_plan]
+        plan += section_plan
+    results = run_collectors(plan, max_workers=max_workers, timeout=timeout, deadline=deadline,
+                             probe_timeout=probe_timeout)
+    info, unknown = {}, []
+    for section, names in parts.items():
+        if len(names) == 1 and names[0] == section:
+            value = results[section]
+        else:
+            value = {}
+            for name in names:
+                value.update(results[name])
+        if wanted[section] is not None:
+            failure = _failure(value, error_values[section])
+            if failure is None:
+                schema = {field for names, _ in FIELD_COLLECTORS.get((system, section), ()) for field in names}
+                unknown += [f"{section}.{field}" for field in _missing(value, wanted[section], schema)]
+            value = _pick(value, wanted[section], failure or "N/A")
+        info[section] = value
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return info
+
+
+class LazySection(Mapping):
+    """One section whose fields are probed on first lookup (see the module docstring)."""
+
+    def __init__(self, name, collector, error_value, groups, module, options):
+        self.name = name
+        self._collector = collector
+        self._error_value = error_value
+        self._groups = groups
+        self._module = module
+        self._options = options  # run_collectors keyword arguments
+        self._values = {}
+        self._tried = set()  # field collectors already run
+        self._full = None  # the whole section, once collected
+        self._lock = threading.Lock()
+
+    def value(self):
+        """The whole section, as its full collector returns it (collected on first call)."""
+        with self._lock:
+            if self._full is None:
+                self._full = run_collectors([(self.name, self._collector, self._error_value)], **self._options)[self.name]
+                if isinstance(self._full, dict):
+                    self._values.update(self._full)
+            return self._full
+
+    def __getitem__(self, field):
+        with self._lock:
+            if field in self._values:
+                return self._values[field]
+            if self._full is not None:
+                raise KeyError(field)
+            plan = _field_plan(self.name, [field], self._groups, self._module)
+            if plan is not None:
+                name = plan[0][0]
+                if name not in self._tried:
+                    self._tried.add(name)
+                    result = run_collectors(plan, **self._options)[name]
+                    self._values.update(result if isinstance(result, dict) else {})
+                if field in self._values:
+                    return self._values[field]
+                raise KeyError(field)  # the collector covering it says this host doesn't have it
+        full = self.value()
+        if isinstance(full, dict) and field in full:
+            return full[field]
+        raise KeyError(field)
+
+    def __iter__(self):
+        full = self.value()
+        return iter(full if isinstance(full, dict) else ())
+
+    def __len__(self):
+        full = self.value()
+        return len(full) if isinstance(full, dict) else 0
+
+    def __repr__(self):
+        state = self._full if self._full is not None else f"<{len(self._values)} field(s) probed>"
+        return f"LazySection({self.name!r}, {state!r})"
+
+
+class LazyInfo(Mapping):
+    """{section: info} over the requested sections (default: all), each collected when first looked up.
+
+    Takes the same timeout, deadline and probe_timeout as core.collect(); they apply
+    to each lookup that probes something. resolve() collects whatever hasn't been
+    yet, concurrently, and returns a plain dict like core.collect().
+    """
+
+    def __init__(self, sections=None, system=None, max_workers=None, timeout=DEFAULT_TIMEOUT, deadline=None,
+                 probe_timeout=PROBE_TIMEOUT):
+        system = system or platform.system()
+        module = backend(system)
+        self._options = {'max_workers': max_workers, 'timeout': timeout, 'deadline': deadline,
+                         'probe_timeout': probe_timeout}
+        self._collectors = collectors_for(sections, system)
+        self._values = {}
+        self._lock = threading.Lock()
+        for name, collector, error_value in self._collectors:
+            groups = FIELD_COLLECTORS.get((system, name))
+            if groups:
+                self._values[name] = LazySection(name, collector, error_value, groups, module, self._options)
+
+    def __getitem__(self, section):
+        with self._lock:
+            if section not in self._values:
+                entry = next((entry for entry in self._collectors if entry[0] == section), None)
+                if entry is None:
+                    raise KeyError(section)
+                self._values[section] = run_collectors([entry], **self._options)[section]
+            return self._values[section]
+
+    def __iter__(self):
+        return (name for name, _, _ in self._collectors)
+
+    def __len__(self):
+        return len(self._collectors)
+
+    def resolve(self):
+        """Collects every section not collected in full yet (concurrently) and returns {section: info}."""
+        with self._lock:
+            missing = [entry for entry in self._collectors if entry[0] not in self._values
+                       or (isinstance(self._values[entry[0]], LazySection) and self._values[entry[0]]._full is None)]
+            results = run_collectors(missing, **self._options) if missing else {}
+            for name, value in results.items():
+                section = self._values.get(name)
+                if isinstance(section, LazySection):
+                    with section._lock:
+                        section._full = value
+                        if isinstance(value, dict):
+                            section._values.update(value)
+                else:
+                    self._values[name] = value
+        return {name: self._values[name].value() if isinstance(self._values[name], LazySection) else self._values[name]
+                for name, _, _ in self._collectors}
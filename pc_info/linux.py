@@ -0,0 +1,426 @@
+"""Linux backend: reads /proc and /sys directly wherever the kernel exposes a fact as a file."""
+import math
+import os
+import platform
+import re
+import socket
+import struct
+
+from . import probes
+from .blockdev import describe_mounts
+from .common import get_os_info, host_names, read_sysfs  # get_os_info is re-exported as the 'os' collector
+from .diskstats import io_stats
+from .interrupts import read_interrupts
+from . import meminfo, netstats, pci
+from .parsers import parse_records
+from .privileged import privileged_facts
+from .processes import collect_processes
+from .topology import CPU_DIR, cpu_summary, current_clock_speeds, parse_cpulist, read_topology
+
+# --- Linux: read what the kernel already exposes instead of forking ip/df/dmidecode ---
+
+RTF_GATEWAY = 0x2
+
+_MOUNTINFO_ESCAPE = re.compile(r"\\([0-7]{3})")
+_CPUINFO_FIELDS = ('model name', 'cache size', 'cpu MHz')
+
+
+def _primary_ip():
+    """Source address the kernel would use to reach 1.0.0.0 (what `ip route get 1` reports).
+
+    Connecting a UDP socket only performs the route lookup, no packet is sent.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("1.0.0.0", 9))
+        return s.getsockname()[0]
+
+
+def _default_gateway():
+    """Gateway of the lowest-metric IPv4 default route in /proc/net/route, or None."""
+    best = None
+    for line in probes.read_file("/proc/net/route").splitlines()[1:]:  # skip the header
+        fields = line.split()
+        # Iface Destination Gateway Flags RefCnt Use Metric Mask ...
+        if len(fields) < 8 or fields[1] != "00000000" or fields[7] != "00000000":
+            continue
+        if not int(fields[3], 16) & RTF_GATEWAY:
+            continue
+        metric = int(fields[6])
+        if best is None or metric < best[0]:
+            best = (metric, socket.inet_ntoa(struct.pack("<L", int(fields[2], 16))))
+    return best[1] if best else None
+
+
+def _dns_servers():
+    """Nameservers systemd-resolved forwards to, falling back to /etc/resolv.conf."""
+    for path in ("/run/systemd/resolve/resolv.conf", "/etc/resolv.conf"):
+        try:
+            lines = probes.read_file(path).splitlines()
+            servers = [line.split()[1] for line in lines if line.startswith("nameserver") and len(line.split()) > 1]
+        except OSError:
+            continue
+        if servers:
+            return servers
+    return None
+
+
+def _human_size(num_bytes):
+    """Formats a byte count the way `df -h` does (powers of 1024, rounded up)."""
+    if num_bytes < 1024:
+        return str(num_bytes)
+    value = float(num_bytes)
+    for unit in "KMGTPE":
+        value /= 1024
+        if value < 10:
+            rounded = math.ceil(value * 10) / 10
+            if rounded < 10:
+                return f"{rounded:.1f}{unit}"
+        if math.ceil(value) < 1024 or unit == "E":
+            return f"{math.ceil(value)}{unit}"
+
+
+def _mounted_filesystems():
+    """Returns [(source, mount_point, size_bytes, 'major:minor')] like `df`, from /proc/self/mountinfo and statvfs.
+
+    As with df, pseudo filesystems with no blocks are skipped, only the visible (last)
+    mount of a path is reported and bind mounts of an already listed device are dropped.
+    """
+    unescape = lambda s: _MOUNTINFO_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), s)
+    by_mount_point = {}
+    for line in probes.read_file("/proc/self/mountinfo").splitlines():
+        left, _, right = line.partition(" - ")
+        fields, super_fields = left.split(), right.split()
+        if len(fields) < 5 or len(super_fields) < 2:
+            continue
+        mount_point = unescape(fields[4])
+        by_mount_point[mount_point] = (fields[2], unescape(super_fields[1]))  # later mounts shadow earlier ones
+
+    filesystems = []
+    seen_devices = set()
+    for mount_point, (device, source) in by_mount_point.items():
+        if device in seen_devices:
+            continue
+        try:
+            st = probes.statvfs(mount_point)
+        except OSError:
+            continue
+        if st.f_blocks == 0:
+            continue
+        seen_devices.add(device)
+        filesystems.append((source, mount_point, st.f_blocks * st.f_frsize, device))
+    return filesystems
+
+
+@probes.view
+def _first_cpu():
+    """Fields of the first processor block in /proc/cpuinfo (the rest are not tokenized)."""
+    records = parse_records(probes.read_file("/proc/cpuinfo"), ":", limit=1, keys=_CPUINFO_FIELDS)
+    return records[0] if records else {}
+
+
+def get_cpu_volatile(table=None):
+    """Fast-changing Linux CPU facts: current clocks, context switches and interrupts since boot.
+
+    `table` is a topology.CpuTable just read, whose frequencies are current enough.
+    """
+    cpu = {}
+    first_cpu = _first_cpu()
+    cpu['current_clock_speed'] = float(first_cpu['cpu MHz']) if 'cpu MHz' in first_cpu else "N/A"
+    if table is not None:
+        cpu['current_clock_speeds'] = [round(khz / 1000, 2) if khz else "N/A" for khz in table.cur_khz]
+    else:
+        # Per CPU, in the order of the (cached) topology table: the online CPUs.
+        cpu['current_clock_speeds'] = current_clock_speeds(parse_cpulist(read_sysfs(f"{CPU_DIR}/online")))
+    try:
+        stat_info = probes.read_file("/proc/stat")
+        ctxt_match = re.search(r"ctxt\s*(\d+)", stat_info)
+        cpu['context_switches'] = int(ctxt_match.group(1)) if ctxt_match else "N/A" #get num context switches.
+    except:
+        cpu['context_switches'] = "N/A"
+
+    try:
+        interrupts = read_interrupts()
+        cpu['total_interrupts'] = interrupts.total() #total interrupts since boot
+        cpu['interrupts_per_cpu'] = interrupts.per_cpu() #same order as the header of /proc/interrupts
+    except:
+        cpu['total_interrupts'] = "N/A"
+        cpu['interrupts_per_cpu'] = "N/A"
+    return cpu
+
+
+def get_memory_usage():
+    """Free, available, used and cached memory and swap usage, from one parse of /proc/meminfo.
+
+    used is what `free` calls used: everything but MemAvailable, the memory the
+    kernel could hand out without swapping (free plus reclaimable caches). Each
+    figure comes as <name>_gb, rounded for people, and exact as <name>_bytes.
+    """
+    fields = dict(meminfo.read_meminfo())  # a copy: the parsed view is shared by the run
+    if 'MemTotal' in fields and 'MemAvailable' in fields:
+        fields['used'] = fields['MemTotal'] - fields['MemAvailable']
+    usage = {}
+    for name, key in (('free', 'MemFree'), ('available', 'MemAvailable'), ('used', 'used'), ('buffers', 'Buffers'),
+                      ('cached', 'Cached'), ('swap_total', 'SwapTotal'), ('swap_free', 'SwapFree')):
+        usage[f"{name}_gb"] = meminfo.to_gb(fields[key]) if key in fields else "N/A"
+        usage[f"{name}_bytes"] = fields.get(key, "N/A")
+    return usage
+
+
+def get_memory_vmstat():
+    """Paging counters from /proc/vmstat (page faults, swap-ins and -outs), with rates on repeat collections."""
+    try:
+        return {'vmstat': meminfo.vmstat()}
+    except OSError as e:
+        return {'vmstat': f"Unable to read /proc/vmstat: {e}"}
+
+
+def get_memory_numa():
+    """Per-NUMA-node memory and the hugepage pools."""
+    return {'numa': meminfo.numa_nodes(), 'hugepages': meminfo.hugepage_pools()}
+
+
+def get_memory_volatile():
+    """Fast-changing Linux memory facts: usage, paging counters, per-node memory and hugepages."""
+    memory = get_memory_usage()
+    memory.update(get_memory_vmstat())
+    memory.update(get_memory_numa())
+    return memory
+
+
+def get_cpu_identity():
+    """Model name, cache size and architecture, from the first processor in /proc/cpuinfo."""
+    first_cpu = _first_cpu()
+    return {'name': first_cpu.get('model name', "Unknown"), 'cache_size': first_cpu.get('cache size', "N/A"),
+            'architecture': platform.machine()}
+
+
+def get_cpu_topology():
+    """Cores, threads, packages, NUMA nodes, shared caches and clock limits from the sysfs topology."""
+    table = read_topology()
+    if table is None:  # the same defaults as get_cpu_info
+        return {'max_clock_speed': "N/A", 'cores': "N/A", 'threads': os.cpu_count() or "N/A"}
+    return dict({'max_clock_speed': "N/A"}, **cpu_summary(table))
+
+
+def get_cpu_info():
+    """Collects CPU information."""
+
+    cpu = {}
+    try:
+        identity = get_cpu_identity()
+
+        try:
+            table = read_topology()
+        except Exception:
+            table = None
+        cpu.update(get_cpu_volatile(table))
+        cpu['cache_size'] = identity['cache_size']
+        cpu['max_clock_speed'] = "N/A"
+
+        cpu['architecture'] = identity['architecture']
+        #cores, threads, caches and clocks from the sysfs topology
+        if table is not None:
+            cpu.update(cpu_summary(table))
+        else:
+            cpu['cores'] = "N/A"
+            cpu['threads'] = os.cpu_count() or "N/A"
+        cpu['name'] = identity['name']
+
+
+    except Exception as e:
+        cpu['name'] = f"Error getting CPU info: {e}"
+    return cpu
+
+
+def get_memory_total():
+    """Installed memory as the kernel sees it."""
+    total = meminfo.read_meminfo().get('MemTotal', 0)
+    return {'total_gb': meminfo.to_gb(total), 'total_bytes': total}
+
+
+def get_memory_modules():
+    """Memory modules from the SMBIOS table (root only, see privileged.py)."""
+    smbios = privileged_facts()['smbios'] #one root-only read of the SMBIOS table, shared with motherboard
+    if isinstance(smbios, dict):
+        return {'modules': smbios['memory_devices']}
+    return {'modules': f"Unable to get memory details (SMBIOS table unreadable).  Root privileges required. Error: {smbios}"}
+
+
+def get_memory_info():
+    """Collects memory information (total, usage, swap, paging, NUMA nodes, hugepages, modules)."""
+
+    memory = {}
+    try:
+        memory.update(get_memory_total())  # in a run, /proc/meminfo is parsed once for both (a probes.view)
+        memory.update(get_memory_volatile())
+        memory.update(get_memory_modules())
+    except Exception as e:
+        memory['total_gb'] = f"Error getting memory info: {e}"
+    return memory
+
+
+def get_disk_info():
+    """Collects disk information."""
+
+    disks = []
+    try:
+        io = get_disk_io()
+        for mount in describe_mounts(_mounted_filesystems()):
+            disk_info = {'name': mount.pop('name'), 'size': _human_size(mount['size_bytes'])}
+            disk_info.update(mount)
+            disk_info.update(io.get(disk_info.get('device'), {}))
+            disks.append(disk_info)
+
+    except Exception as e:
+        disks.append(f"Error getting disk info: {e}")
+    return disks
+
+
+def get_disk_io():
+    """{'/dev/<device>': {'io': counters and performance}} for every block device, from /proc/diskstats.
+
+    get_disk_info() joins these onto the mounts by device; on their own they
+    refresh a cached disks section.
+    """
+    try:
+        return {f"/dev/{device}": {'io': stats} for device, stats in io_stats().items()}
+    except OSError:
+        return {}
+
+
+def get_primary_address():
+    """The address outgoing traffic leaves from."""
+    try:
+        return {'ip_address': _primary_ip()}
+    except OSError:
+        return {'ip_address': "Not Found"} #no route
+
+
+def get_network_routing():
+    """Default gateway and DNS servers."""
+    routing = {'dns_servers': _dns_servers() or "N/A"}
+    try:
+        routing['default_gateway'] = _default_gateway() or "N/A"
+    except OSError:
+        routing['default_gateway'] = "N/A"
+    return routing
+
+
+def get_network_interfaces():
+    """Primary MAC address, and the MAC, state, MTU and IPv4/IPv6 addresses of each interface.
+
+    Only the interfaces the interface filter accepts are listed (all by default);
+    the primary MAC is the first Ethernet one among them, by ifindex.
+    """
+    interfaces = {}
+    try:
+        table = netstats.links(netstats.active_filter())
+        listed = {index: {'name': link['name'], 'mac_address': link['mac_address'], 'state': link['state'],
+                          'mtu': link['mtu'], 'ip_address': "N/A", 'ipv4_addresses': [], 'ipv6_addresses': []}
+                  for index, link in sorted(table.items())}
+        for index, family, address in netstats.addresses(listed):
+            listed[index]['ipv4_addresses' if family == socket.AF_INET else 'ipv6_addresses'].append(address)
+        for interface in listed.values():
+            if interface['ipv4_addresses']:
+                interface['ip_address'] = interface['ipv4_addresses'][0]
+        ethernet = [link['mac_address'] for _, link in sorted(table.items())
+                    if link['type'] == netstats.ARPHRD_ETHER and link['mac_address'] not in ("N/A", "00:00:00:00:00:00")]
+        interfaces['mac_address'] = ethernet[0] if ethernet else "Not Found"
+        interfaces['interfaces'] = list(listed.values())
+    except Exception as e:
+        interfaces['mac_address'] = "Not Found"
+        interfaces['interfaces'] = f"Error getting network interfaces: {e}"
+    return interfaces
+
+
+def get_network_traffic():
+    """rx/tx bytes, packets, errors and drops per interface, with rates from the second collection on."""
+    try:
+        return {'traffic': netstats.traffic()}
+    except Exception as e:
+        return {'traffic': f"Error getting network traffic: {e}"}
+
+
+def get_network_info():
+    """Collects network information."""
+
+    network = {}
+    try:
+        network.update(host_names())
+        network.update(get_primary_address())
+        interfaces = get_network_interfaces()
+        network['mac_address'] = interfaces['mac_address']
+        network.update(get_network_routing())
+        network['interfaces'] = interfaces['interfaces']
+        network.update(get_network_traffic())
+
+    except Exception as e:
+        network['hostname'] = f"Error getting hostname: {e}"
+        network['ip_address'] = f"Error getting IP address: {e}"
+        network['mac_address'] = f"Error getting MAC address: {e}"
+    return network
+
+
+def get_gpu_info():
+    """Collects graphics card (GPU) information: every display-class PCI device (VGA, 3D or other), from sysfs."""
+
+    gpu = {}
+    try:
+        gpus = []
+        for device in pci.devices(pci.DISPLAY_CLASS):
+            base = f"{pci.PCI_DEVICES}/{device['address']}"
+            # amdgpu says how much VRAM there is; otherwise the largest BAR, which is what lspci showed
+            vram = read_sysfs(f"{base}/mem_info_vram_total")
+            largest = max((bar['size_bytes'] for bar in device['bars']), default=None)
+            if vram and vram.isdigit():
+                memory_size = pci.lspci_size(int(vram))
+            else:
+                memory_size = pci.lspci_size(largest) if largest else "Unknown"
+            driver = device['driver']
+            gpus.append({
+                'name': device['name'],
+                'type': device['class_name'],
+                'driver': driver,
+                # the module's own version where it has one (nvidia), else the driver name as lspci gave it
+                'driver_version': (read_sysfs(f"/sys/module/{driver}/version") or driver) if driver != "N/A" else "Unknown",
+                'memory_size': memory_size,
+                'revision': device['revision'],
+                'pci_address': device['address'],
+                'vendor_id': device['vendor_id'],
+                'device_id': device['device_id'],
+                'numa_node': device['numa_node'],
+            })
+        gpu['gpus'] = gpus
+
+    except Exception as e:
+        gpu['gpus'] = [f"Error getting GPU info: {e}"]
+    return gpu
+
+
+def get_motherboard_info():
+    """Collects motherboard information."""
+
+    motherboard = {}
+    try:
+        dmi = "/sys/class/dmi/id/"
+        motherboard['manufacturer'] = read_sysfs(dmi + "board_vendor") or "Unknown"
+        motherboard['product'] = read_sysfs(dmi + "board_name") or "Unknown"
+        motherboard['serial_number'] = read_sysfs(dmi + "board_serial") or "Unknown" #root only
+        motherboard['version'] = read_sysfs(dmi + "board_version") or "Unknown"
+        smbios = privileged_facts()['smbios']
+        if isinstance(smbios, dict):
+            if smbios['baseboard']:
+                motherboard.update(smbios['baseboard'])
+            motherboard['bios'] = smbios['bios'] or "Unknown"
+            motherboard['chassis'] = smbios['chassis'] or "Unknown"
+    except Exception as e:
+        motherboard = f"Error getting motherboard info: {e}"
+    return motherboard
+
+
+def get_process_info():
+    """Collects process counts and the heaviest processes by CPU, memory and disk I/O, from /proc."""
+    try:
+        return collect_processes()
+    except Exception as e:
+        return f"Error getting process info: {e}"
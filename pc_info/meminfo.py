@@ -0,0 +1,217 @@
+"""Memory, paging and NUMA facts from /proc and sysfs (Linux), each file parsed in one pass.
+
+/proc/meminfo becomes a typed map: every "kB" field in bytes, the HugePages_*
+counts as plain numbers. /proc/vmstat gives the paging counters (page faults,
+major faults, swap-ins and -outs, OOM kills); node*/meminfo the same figures per
+NUMA node; /sys/kernel/mm/hugepages the hugepage pools of every page size.
+
+    read_meminfo()['MemAvailable']       # bytes
+    sampler = VmstatSampler()
+    sampler.sample()                     # {'pgfault': ..., 'pgmajfault': ..., 'pswpin': ..., 'pswpout': ..., 'oom_kill': ...}
+    time.sleep(1)
+    sampler.sample()['pgmajfault_per_sec']
+    numa_nodes()                         # [{'node': 0, 'total_gb': ..., 'free_gb': ..., 'used_gb': ..., 'hugepages': [...]}]
+    hugepage_pools()                     # [{'size_kb': 2048, 'total': 1024, 'free': 512, 'reserved': 0, 'surplus': 0}]
+
+The sampler keeps its counters in preallocated arrays (and, when it rereads an
+open /proc/vmstat, its read buffer), so a tick in watch mode allocates nothing
+but the record it returns.
+"""
+import array
+import os
+import threading
+import time
+
+from . import probes
+from .common import read_sysfs
+
+NODE_DIR = "/sys/devices/system/node"
+HUGEPAGES_DIR = "/sys/kernel/mm/hugepages"
+
+_GB = 1024 ** 3
+
+# The /proc/vmstat counters we keep, in this order in the sampler's arrays.
+VMSTAT_FIELDS = ('pgfault', 'pgmajfault', 'pswpin', 'pswpout', 'oom_kill')
+RATE_FIELDS = tuple(f"{field}_per_sec" for field in VMSTAT_FIELDS)
+
+# Each counter is found by its line prefix rather than by splitting the ~180 lines of the file.
+_VMSTAT_KEYS = {str: tuple(f"\n{field} " for field in VMSTAT_FIELDS),
+                bytes: tuple(f"\n{field} ".encode() for field in VMSTAT_FIELDS)}
+_HUGEPAGE_FILES = (('total', 'nr_hugepages'), ('free', 'free_hugepages'), ('reserved', 'resv_hugepages'),
+                   ('surplus', 'surplus_hugepages'))
+
+
+def parse_meminfo(data):
+    """{field: bytes, or a count for fields without a unit} from /proc/meminfo or a node*/meminfo.
+
+    Node files prefix every line with "Node <n>"; the prefix is dropped.
+    """
+    fields = {}
+    for line in data.splitlines():
+        key, _, rest = line.partition(":")
+        value = rest.split()
+        if value and value[0].isdigit():
+            fields[key.rsplit(None, 1)[-1]] = int(value[0]) * 1024 if len(value) > 1 else int(value[0])
+    return fields
+
+
+@probes.view
+def read_meminfo():
+    """Reads and parses /proc/meminfo (once per run: memory fields share it)."""
+    return parse_meminfo(probes.read_file("/proc/meminfo"))
+
+
+def to_gb(value):
+    return round(value / _GB, 2)
+
+
+def parse_vmstat(data, out=None, end=None):
+    """Fills `out` (an array('q'), made if None) with the VMSTAT_FIELDS counters of /proc/vmstat text or bytes.
+
+    Only data[:end] is looked at. A counter this kernel doesn't have is -1.
+    """
+    if out is None:
+        out = array.array('q', bytes(8 * len(VMSTAT_FIELDS)))
+    end = len(data) if end is None else end
+    keys = _VMSTAT_KEYS[str if isinstance(data, str) else bytes]
+    newline = keys[0][:1]
+    for i, key in enumerate(keys):
+        if data.startswith(key[1:]):  # the first line has no newline before it
+            start = len(key) - 1
+        else:
+            start = data.find(key, 0, end)
+            if start < 0:
+                out[i] = -1
+                continue
+            start += len(key)
+        stop = data.find(newline, start, end)
+        out[i] = int(data[start:stop if stop >= 0 else end])
+    return out
+
+
+class VmstatSampler:
+    """Consecutive sample() calls give the VMSTAT_FIELDS counters plus their rates since the previous call.
+
+    Counters, previous counters and rates live in arrays made once and swapped or
+    overwritten each call; counts, rates and window hold the latest sample.
+    """
+
+    def __init__(self):
+        size = len(VMSTAT_FIELDS)
+        self.counts = array.array('q', bytes(8 * size))
+        self.rates = array.array('d', bytes(8 * size))
+        self.window = None  # seconds the rates cover; None until the second sample
+        self._previous = array.array('q', bytes(8 * size))
+        self._previous_time = None
+        self._buffer = bytearray(16384)
+
+    def _read(self, fd):
+        """Rereads an open /proc/vmstat into the reused buffer; returns how many bytes it holds."""
+        while True:
+            length = os.preadv(fd, [self._buffer], 0)
+            if length < len(self._buffer):
+                return length
+            self._buffer = bytearray(2 * len(self._buffer))  # only ever grows, once or twice
+
+    def update(self, fd=None, now=None):
+        """Takes a sample (rereading `fd` in place if given, else reading /proc/vmstat through probes).
+
+        Updates counts and, from the second call on, rates and window; returns nothing.
+        """
+        now = time.monotonic() if now is None else now
+        self._previous, self.counts = self.counts, self._previous
+        if fd is not None:
+            parse_vmstat(self._buffer, self.counts, self._read(fd))
+        else:
+            parse_vmstat(probes.read_file("/proc/vmstat"), self.counts)
+        if self._previous_time is None or now <= self._previous_time:
+            self.window = None
+        else:
+            self.window = now - self._previous_time
+            for i, count in enumerate(self.counts):
+                before = self._previous[i]
+                # a missing counter, or one that went backwards (it never should), has no rate
+                self.rates[i] = round((count - before) / self.window, 1) if count >= before >= 0 else 0.0
+        self._previous_time = now
+
+    def sample(self, fd=None):
+        """{field: count, ..., field_per_sec: rate (from the second sample on)}; missing counters are left out."""
+        self.update(fd)
+        record = {field: count for field, count in zip(VMSTAT_FIELDS, self.counts) if count >= 0}
+        if self.window is not None:
+            record.update((rate_field, rate) for rate_field, rate, count in zip(RATE_FIELDS, self.rates, self.counts)
+                          if count >= 0)
+        return record
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def vmstat():
+    """Paging counters since boot, with rates since the previous call in this process.
+
+    Like the process table and network rates, the per-second figures only appear
+    from the second collection on (watch, --serve, the library).
+    """
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = VmstatSampler()
+        return _sampler.sample()
+
+
+def _pools(directory):
+    """[{'size_kb', 'total', 'free', ...}] of the hugepages-<size>kB pools under `directory`, smallest first."""
+    try:
+        names = probes.listdir(directory)
+    except OSError:
+        return []
+    pools = []
+    for name in names:
+        size = name[len("hugepages-"):-len("kB")]
+        if not (name.startswith("hugepages-") and size.isdigit()):
+            continue
+        pool = {'size_kb': int(size)}
+        for field, filename in _HUGEPAGE_FILES:
+            value = read_sysfs(f"{directory}/{name}/{filename}")
+            if value is not None and value.isdigit():
+                pool[field] = int(value)
+        pools.append(pool)
+    pools.sort(key=lambda pool: pool['size_kb'])
+    return pools
+
+
+def hugepage_pools():
+    """The system-wide hugepage pools, one per page size: total, free, reserved and surplus pages."""
+    return _pools(HUGEPAGES_DIR)
+
+
+def numa_nodes():
+    """Per NUMA node: total, free and used memory from its meminfo, and its share of each hugepage pool.
+
+    Empty on kernels without NUMA support (no node directories).
+    """
+    try:
+        names = probes.listdir(NODE_DIR)
+    except OSError:
+        return []
+    nodes = []
+    for name in names:
+        if not (name.startswith("node") and name[4:].isdigit()):
+            continue
+        try:
+            fields = parse_meminfo(probes.read_file(f"{NODE_DIR}/{name}/meminfo"))
+        except OSError:
+            continue
+        node = {'node': int(name[4:])}
+        if 'MemTotal' in fields and 'MemFree' in fields:
+            node['total_gb'] = to_gb(fields['MemTotal'])
+            node['free_gb'] = to_gb(fields['MemFree'])
+            node['used_gb'] = to_gb(fields['MemTotal'] - fields['MemFree'])
+            node['total_bytes'], node['free_bytes'] = fields['MemTotal'], fields['MemFree']
+        node['hugepages'] = [{field: pool[field] for field in ('size_kb', 'total', 'free') if field in pool}
+                             for pool in _pools(f"{NODE_DIR}/{name}/hugepages")]
+        nodes.append(node)
+    nodes.sort(key=lambda node: node['node'])
+    return nodes
@@ -0,0 +1,270 @@
+"""Network interfaces in bulk: links, addresses and traffic counters (Linux).
+
+Everything per interface comes from three bulk sources, however many interfaces
+there are: one RTM_GETLINK netlink dump (name, MAC, MTU, operational state), one
+RTM_GETADDR dump (IPv4 and IPv6 addresses) and one read of /proc/net/dev (the
+rx/tx counters /sys/class/net/*/statistics would give one file at a time). An
+interface filter drops names before their counters are even converted, so hosts
+with thousands of veth interfaces only pay for the ones asked about.
+
+    sampler = NetSampler(interface_filter("eth*,bond*"))
+    sampler.sample()                        # {'eth0': {'rx_bytes': ..., 'tx_drops': ...}, ...}
+    time.sleep(1)
+    sampler.sample()['eth0']['rx_bytes_per_sec']
+
+    set_interface_filter("!veth*,!cali*")   # what the network section lists (also --interfaces)
+"""
+import fnmatch
+import os
+import re
+import socket
+import struct
+import threading
+import time
+
+from . import probes
+
+NETLINK_ROUTE = 0
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+RTM_NEWLINK = 16
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFLA_ADDRESS = 1
+IFLA_IFNAME = 3
+IFLA_MTU = 4
+IFLA_OPERSTATE = 16
+IFLA_EXT_MASK = 29
+RTEXT_FILTER_SKIP_STATS = 1 << 3  # leave the per-link stats blocks out of the dump: /proc/net/dev has them
+ARPHRD_ETHER = 1
+
+OPERSTATES = ("unknown", "notpresent", "down", "lowerlayerdown", "testing", "dormant", "up")  # as in sysfs
+
+# The /proc/net/dev columns we report, in this order in every counter tuple.
+FIELDS = ('rx_bytes', 'rx_packets', 'rx_errors', 'rx_drops', 'tx_bytes', 'tx_packets', 'tx_errors', 'tx_drops')
+RATE_FIELDS = tuple(f"{field}_per_sec" for field in FIELDS)
+
+_match = None  # interface filter of the network section, see set_interface_filter()
+
+
+def interface_filter(patterns):
+    """A name predicate from comma-separated globs ("eth*,!veth*": '!' excludes), None for no patterns.
+
+    A name passes if it matches any include (or there are none) and no exclude.
+    """
+    if isinstance(patterns, str):
+        patterns = patterns.split(",")
+    patterns = [pattern.strip() for pattern in patterns if pattern.strip()]
+    if not patterns:
+        return None
+    union = lambda globs: re.compile("|".join(fnmatch.translate(glob) for glob in globs)).match if globs else None
+    include = union([pattern for pattern in patterns if not pattern.startswith("!")])
+    exclude = union([pattern[1:] for pattern in patterns if pattern.startswith("!")])
+    return lambda name: (include is None or include(name) is not None) and (exclude is None or exclude(name) is None)
+
+
+def set_interface_filter(patterns):
+    """Restricts the interfaces the network section lists (and counts) to `patterns`; None for all."""
+    global _match
+    _match = interface_filter(patterns) if patterns else None
+
+
+def active_filter():
+    """The predicate set by set_interface_filter(), None when every interface is listed."""
+    return _match
+
+
+_HEADER = struct.Struct("=LH")  # nlmsghdr length and type
+_ATTRIBUTE = struct.Struct("=HH")  # rtattr length and type
+_U32 = struct.Struct("=I")
+_LINK_WANTED = frozenset({IFLA_ADDRESS, IFLA_IFNAME, IFLA_MTU, IFLA_OPERSTATE})
+
+
+def _dump(request_type, body):
+    """Yields (message type, data, offset, length) for each message of a NETLINK_ROUTE dump."""
+    unpack_header = _HEADER.unpack_from
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE) as sock:
+        sock.bind((0, 0))
+        sock.send(struct.pack("=LHHLL", 16 + len(body), request_type, NLM_F_REQUEST | NLM_F_DUMP, 1, 0) + body)
+        while True:
+            data = sock.recv(1 << 17)
+            offset = 0
+            while offset + 16 <= len(data):
+                length, msg_type = unpack_header(data, offset)
+                if msg_type == NLMSG_DONE:
+                    return
+                if msg_type == NLMSG_ERROR:
+                    errno = -struct.unpack_from("=i", data, offset + 16)[0]
+                    raise OSError(errno, os.strerror(errno))
+                yield msg_type, data, offset, length
+                if length == 0:
+                    break
+                offset += (length + 3) & ~3
+
+
+def links(match=None):
+    """{ifindex: {'name', 'type', 'mac_address', 'mtu', 'state'}} of the interfaces `match` accepts.
+
+    One RTM_GETLINK dump covers them all. The name is the first attribute the
+    kernel writes, so a link the filter rejects costs one attribute; the walk
+    over the others stops as soon as the four we want are seen.
+    """
+    # ifinfomsg (family, type, index, flags, change), then IFLA_EXT_MASK to leave the stats blocks out
+    body = struct.pack("=BxHiII", socket.AF_UNSPEC, 0, 0, 0, 0) + struct.pack("=HHI", 8, IFLA_EXT_MASK,
+                                                                              RTEXT_FILTER_SKIP_STATS)
+    unpack_attribute, wanted = _ATTRIBUTE.unpack_from, _LINK_WANTED
+    table = {}
+    for msg_type, data, offset, length in _dump(RTM_GETLINK, body):
+        if msg_type != RTM_NEWLINK:
+            continue
+        kind, index = struct.unpack_from("=Hi", data, offset + 18)
+        name = mac = mtu = state = None
+        missing = 4
+        attr, end = offset + 32, offset + length
+        while attr + 4 <= end:
+            attr_len, attr_type = unpack_attribute(data, attr)
+            if attr_len < 4:
+                break
+            if attr_type in wanted:
+                if attr_type == IFLA_IFNAME:
+                    name = data[attr + 4:attr + attr_len].rstrip(b"\0").decode(errors="replace")
+                    if match is not None and not match(name):
+                        break
+                elif attr_type == IFLA_ADDRESS:
+                    mac = ":".join(f"{byte:02x}" for byte in data[attr + 4:attr + attr_len])  # bytes.hex(sep) is 3.8+
+                elif attr_type == IFLA_MTU:
+                    mtu = _U32.unpack_from(data, attr + 4)[0]
+                else:
+                    state = data[attr + 4]
+                missing -= 1
+                if not missing:
+                    break
+            attr += (attr_len + 3) & ~3
+        if name is not None and (match is None or match(name)):
+            table[index] = {'name': name, 'type': kind, 'mac_address': mac or "N/A",
+                            'mtu': mtu if mtu is not None else "N/A",
+                            'state': OPERSTATES[state] if state is not None and state < len(OPERSTATES) else "unknown"}
+    return table
+
+
+def addresses(indexes=None):
+    """[(ifindex, family, address)] of every IPv4 and IPv6 address (of the `indexes` links only, if given).
+
+    One RTM_GETADDR dump covers both families and all interfaces.
+    """
+    unpack_attribute = _ATTRIBUTE.unpack_from
+    found = []
+    for msg_type, data, offset, length in _dump(RTM_GETADDR, struct.pack("=BBBBI", socket.AF_UNSPEC, 0, 0, 0, 0)):
+        if msg_type != RTM_NEWADDR:
+            continue
+        index = _U32.unpack_from(data, offset + 20)[0]
+        if indexes is not None and index not in indexes:
+            continue
+        family = data[offset + 16]
+        if family == socket.AF_INET:
+            size = 4
+        elif family == socket.AF_INET6:
+            size = 16
+        else:
+            continue
+        local = address = None
+        attr, end = offset + 24, offset + length
+        while attr + 4 <= end:
+            attr_len, attr_type = unpack_attribute(data, attr)
+            if attr_len < 4:
+                break
+            if attr_type == IFA_LOCAL:
+                local = data[attr + 4:attr + 4 + size]
+                break  # our own address: nothing after it matters
+            if attr_type == IFA_ADDRESS:
+                address = data[attr + 4:attr + 4 + size]
+            attr += (attr_len + 3) & ~3
+        # IFA_LOCAL is the interface's own address; IFA_ADDRESS is the peer on point-to-point links
+        raw = local or address
+        if raw is not None:
+            found.append((index, family, socket.inet_ntop(family, raw)))
+    return found
+
+
+def parse_net_dev(data, match=None):
+    """{interface: (counters in FIELDS order)} from /proc/net/dev text, only for names `match` accepts."""
+    counters = {}
+    for line in data.splitlines()[2:]:  # two header lines
+        name, _, rest = line.partition(":")
+        name = name.strip()
+        if match is not None and not match(name):
+            continue
+        columns = rest.split()
+        if len(columns) >= 16:
+            counters[name] = (int(columns[0]), int(columns[1]), int(columns[2]), int(columns[3]),
+                              int(columns[8]), int(columns[9]), int(columns[10]), int(columns[11]))
+    return counters
+
+
+def read_net_dev(match=None):
+    """Reads and parses /proc/net/dev (this network namespace's interfaces)."""
+    return parse_net_dev(probes.read_file("/proc/net/dev"), match)
+
+
+def rates(previous, current, elapsed):
+    """{interface: (per-second rates in FIELDS order)} between two parse_net_dev() results.
+
+    An interface that is new, or whose counters went backwards (it was recreated),
+    counts from zero.
+    """
+    per_sec = {}
+    for name, counts in current.items():
+        before = previous.get(name)
+        if before is None or any(now < then for now, then in zip(counts, before)):
+            before = (0,) * len(counts)
+        per_sec[name] = tuple(round((now - then) / elapsed, 1) for now, then in zip(counts, before))
+    return per_sec
+
+
+class NetSampler:
+    """Consecutive sample() calls give per-interface counters plus their rates since the previous call."""
+
+    def __init__(self, match=None):
+        self.match = match
+        self.window = None  # seconds the last sample's rates cover; None on the first
+        self._previous = None
+        self._previous_time = None
+
+    def sample(self):
+        """{interface: {field: count, ..., field_per_sec: rate (from the second sample on)}}."""
+        now = time.monotonic()
+        counters = read_net_dev(self.match)
+        per_sec = {}
+        if self._previous is not None and now > self._previous_time:
+            self.window = now - self._previous_time
+            per_sec = rates(self._previous, counters, self.window)
+        self._previous, self._previous_time = counters, now
+        traffic = {}
+        for name, counts in counters.items():
+            record = dict(zip(FIELDS, counts))
+            if name in per_sec:
+                record.update(zip(RATE_FIELDS, per_sec[name]))
+            traffic[name] = record
+        return traffic
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def traffic():
+    """Per-interface counters of the interfaces the filter accepts, with rates since the previous call.
+
+    Like the process table, rates need an earlier sample in the same process, so
+    they only appear from the second collection on (watch, --serve, the library).
+    """
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None or _sampler.match is not _match:
+            _sampler = NetSampler(_match)
+        return _sampler.sample()
@@ -0,0 +1,115 @@
+"""Single-pass parsers for the `Key=Value` / `Key: Value` text the probes return.
+
+wmic /Value, /proc/cpuinfo, /proc/meminfo, vm_stat, dmidecode, ipconfig /all and
+system_profiler all print records of key/value lines. Rather than scanning the
+whole output once per field with a regex, each output is tokenized by a single
+findall() of a precompiled pattern into one dict per record; the collectors then
+just look fields up. Separators are "=" (wmic) and ":" (everything else).
+
+Keys keep the first value seen in a record (what re.search used to find) and
+lose their trailing ipconfig-style dot leaders ("DHCP Enabled. . . . : Yes").
+"""
+import functools
+import re
+
+_NUMBER = re.compile(r"[-+]?\d+(?:\.\d+)?")
+
+
+@functools.lru_cache(maxsize=None)
+def _field_pattern(separator, indented=False, keys=None):
+    """Compiles (once per process) the line tokenizer for a separator and, optionally, a set of keys.
+
+    The pattern is run over "\\n" + text and every match starts at a newline, so the
+    regex engine skips straight from line to line and only lines worth keeping
+    produce a match. Without `indented`, a match is (blank, key, value): a blank
+    line fills blank, a field line fills key (without its dot leaders) and value
+    (with trailing whitespace still attached). With `indented` it is (title, key,
+    value), an unindented line being a block title and an indented one a field.
+    With `keys`, only those keys' lines match at all.
+    """
+    sep = re.escape(separator)
+    if keys:
+        key = "(" + "|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True)) + ")"
+    else:
+        key = rf"([^\s{sep}](?:[^{sep}\n]*[^\s{sep}.])?)"
+    field = rf"{key}[ \t.]*{sep}[ \t]*([^\n]*)"
+    if indented:
+        return re.compile(rf"\n(?:(\S[^\n]*)|[ \t]+{field})")
+    return re.compile(rf"\n(?:[ \t\r]*(?=(\n))|[ \t]*{field})")
+
+
+# The generic tokenizers are compiled at import; keyed ones on first use.
+for _separator in ("=", ":"):
+    _field_pattern(_separator)
+    _field_pattern(_separator, True)
+
+
+def parse_records(text, separator="=", limit=None, keys=None):
+    """Splits blank-line separated key/value output into a list of {key: value} records.
+
+    This is the shape of wmic /Value (one record per device) and /proc/cpuinfo (one
+    per logical CPU). Lines without the separator are ignored, and a key repeated
+    within a record keeps its first value (what re.search used to find). With
+    `limit`, parsing stops once that many records have been read, so a caller that
+    only needs the first CPU of a 256-thread /proc/cpuinfo doesn't tokenize the rest.
+    `keys` (a tuple) restricts the records to those keys.
+    """
+    pattern = _field_pattern(separator, False, keys)
+    records = []
+    record = {}
+    text = "\n" + text
+    tokens = pattern.findall(text) if limit is None else (m.groups() for m in pattern.finditer(text))
+    for blank, key, value in tokens:
+        if key:
+            if key not in record:
+                record[key] = value.rstrip()
+        elif blank and record:  # blank line: end of record
+            records.append(record)
+            if limit is not None and len(records) >= limit:
+                return records
+            record = {}
+    if record:
+        records.append(record)
+    return records
+
+
+def parse_record(text, separator=":", keys=None):
+    """Parses output that is one big record (/proc/meminfo, vm_stat, ...) into {key: value}."""
+    record = {}
+    for _, key, value in _field_pattern(separator, False, keys).findall("\n" + text):
+        if key and key not in record:
+            record[key] = value.rstrip()
+    return record
+
+
+def parse_titled_blocks(text, separator=":", keys=None):
+    """Splits output made of unindented titles over indented key/value lines into [(title, {key: value})].
+
+    This is the shape of dmidecode ("Memory Device" over "\\tSize: 32 GB") and
+    ipconfig /all ("Ethernet adapter Ethernet:" over "   IPv4 Address. . . : ...").
+    A block starts at each unindented line that follows fields; consecutive unindented
+    lines (dmidecode's "Handle 0x0040, DMI type 17" then "Memory Device") keep the last
+    one as the title. `keys` (a tuple) restricts the fields to those keys.
+    """
+    blocks = []
+    title, fields = None, {}
+    for line_title, key, value in _field_pattern(separator, True, keys).findall("\n" + text):
+        if line_title:
+            if fields:
+                blocks.append((title, fields))
+                fields = {}
+            title = line_title.rstrip().rstrip(":")
+        elif key and key not in fields:
+            fields[key] = value.rstrip()
+    if title is not None or fields:
+        blocks.append((title, fields))
+    return blocks
+
+
+def leading_number(value):
+    """Returns the number a value starts with ("3200 MT/s" -> 3200, "20480 kB" -> 20480), or None."""
+    match = _NUMBER.match(value.strip()) if value else None
+    if match is None:
+        return None
+    number = match.group(0)
+    return float(number) if "." in number else int(number)
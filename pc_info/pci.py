@@ -0,0 +1,291 @@
+"""PCI devices from sysfs, named through an indexed pci.ids (Linux).
+
+One listing of /sys/bus/pci/devices and a few small attribute files per device
+(class, IDs, revision, NUMA node, BARs from `resource`, the driver link) give
+what `lspci -v` was run for, without a fork, for every class of device: GPUs
+whether they call themselves VGA, 3D or display controllers, NICs, NVMe drives.
+
+Names come from pci.ids, but not by scanning its 1.3 MB of text: it is parsed
+once into a compact index (sorted fixed-size records per table plus the names)
+stored next to the fact cache, and later runs mmap that index and binary-search
+it, touching a handful of pages per lookup. The index is rebuilt when pci.ids
+changes.
+
+    for device in devices(DISPLAY_CLASS):
+        device['name'], device['driver'], device['numa_node'], device['bars']
+    pci_ids().device_name(0x10de, 0x20b2)     # 'GA100 [A100 SXM4 80GB]'
+"""
+import array
+import bisect
+import gzip
+import mmap
+import os
+import struct
+import threading
+
+from . import probes
+from .cache import default_cache_path
+from .common import read_sysfs
+
+PCI_DEVICES = "/sys/bus/pci/devices"
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids",
+                 "/usr/share/misc/pci.ids.gz", "/usr/share/pci.ids.gz")
+
+DISPLAY_CLASS = 0x03  # base classes, as devices() takes them
+NETWORK_CLASS = 0x02
+STORAGE_CLASS = 0x01
+
+IORESOURCE_IO = 0x100  # `resource` flags (include/linux/ioport.h)
+IORESOURCE_PREFETCH = 0x2000
+
+# Base class names for when there is no pci.ids at all.
+_BASE_CLASSES = {0x00: "Unclassified device", 0x01: "Mass storage controller", 0x02: "Network controller",
+                 0x03: "Display controller", 0x04: "Multimedia controller", 0x05: "Memory controller",
+                 0x06: "Bridge", 0x07: "Communication controller", 0x08: "Generic system peripheral",
+                 0x0c: "Serial bus controller", 0x12: "Processing accelerators"}
+
+# Index layout: header, then per kind of name a sorted array of 64-bit keys and the
+# matching array of _REFs to the names, then the names themselves (UTF-8, each stored
+# once). Keys per table:
+#   vendors     vendor
+#   devices     vendor << 16 | device
+#   subsystems  vendor << 48 | device << 32 | subvendor << 16 | subdevice
+#   classes     level << 24 | code, code being class, class.subclass or class.subclass.prog-if
+_MAGIC = b"PCIIDX1\0"
+_TABLES = ('vendors', 'devices', 'subsystems', 'classes')
+_HEADER = struct.Struct("=8sqq" + "II" * len(_TABLES))  # magic, source mtime_ns and size, (offset, count) per table
+_REF = struct.Struct("=II")  # name offset, name length
+
+
+def parse_pci_ids(data):
+    """{table: {key: name}} (see the key layout above) from the text of a pci.ids file."""
+    tables = {table: {} for table in _TABLES}
+    vendors, devices, subsystems, classes = (tables[table] for table in _TABLES)
+    in_classes = False
+    vendor = device = base = sub = None
+    for line in data.splitlines():
+        if not line or line[0] == "#":
+            continue
+        if line[0] != "\t":
+            if line.startswith("C "):
+                in_classes = True
+                code, _, name = line[2:].partition(" ")
+                base, sub = int(code, 16), None
+                classes[base] = name.strip()
+            else:
+                in_classes = False
+                code, _, name = line.partition(" ")
+                vendor, device = int(code, 16), None
+                vendors[vendor] = name.strip()
+        elif line[1] != "\t":
+            code, _, name = line[1:].partition(" ")
+            if in_classes:
+                sub = base << 8 | int(code, 16)
+                classes[1 << 24 | sub] = name.strip()
+            elif vendor is not None:
+                device = vendor << 16 | int(code, 16)
+                devices[device] = name.strip()
+        else:
+            fields = line[2:].split(None, 2)
+            if in_classes and sub is not None and len(fields) >= 2:
+                classes[2 << 24 | sub << 8 | int(fields[0], 16)] = line[2:].partition(" ")[2].strip()
+            elif not in_classes and device is not None and len(fields) == 3:
+                subsystems[device << 32 | int(fields[0], 16) << 16 | int(fields[1], 16)] = fields[2].strip()
+    return tables
+
+
+def build_index(tables, mtime_ns=0, size=0):
+    """The index file contents for parse_pci_ids() tables of a pci.ids with this mtime and size."""
+    offset = _HEADER.size
+    locations, arrays = [], []
+    for table in _TABLES:
+        locations += [offset, len(tables[table])]
+        offset += len(tables[table]) * (8 + _REF.size)
+    names, blob = {}, bytearray()
+    for table in _TABLES:
+        keys = sorted(tables[table])
+        refs = array.array("I")
+        for key in keys:
+            name = tables[table][key].encode()
+            if name not in names:
+                names[name] = offset + len(blob)
+                blob += name
+            refs += array.array("I", (names[name], len(name)))
+        arrays += [array.array("Q", keys).tobytes(), refs.tobytes()]
+    return _HEADER.pack(_MAGIC, mtime_ns, size, *locations) + b"".join(arrays) + bytes(blob)
+
+
+class PciIds:
+    """Name lookups over an index (bytes or an mmap of the index file)."""
+
+    def __init__(self, buffer):
+        fields = _HEADER.unpack_from(buffer)
+        if fields[0] != _MAGIC:
+            raise ValueError("not a pci.ids index")
+        self.source = fields[1:3]  # mtime_ns and size of the pci.ids it was built from
+        self._buffer = buffer
+        self._tables = {table: (fields[3 + 2 * i], fields[4 + 2 * i]) for i, table in enumerate(_TABLES)}
+        self._keys = {}  # table -> its keys as a memoryview of 64-bit ints, made on first lookup
+
+    def _find(self, table, key):
+        offset, count = self._tables[table]
+        keys = self._keys.get(table)
+        if keys is None:
+            keys = self._keys[table] = memoryview(self._buffer)[offset:offset + 8 * count].cast("Q")
+        i = bisect.bisect_left(keys, key)  # in C, over the keys where they lie
+        if i == count or keys[i] != key:
+            return None
+        name_offset, length = _REF.unpack_from(self._buffer, offset + 8 * count + _REF.size * i)
+        return self._buffer[name_offset:name_offset + length].decode(errors="replace")
+
+    def vendor_name(self, vendor):
+        return self._find('vendors', vendor)
+
+    def device_name(self, vendor, device):
+        return self._find('devices', vendor << 16 | device)
+
+    def subsystem_name(self, vendor, device, subvendor, subdevice):
+        return self._find('subsystems', vendor << 48 | device << 32 | subvendor << 16 | subdevice)
+
+    def class_name(self, code):
+        """Name of a 24-bit class code: the prog-if's if pci.ids has one, else the subclass's, else the class's."""
+        return (self._find('classes', 2 << 24 | code) or self._find('classes', 1 << 24 | code >> 8)
+                or self._find('classes', code >> 16))
+
+
+def index_path():
+    """Where the pci.ids index is kept: next to the fact cache."""
+    return os.path.join(os.path.dirname(default_cache_path()), "pci.ids.idx")
+
+
+def _load_index(source, path):
+    """PciIds for `source` (a pci.ids), from the index at `path`, (re)building the index if it is stale."""
+    stat = os.stat(source)
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        ids = PciIds(buffer)
+        if ids.source == (stat.st_mtime_ns, stat.st_size):
+            return ids
+        buffer.close()
+    except (OSError, ValueError, struct.error):
+        pass
+    opener = gzip.open if source.endswith(".gz") else open
+    with opener(source, "rb") as f:
+        data = f.read().decode("utf-8", "replace")
+    index = build_index(parse_pci_ids(data), stat.st_mtime_ns, stat.st_size)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(index)
+        os.replace(tmp_path, path)  # atomic, like the fact cache
+    except OSError:
+        pass  # read-only home: use the index from memory this run
+    return PciIds(index)
+
+
+_ids = None
+_ids_lock = threading.Lock()
+
+
+def pci_ids():
+    """The PciIds of this host's pci.ids, loaded once per process; None if there is no pci.ids."""
+    global _ids
+    with _ids_lock:
+        if _ids is None:
+            _ids = False
+            for source in PCI_IDS_PATHS:
+                if os.path.exists(source):
+                    try:
+                        _ids = _load_index(source, index_path())
+                    except (OSError, ValueError):
+                        continue
+                    break
+        return _ids or None
+
+
+def _hex(path):
+    value = read_sysfs(path)
+    try:
+        return int(value, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bars(address):
+    """The memory BARs of a device, from the first six lines of its `resource` file."""
+    bars = []
+    try:
+        lines = probes.read_file(f"{PCI_DEVICES}/{address}/resource").splitlines()[:6]
+    except OSError:
+        return bars
+    for index, line in enumerate(lines):
+        start, end, flags = (int(field, 16) for field in line.split()[:3])
+        if end and not flags & IORESOURCE_IO:
+            bars.append({'bar': index, 'size_bytes': end - start + 1, 'prefetchable': bool(flags & IORESOURCE_PREFETCH)})
+    return bars
+
+
+def _names(ids, vendor, device, subvendor, subdevice, code):
+    vendor_name = ids and ids.vendor_name(vendor) or f"Vendor {vendor:04x}"
+    device_name = ids and ids.device_name(vendor, device) or f"Device {device:04x}"
+    subsystem = ids and subvendor is not None and ids.subsystem_name(vendor, device, subvendor, subdevice or 0)
+    class_name = ids and ids.class_name(code) or _BASE_CLASSES.get(code >> 16, f"Class {code >> 8:04x}")
+    return vendor_name, device_name, subsystem or "Unknown", class_name
+
+
+def devices(classes=None):
+    """A record per PCI device (of the given base classes only, if any), in bus order.
+
+    Each record: address, class_id, class_name, vendor_id, device_id,
+    subsystem_vendor_id, subsystem_device_id, vendor, device, subsystem, name
+    (vendor and device, as lspci prints it), revision, driver, numa_node and bars.
+    """
+    if classes is not None:
+        classes = {classes} if isinstance(classes, int) else set(classes)
+    ids = pci_ids()
+    records = []
+    for address in probes.listdir(PCI_DEVICES):
+        base = f"{PCI_DEVICES}/{address}"
+        code = _hex(f"{base}/class")
+        if code is None or (classes is not None and code >> 16 not in classes):
+            continue
+        vendor, device = _hex(f"{base}/vendor"), _hex(f"{base}/device")
+        if vendor is None or device is None:
+            continue
+        subvendor, subdevice = _hex(f"{base}/subsystem_vendor"), _hex(f"{base}/subsystem_device")
+        vendor_name, device_name, subsystem, class_name = _names(ids, vendor, device, subvendor, subdevice, code)
+        try:
+            driver = os.path.basename(probes.readlink(f"{base}/driver"))
+        except OSError:
+            driver = "N/A"  # no driver bound
+        numa_node = read_sysfs(f"{base}/numa_node")
+        numa_node = int(numa_node) if numa_node and numa_node.lstrip("-").isdigit() else -1  # -1: no NUMA
+        revision = _hex(f"{base}/revision")
+        records.append({
+            'address': address,
+            'class_id': f"{code:06x}",
+            'class_name': class_name,
+            'vendor_id': f"{vendor:04x}",
+            'device_id': f"{device:04x}",
+            'subsystem_vendor_id': f"{subvendor:04x}" if subvendor is not None else "N/A",
+            'subsystem_device_id': f"{subdevice:04x}" if subdevice is not None else "N/A",
+            'vendor': vendor_name,
+            'device': device_name,
+            'subsystem': subsystem,
+            'name': f"{vendor_name} {device_name}",
+            'revision': f"{revision:02x}" if revision is not None else "Unknown",
+            'driver': driver,
+            'numa_node': numa_node if numa_node >= 0 else "N/A",
+            'bars': _bars(address),
+        })
+    return records
+
+
+def lspci_size(size):
+    """A BAR size the way lspci prints it: 16M, 128G."""
+    for unit in ("", "K", "M", "G", "T"):
+        if size < 1024 or size % 1024 or unit == "T":
+            return f"{size}{unit}"
+        size //= 1024
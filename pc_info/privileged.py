@@ -0,0 +1,60 @@
+"""Root-only probes, batched into one privileged call.
+
+Memory modules, board serial, BIOS and chassis details all come from the SMBIOS
+table, which only root may read. Instead of each section running its own
+dmidecode (and its own sudo), privileged_facts() gathers everything root-only in
+one place: in-process when we already are root, otherwise through a single
+`sudo -n` helper process that prints the facts as one JSON blob. It is a
+probes.view, so every section of a run shares that one call, including sections
+asking while it is still in flight.
+
+The helper is a fixed, root-owned script (HELPER, installed from the
+pc-info-privileged script at the top of the repository) that imports pc_info from
+the system's site-packages, never from wherever the caller loaded it, so sudoers
+can allow exactly that one command:
+
+    install -o root -g root -m 755 pc-info-privileged /usr/local/libexec/pc-info-privileged
+    # sudoers: alice ALL=(root) NOPASSWD: /usr/local/libexec/pc-info-privileged
+
+    facts = privileged_facts()
+    facts['smbios']['memory_devices']     # or an "Error ..." string without root
+"""
+import json
+import os
+import sys
+
+from . import probes
+from .smbios import read_smbios
+
+HELPER = "/usr/local/libexec/pc-info-privileged"
+
+def collect_as_root():
+    """The root-only facts, read in this process: {'smbios': {...} or "Error ..."}."""
+    try:
+        smbios = read_smbios()
+    except Exception as e:
+        smbios = f"Error reading SMBIOS table: {e}"
+    return {'smbios': smbios}
+
+
+def helper_command():
+    """argv that runs the installed helper (and so collect_as_root()) under `sudo -n`."""
+    return ["sudo", "-n", HELPER]
+
+
+def main():
+    """Entry point of the helper process: prints the facts as JSON."""
+    sys.stdout.write(json.dumps(collect_as_root(), default=str) + "\n")
+
+
+@probes.view
+def privileged_facts():
+    """The root-only facts of this host, one privileged call per run whichever sections ask."""
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        return collect_as_root()
+    try:
+        return json.loads(probes.run(helper_command()))
+    except Exception as e:
+        error = (f"Error running privileged helper (root, or {HELPER} installed and allowed in sudoers, "
+                 f"required): {e}")
+        return {'smbios': error}
@@ -0,0 +1,556 @@
+"""The single seam between the backends and the host.
+
+Every command, file read, directory listing, symlink lookup, registry lookup and
+statvfs call a backend makes goes through here, so probes can be recorded on one
+host and replayed on another (see benchmarks/) without touching the collectors,
+and timed (see timing()).
+
+Within a run (see sharing(); core.run_collectors opens one) each source is fetched
+at most once, however many collectors ask for it and whether or not they ask at
+the same time, and parsed views of them decorated with @view are computed once:
+adding a section that reads /proc/meminfo again costs nothing.
+
+Commands run without a shell on one asyncio event loop in a background thread,
+each in its own process group (session) with a hard timeout: PROBE_TIMEOUT or
+the caller's, cut short by the deadline of the section being collected (see
+limits()). A command that overruns has its whole process group killed and
+raises subprocess.TimeoutExpired carrying whatever it had printed, so the
+collector can report that field as timed out and return the rest.
+"""
+import asyncio
+import base64
+import contextlib
+import functools
+import os
+import shlex
+import signal
+import subprocess
+import threading
+import time
+
+KINDS = ('commands', 'files', 'registry', 'statvfs', 'dirs', 'blobs', 'links')  # blobs: binary files, base64 in fixtures
+
+PROBE_TIMEOUT = 30  # seconds a single command may run by default (None: no limit)
+
+_lock = threading.Lock()
+_replay = None  # fixture set probes are answered from while replaying
+_recording = None  # fixture set probe results are written to while recording
+_timings = None  # list probe timing records are appended to while timing
+_epoch = 0.0  # perf_counter() when timing started; record starts are relative to it
+_context = threading.local()  # .section, .deadline, .probe_timeout, .registry: set by section(), limits(), sharing()
+_loop = None  # event loop commands run on, started on first use
+
+
+def _record(kind, key, value):
+    if _recording is not None:
+        with _lock:
+            _recording[kind][key] = value
+
+
+def _outcome(error):
+    """Classifies a failed probe: timeout, permission, missing or error."""
+    if isinstance(error, subprocess.TimeoutExpired):
+        return 'timeout'
+    if isinstance(error, PermissionError):
+        return 'permission'
+    if isinstance(error, FileNotFoundError):
+        return 'missing'
+    if isinstance(error, subprocess.CalledProcessError):
+        # 126: found but not executable, 127: not found (shell and sudo conventions)
+        return {126: 'permission', 127: 'missing'}.get(error.returncode, 'error')
+    return 'error'
+
+
+@contextlib.contextmanager
+def _timed(kind, probe):
+    """Times the probe in the with-block and appends a record to the timing list, if timing.
+
+    The block may set 'exit_status', 'bytes' and 'child_cpu' (seconds) on the yielded dict.
+    """
+    if _timings is None:
+        yield {}
+        return
+    extra = {}
+    outcome = 'ok'
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield extra
+    except BaseException as e:
+        outcome = _outcome(e)
+        if isinstance(e, subprocess.CalledProcessError):
+            extra['exit_status'] = e.returncode
+        raise
+    finally:
+        wall = time.perf_counter() - start
+        cpu = time.thread_time() - cpu_start + extra.pop('child_cpu', 0.0)
+        record = {
+            'section': getattr(_context, 'section', None),
+            'kind': kind,
+            'probe': probe,
+            'start_ms': round((start - _epoch) * 1000, 3),
+            'wall_ms': round(wall * 1000, 3),
+            'cpu_ms': round(cpu * 1000, 3),
+            'exit_status': extra.get('exit_status'),
+            'bytes': extra.get('bytes', 0),
+            'outcome': outcome,
+            'thread': threading.get_ident(),
+        }
+        timings = _timings
+        if timings is not None:
+            with _lock:
+                timings.append(record)
+
+
+def _exit_code(status):
+    """os.waitstatus_to_exitcode() for Python < 3.9."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _event_loop():
+    """The event loop commands run on; a daemon thread runs it for the life of the process."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="pc-info-probes", daemon=True).start()
+            _loop = loop
+    return _loop
+
+
+class Registry:
+    """What one run has probed: each source is fetched once, whoever asks for it.
+
+    A thread asking for a source another is still fetching waits for that fetch
+    (single-flight) instead of starting its own, up to its own deadline; failures
+    are shared like results, except a timeout: a caller allowed to wait longer
+    than the fetch that timed out fetches again itself. What it hands out is
+    shared too, so treat views as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> {'done': Event, and 'result' or 'error' once done}
+
+    def fetch(self, key, function, budget=None):
+        """function()'s result, or the one already fetched (or being fetched) under `key` this run.
+
+        `budget` is the seconds this caller would give the fetch (None: no limit).
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                leader = entry is None
+                if leader:
+                    entry = self._entries[key] = {'done': threading.Event()}
+            if leader:
+                try:
+                    entry['result'] = function()
+                except BaseException as e:
+                    entry['error'] = e
+                    raise
+                finally:
+                    entry['done'].set()
+                return entry['result']
+            deadline = getattr(_context, 'deadline', None)
+            wait = round(max(0.0, deadline - time.monotonic()), 3) if deadline is not None else None
+            if not entry['done'].wait(wait):
+                name = key[1].__qualname__ if key[0] == 'view' else key[-1]
+                raise subprocess.TimeoutExpired(f"waiting for {name}", wait)
+            error = entry.get('error')
+            if error is None:
+                return entry['result']
+            if not (isinstance(error, subprocess.TimeoutExpired) and (budget is None or budget > (error.timeout or 0))):
+                raise error
+            with self._lock:  # it ran out of a shorter budget than ours: fetch again (once, whoever gets here first)
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+
+
+def _once_per_run(key, budget=lambda *args, **kwargs: _effective_timeout(None)):
+    """Decorates a probe so that, inside a run, it is made once per key(*args, **kwargs) (see Registry).
+
+    budget(*args, **kwargs) is the seconds the calling thread allows the probe.
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def probe(*args, **kwargs):
+            registry = getattr(_context, 'registry', None)
+            if registry is None:
+                return function(*args, **kwargs)
+            return registry.fetch(key(*args, **kwargs), lambda: function(*args, **kwargs), budget(*args, **kwargs))
+        return probe
+    return decorate
+
+
+def view(function):
+    """Decorates a parse of probed data (positional, hashable arguments only) so a run computes it once.
+
+        @probes.view
+        def read_meminfo():
+            return parse_meminfo(probes.read_file("/proc/meminfo"))
+
+    Outside a run it is simply called.
+    """
+    return _once_per_run(lambda *args: ('view', function, args))(function)
+
+
+def command_key(command):
+    """The string a command is recorded, replayed and timed under ("lspci -v", "dmidecode -t memory")."""
+    return command if isinstance(command, str) else " ".join(shlex.quote(arg) for arg in command)
+
+
+def _argv(command):
+    """Splits a command string into argv (Windows takes the command line as is); lists pass through."""
+    if not isinstance(command, str):
+        return list(command)
+    return command if os.name == 'nt' else shlex.split(command)
+
+
+def _spawn(argv):
+    if os.name == 'nt':
+        return subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    # Its own session, so a timeout can kill everything it started (sudo, pipes it runs, ...),
+    # and no controlling terminal for sudo & co. to prompt on.
+    return subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+
+
+def _kill(process):
+    """Kills the process's whole group and reaps it in the background (it may be stuck in the kernel)."""
+    if os.name == 'nt':
+        process.kill()
+        _event_loop().run_in_executor(None, process.wait)
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        pass  # already gone
+    asyncio.ensure_future(_reap(process, poll=0.1))
+
+
+async def _reap(process, poll=0.0005):
+    """Waits for the process without blocking the loop; returns its rusage (None on Windows)."""
+    if os.name == 'nt':
+        await asyncio.get_event_loop().run_in_executor(None, process.wait)
+        return None
+    delay = poll
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            process.returncode = _exit_code(status)
+            return usage
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.1)
+
+
+async def _read_all(process, chunks):
+    """Appends the process's stdout to `chunks` until it closes it."""
+    loop = asyncio.get_event_loop()
+    if os.name == 'nt':  # the Proactor loop can't watch anonymous pipes
+        chunks.append(await loop.run_in_executor(None, process.stdout.read))
+        return
+    fd = process.stdout.fileno()
+    os.set_blocking(fd, False)
+    closed = loop.create_future()
+
+    def readable():
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if chunk:
+            chunks.append(chunk)
+        elif not closed.done():
+            closed.set_result(None)
+
+    loop.add_reader(fd, readable)
+    try:
+        await closed
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _run_process(argv, timeout, timing):
+    """Runs argv to completion or until `timeout`; returns its output, filling in exit status and CPU time."""
+    process = _spawn(argv)
+    chunks = []
+
+    async def finish():
+        await _read_all(process, chunks)
+        return await _reap(process)
+
+    try:
+        usage = await asyncio.wait_for(finish(), timeout)
+    except asyncio.TimeoutError:
+        _kill(process)
+        raise subprocess.TimeoutExpired(command_key(argv), timeout, output=b"".join(chunks))
+    finally:
+        process.stdout.close()
+    timing['exit_status'] = process.returncode
+    if usage is not None:
+        timing['child_cpu'] = usage.ru_utime + usage.ru_stime
+    output = b"".join(chunks)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command_key(argv), output)
+    return output
+
+
+def _effective_timeout(timeout):
+    """The seconds a command may take: its own or the thread's probe timeout, cut short by the thread's deadline."""
+    if timeout is None:
+        timeout = getattr(_context, 'probe_timeout', PROBE_TIMEOUT)
+    deadline = getattr(_context, 'deadline', None)
+    if deadline is not None:
+        remaining = round(max(0.0, deadline - time.monotonic()), 3)
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    return timeout
+
+
+@_once_per_run(lambda command, timeout=None: ('commands', command_key(command)),
+               lambda command, timeout=None: _effective_timeout(timeout))
+def run(command, timeout=None):
+    """Runs a command (argv list or string, never through a shell) and returns its decoded output.
+
+    subprocess.check_output semantics: a non-zero exit raises CalledProcessError and
+    a command that can't be found FileNotFoundError. A command still running after
+    `timeout` seconds (default: see _effective_timeout) is killed along with its
+    process group and raises subprocess.TimeoutExpired with the partial output.
+    """
+    key = command_key(command)
+    with _timed('command', key) as timing:
+        if _replay is not None:
+            output = _replay['commands'].get(key)
+            if output is None:
+                raise FileNotFoundError(2, "No such file or directory", key)  # as if the command didn't exist
+            timing['exit_status'] = 0
+            timing['bytes'] = len(output)
+            return output
+        timeout = _effective_timeout(timeout)
+        if timeout is not None and timeout <= 0:
+            raise subprocess.TimeoutExpired(key, 0)  # the section's deadline has already passed
+        future = asyncio.run_coroutine_threadsafe(_run_process(_argv(command), timeout, timing), _event_loop())
+        raw = future.result()
+        timing['bytes'] = len(raw)
+        output = raw.decode(errors="replace")
+    _record('commands', key, output)
+    return output
+
+
+@_once_per_run(lambda path: ('files', path))
+def read_file(path):
+    """Returns the text contents of a file."""
+    with _timed('file', path) as timing:
+        if _replay is not None:
+            content = _replay['files'].get(path)
+            if content is None:
+                raise FileNotFoundError(2, "No such file or directory", path)
+            timing['bytes'] = len(content)
+            return content
+        with open(path) as f:
+            content = f.read()
+        timing['bytes'] = len(content)
+    _record('files', path, content)
+    return content
+
+
+@_once_per_run(lambda path: ('blobs', path))
+def read_bytes(path):
+    """Returns the raw contents of a binary file (SMBIOS tables and the like)."""
+    with _timed('file', path) as timing:
+        if _replay is not None:
+            content = _replay['blobs'].get(path)
+            if content is None:
+                raise FileNotFoundError(2, "No such file or directory", path)
+            content = base64.b64decode(content)
+            timing['bytes'] = len(content)
+            return content
+        with open(path, "rb") as f:
+            content = f.read()
+        timing['bytes'] = len(content)
+    _record('blobs', path, base64.b64encode(content).decode())
+    return content
+
+
+@_once_per_run(lambda key_path, value_name: ('registry', key_path, value_name))
+def read_registry(key_path, value_name):
+    """Returns a value under HKEY_LOCAL_MACHINE (Windows only)."""
+    name = f"{key_path}\\{value_name}"
+    with _timed('registry', name):
+        if _replay is not None:
+            if name not in _replay['registry']:
+                raise FileNotFoundError(2, "The system cannot find the file specified", name)
+            return _replay['registry'][name]
+        import winreg
+        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
+        try:
+            value = winreg.QueryValueEx(key, value_name)[0]
+        finally:
+            winreg.CloseKey(key)
+    _record('registry', name, value)
+    return value
+
+
+@_once_per_run(lambda path: ('statvfs', path))
+def statvfs(path):
+    """os.statvfs(path)."""
+    with _timed('statvfs', path):
+        if _replay is not None:
+            if path not in _replay['statvfs']:
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return os.statvfs_result(_replay['statvfs'][path])
+        result = os.statvfs(path)
+    _record('statvfs', path, list(result))
+    return result
+
+
+def listdir(path):
+    """sorted(os.listdir(path))."""
+    return list(_listdir(path))  # a copy: the run's listing is shared
+
+
+@_once_per_run(lambda path: ('dirs', path))
+def _listdir(path):
+    with _timed('listdir', path) as timing:
+        if _replay is not None:
+            if path not in _replay['dirs']:
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return list(_replay['dirs'][path])
+        names = sorted(os.listdir(path))
+        timing['bytes'] = sum(len(name) + 1 for name in names)
+    _record('dirs', path, names)
+    return names
+
+
+@_once_per_run(lambda path: ('links', path))
+def readlink(path):
+    """os.readlink(path): where a sysfs link (a device's driver, say) points."""
+    with _timed('readlink', path):
+        if _replay is not None:
+            if path not in _replay['links']:
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return _replay['links'][path]
+        target = os.readlink(path)
+    _record('links', path, target)
+    return target
+
+
+@contextlib.contextmanager
+def section(name):
+    """Tags the probes made by this thread inside the with-block with a report section, and times the section itself."""
+    previous = getattr(_context, 'section', None)
+    _context.section = name
+    try:
+        with _timed('section', name):
+            yield
+    finally:
+        _context.section = previous
+
+
+@contextlib.contextmanager
+def limits(deadline=None, probe_timeout=PROBE_TIMEOUT):
+    """Bounds the commands this thread runs inside the with-block.
+
+    `deadline` is a time.monotonic() by which every command must have finished and
+    `probe_timeout` the seconds any one command may take (None for no limit).
+    """
+    previous = (getattr(_context, 'deadline', None), getattr(_context, 'probe_timeout', PROBE_TIMEOUT))
+    _context.deadline, _context.probe_timeout = deadline, probe_timeout
+    try:
+        yield
+    finally:
+        _context.deadline, _context.probe_timeout = previous
+
+
+def active_registry():
+    """The Registry this thread's probes are shared through, or None outside a run."""
+    return getattr(_context, 'registry', None)
+
+
+@contextlib.contextmanager
+def sharing(registry=None):
+    """Makes this thread's probes inside the with-block go through `registry` (default: the current or a new one).
+
+    Every thread of one run enters it with the same registry, so each source and
+    view is fetched once for all of them; the next run starts afresh.
+    """
+    previous = getattr(_context, 'registry', None)
+    _context.registry = registry or previous or Registry()
+    try:
+        yield _context.registry
+    finally:
+        _context.registry = previous
+
+
+@contextlib.contextmanager
+def replaying(fixtures):
+    """Answers every probe from `fixtures` ({kind: {key: result}}) instead of the host."""
+    global _replay
+    previous = _replay
+    _replay = {kind: fixtures.get(kind, {}) for kind in KINDS}
+    try:
+        yield
+    finally:
+        _replay = previous
+
+
+@contextlib.contextmanager
+def recording():
+    """Records the result of every successful probe; yields the fixture set being filled in."""
+    global _recording
+    previous = _recording
+    fixtures = {kind: {} for kind in KINDS}
+    _recording = fixtures
+    try:
+        yield fixtures
+    finally:
+        _recording = previous
+
+
+@contextlib.contextmanager
+def timing():
+    """Times every probe made inside the with-block; yields the list of timing records.
+
+    Each record has the section the probe ran for, its kind ('command', 'file',
+    'listdir', 'readlink', 'registry', 'statvfs', or 'section' for a whole
+    collector), the probe itself, start_ms (since timing began), wall_ms, cpu_ms
+    (this thread plus, for commands, the child process), exit_status, bytes read
+    and an outcome: ok, timeout, permission, missing or error. A probe shared within
+    a run (see Registry) is recorded once, for the section that made it.
+    """
+    global _timings, _epoch
+    previous, previous_epoch = _timings, _epoch
+    records = []
+    _timings, _epoch = records, time.perf_counter()
+    try:
+        yield records
+    finally:
+        _timings, _epoch = previous, previous_epoch
+
+
+def chrome_trace(records):
+    """Converts timing records to Chrome trace-event JSON (load it in chrome://tracing or Perfetto)."""
+    pid = os.getpid()
+    threads = {}
+    events = []
+    for record in records:
+        tid = threads.setdefault(record['thread'], len(threads) + 1)
+        args = {key: record[key] for key in ('section', 'cpu_ms', 'exit_status', 'bytes', 'outcome')}
+        events.append({
+            'name': record['probe'] if record['kind'] != 'section' else f"section: {record['probe']}",
+            'cat': record['kind'],
+            'ph': 'X',
+            'ts': round(record['start_ms'] * 1000),
+            'dur': round(record['wall_ms'] * 1000),
+            'pid': pid,
+            'tid': tid,
+            'args': args,
+        })
+    for ident, tid in threads.items():
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': f"worker {tid}"}})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
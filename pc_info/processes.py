@@ -0,0 +1,198 @@
+"""Per-process resource accounting: what is using the hardware.
+
+On Linux a pass lists /proc with os.scandir and reads each process's stat (and
+io, where we may) with os.open/os.readv into one reused buffer: no file objects,
+no per-read allocations, about 7 syscalls a process. stat already carries what
+statm and status would add for these metrics (RSS and VM size in pages, thread
+count, state, parent), so neither is opened; the owner is that of the stat file
+itself. CPU% needs two passes: ProcessSampler keeps the CPU time of
+each process between them.
+
+    sampler = ProcessSampler()
+    sampler.sample()                  # first pass: CPU% averaged since each process started, like ps
+    time.sleep(1)
+    records = sampler.sample()        # CPU% over the last second, like top
+    top(records, 'rss_mb', 5)         # the five largest by resident memory
+    top(records, io_bytes, 5)         # ... by bytes read and written to storage
+
+Each record: {'pid', 'ppid', 'name', 'user', 'state', 'threads', 'cpu_percent',
+'rss_mb', 'vms_mb', 'read_bytes', 'write_bytes'}, "N/A" where a platform or our
+privileges don't tell. CPU% is of one CPU, so a busy multi-threaded process can
+pass 100.
+"""
+import collections
+import heapq
+import os
+import threading
+import time
+
+try:
+    import pwd
+except ImportError:  # Windows
+    pwd = None
+
+PROC = "/proc"
+TOP_N = 10  # processes listed per metric in the 'processes' section
+
+_MB = 1024 * 1024
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def io_bytes(record):
+    """Bytes a process has read and written to storage, None if unknown (a key for top())."""
+    read, write = record['read_bytes'], record['write_bytes']
+    return read + write if isinstance(read, int) and isinstance(write, int) else None
+
+
+def top(records, key, n=TOP_N):
+    """The n records with the largest `key` (a field name or a function of a record); unknown values are skipped."""
+    value = key if callable(key) else (lambda record: record.get(key))
+    ranked = ((metric, record) for record in records for metric in (value(record),)
+              if isinstance(metric, (int, float)) and not isinstance(metric, bool))
+    return [record for _, record in heapq.nlargest(n, ranked, key=lambda pair: pair[0])]
+
+
+def summarize(records, cpu_window, n=TOP_N):
+    """The 'processes' section: counts plus the top n processes by CPU, resident memory and storage I/O."""
+    threads = [record['threads'] for record in records if isinstance(record['threads'], int)]
+    return {
+        'count': len(records),
+        'threads': sum(threads) if threads else "N/A",
+        'states': dict(collections.Counter(record['state'] for record in records if record['state'] != "N/A")),
+        'cpu_window': cpu_window,  # seconds the CPU% covers, or how the platform averages it
+        'top_cpu': top(records, 'cpu_percent', n),
+        'top_memory': top(records, 'rss_mb', n),
+        'top_io': top(records, io_bytes, n),
+    }
+
+
+class ProcessSampler:
+    """Scans /proc; consecutive sample() calls give the CPU% of each process between them."""
+
+    def __init__(self, root=PROC):
+        self.root = root
+        self.window = None  # seconds the last sample's CPU% covers; None: since each process started
+        self._buffer = bytearray(4096)  # stat and io are read into this; both fit in a page
+        self._previous = {}  # pid -> (start time, CPU ticks) at the last sample
+        self._previous_time = None
+        self._io_denied = set()  # (pid, start time) of processes whose io we may not read
+        self._users = {}
+        self._euid = os.geteuid()
+
+    def _user(self, uid):
+        name = self._users.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except (KeyError, AttributeError):
+                name = str(uid)
+            self._users[uid] = name
+        return name
+
+    def _uptime(self):
+        with open(f"{self.root}/uptime", "rb") as f:
+            return float(f.read().split()[0])
+
+    def sample(self):
+        """One pass over every process: a list of records (see the module docstring)."""
+        now = time.monotonic()
+        elapsed = now - self._previous_time if self._previous_time is not None else None
+        uptime = self._uptime() if elapsed is None else None
+        previous, current = self._previous, {}
+        buffer, euid = self._buffer, self._euid
+        io_denied, still_denied = self._io_denied, set()
+        records = []
+        root = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)  # open pid files relative to it: no /proc lookup each
+        try:
+            for entry in os.scandir(root):
+                pid = entry.name
+                if not pid.isdigit():
+                    continue
+                try:
+                    fd = os.open(f"{pid}/stat", os.O_RDONLY, dir_fd=root)
+                    try:
+                        size = os.readv(fd, (buffer,))
+                        uid = os.fstat(fd).st_uid  # procfs files belong to the process's owner
+                    finally:
+                        os.close(fd)
+                except OSError:  # exited since the listing
+                    continue
+                close = buffer.rfind(b")", 0, size)  # the name may itself contain ") "
+                if close < 0:
+                    continue
+                name = buffer[buffer.find(b"(", 0, close) + 1:close].decode("utf-8", "replace")
+                fields = buffer[close + 2:size].split(None, 22)  # up to rss; the rest is never looked at
+                if len(fields) < 22:
+                    continue
+                ticks = int(fields[11]) + int(fields[12])  # utime + stime
+                started = int(fields[19])
+                identity = (pid, started)
+
+                # Others' io needs ptrace access (root, usually); a process once denied stays denied.
+                read_bytes = write_bytes = "N/A"
+                if (euid == 0 or uid == euid) and identity not in io_denied:
+                    try:
+                        fd = os.open(f"{pid}/io", os.O_RDONLY, dir_fd=root)
+                        try:
+                            size = os.readv(fd, (buffer,))
+                        finally:
+                            os.close(fd)
+                        io = buffer[:size].split(None, 12)
+                        if len(io) >= 12 and io[8] == b"read_bytes:" and io[10] == b"write_bytes:":
+                            read_bytes, write_bytes = int(io[9]), int(io[11])
+                    except PermissionError:
+                        still_denied.add(identity)
+                    except OSError:
+                        pass
+                elif identity in io_denied:
+                    still_denied.add(identity)
+
+                pid = int(pid)
+                current[pid] = (started, ticks)
+                if elapsed is None:
+                    lifetime = uptime - started / _CLOCK_TICKS
+                    cpu_percent = round(100 * ticks / _CLOCK_TICKS / lifetime, 1) if lifetime > 0 else 0.0
+                else:
+                    before = previous.get(pid)
+                    # a pid reused since the last sample is a new process: count from zero
+                    since = before[1] if before is not None and before[0] == started else 0
+                    cpu_percent = round(100 * (ticks - since) / _CLOCK_TICKS / elapsed, 1) if elapsed > 0 else 0.0
+                records.append({
+                    'pid': pid,
+                    'ppid': int(fields[1]),
+                    'name': name,
+                    'user': self._users[uid] if uid in self._users else self._user(uid),
+                    'state': chr(fields[0][0]),
+                    'threads': int(fields[17]),
+                    'cpu_percent': cpu_percent,
+                    'rss_mb': round(int(fields[21]) * _PAGE_SIZE / _MB, 1),
+                    'vms_mb': round(int(fields[20]) / _MB, 1),
+                    'read_bytes': read_bytes,
+                    'write_bytes': write_bytes,
+                })
+        finally:
+            os.close(root)
+        self._previous, self._previous_time, self.window = current, now, elapsed
+        self._io_denied = still_denied
+        return records
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def collect_processes(n=TOP_N):
+    """The 'processes' section of this (Linux) host.
+
+    The sampler lives as long as the process, so repeated collections (watch,
+    --serve, a LazyInfo held open) report CPU% over the time since the previous one;
+    a one-off run reports it averaged since each process started.
+    """
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ProcessSampler()
+        records = _sampler.sample()
+        window = round(_sampler.window, 3) if _sampler.window is not None else "since start"
+    return summarize(records, window, n)
@@ -0,0 +1,376 @@
+"""Human-readable rendering of collected info and watch samples."""
+import platform
+import time
+
+
+def _print_os(info, system):
+    print("----- System Information -----")
+    print(f"  OS: {system} {info['os']['version']} ({info['os']['architecture']})")
+    print(f"  Release: {info['os']['release']}")
+    print(f"  Hostname: {info['os']['name']}")
+
+
+def _print_cpu(info, system):
+    print("----- CPU Information -----")
+    print(f"  Name: {info['cpu']['name']}")
+    print(f"  Cores: {info['cpu'].get('cores', 'N/A')}")
+    print(f"  Threads: {info['cpu'].get('threads', 'N/A')}")
+    if 'packages' in info['cpu']:
+        print(f"  Packages: {info['cpu']['packages']}")
+        print(f"  NUMA Nodes: {info['cpu'].get('numa_nodes', 'N/A')}")
+    if 'performance_cores' in info['cpu']:
+        print(f"  Performance / Efficiency Cores: {info['cpu']['performance_cores']} / {info['cpu'].get('efficiency_cores', 0)}")
+    print(f"  Architecture: {info['cpu'].get('architecture', 'N/A')}")
+    print(f"  Current Clock Speed: {info['cpu'].get('current_clock_speed', 'N/A')} MHz")
+    print(f"  Max Clock Speed: {info['cpu'].get('max_clock_speed', 'N/A')} MHz")  # Print max clock speed
+    print(f"  L2 Cache Size: {info['cpu'].get('l2_cache_size', 'N/A')}")
+    print(f"  L3 Cache Size: {info['cpu'].get('l3_cache_size', 'N/A')}")
+    print(f"  Manufacturer: {info['cpu'].get('manufacturer', 'N/A')}")
+    print(f"  Family: {info['cpu'].get('family', 'N/A')}")
+    print(f"  Device ID: {info['cpu'].get('device_id', 'N/A')}")
+    if system == "Linux":
+      print(f" Context Switches: {info['cpu'].get('context_switches', 'N/A')}") #print linux specific info
+      print(f" Total Interrupts: {info['cpu'].get('total_interrupts', 'N/A')}")
+      per_cpu = info['cpu'].get('interrupts_per_cpu')
+      if isinstance(per_cpu, list) and per_cpu:
+          print(f" Interrupts per CPU: min {min(per_cpu)}, max {max(per_cpu)} (CPU{per_cpu.index(max(per_cpu))})")
+
+
+def _print_memory(info, system):
+    print("----- Memory Information -----")
+    print(f"  Total Memory: {info['memory']['total_gb']} GB")
+    if isinstance(info['memory'].get('modules'), list):
+        for i, module in enumerate(info['memory']['modules']):
+            print(f"  Module {i+1}:")
+            print(f"    Capacity: {module.get('capacity_gb', module.get('capacity', 'Unknown'))} GB")
+            print(f"    Speed: {module.get('speed_mhz', 'Unknown')} MHz")
+            print(f"    Manufacturer: {module.get('manufacturer', 'Unknown')}")
+            print(f"    Part Number: {module.get('part_number', 'Unknown')}")
+            print(f"    Serial Number: {module.get('serial_number', 'Unknown')}")
+            print(f"    Form Factor: {module.get('form_factor', 'Unknown')}")
+            print(f"   Location: {module.get('locator', 'Unknown')}")
+            if 'memory_type' in module:
+                 print(f"    Memory Type: {module['memory_type']}")
+            if 'configured_speed_mhz' in module:
+                print(f"  Configured Speed: {module['configured_speed_mhz']}")
+
+    else:
+        print(f"  Module Details: {info['memory'].get('modules', 'N/A')}")
+
+    if 'pagefiles' in info['memory']:
+        print("\n----- Page File Information -----")
+        if isinstance(info['memory']['pagefiles'], str):
+            print(f" {info['memory']['pagefiles']}")
+        else:
+            for pagefile in info['memory']['pagefiles']:
+                print(f" Name: {pagefile['name']}")
+                print(f"  Allocated: {pagefile['allocated_mb']} MB")
+                print(f"  Current Usage: {pagefile['current_usage_mb']} MB")
+    if system == "Darwin":
+        print("\n----- Virtual Memory (macOS) -----")
+        print(f"  Free: {info['memory'].get('vm_free_gb', 'N/A')} GB")
+        print(f"  Active: {info['memory'].get('vm_active_gb', 'N/A')} GB")
+        print(f"  Inactive: {info['memory'].get('vm_inactive_gb', 'N/A')} GB")
+        print(f"  Wired: {info['memory'].get('vm_wired_gb', 'N/A')} GB")
+
+    if system == "Linux": #Show linux memory details
+        print("\n----- Memory (Linux) -----")
+        print(f"  Free: {info['memory'].get('free_gb', 'N/A')} GB")
+        print(f"  Available: {info['memory'].get('available_gb', 'N/A')} GB")
+        print(f"  Used: {info['memory'].get('used_gb', 'N/A')} GB")
+        print(f"  Buffers/Cached: {info['memory'].get('buffers_gb', 'N/A')} / {info['memory'].get('cached_gb', 'N/A')} GB")
+        print(f"  Swap Total: {info['memory'].get('swap_total_gb', 'N/A')} GB")
+        print(f"  Swap Free: {info['memory'].get('swap_free_gb', 'N/A')} GB")
+        vmstat = info['memory'].get('vmstat')
+        if isinstance(vmstat, dict):
+            line = (f"  Paging: {vmstat.get('pgfault', 'N/A')} faults ({vmstat.get('pgmajfault', 'N/A')} major), "
+                    f"{vmstat.get('pswpin', 'N/A')} pages swapped in, {vmstat.get('pswpout', 'N/A')} out")
+            if 'pgfault_per_sec' in vmstat:
+                line += f"; now {vmstat['pgfault_per_sec']} faults/s ({vmstat['pgmajfault_per_sec']} major)"
+            print(line)
+        elif vmstat is not None:
+            print(f"  Paging: {vmstat}")
+        for node in info['memory'].get('numa') or ():
+            print(f"  NUMA Node {node['node']}: {node.get('total_gb', 'N/A')} GB, {node.get('free_gb', 'N/A')} GB free"
+                  + "".join(f", {pool['size_kb']} kB hugepages {pool.get('free', 'N/A')}/{pool.get('total', 'N/A')} free"
+                            for pool in node.get('hugepages', ()) if pool.get('total')))
+        for pool in info['memory'].get('hugepages') or ():
+            print(f"  Hugepages {pool['size_kb']} kB: {pool.get('total', 'N/A')} total, {pool.get('free', 'N/A')} free, "
+                  f"{pool.get('reserved', 'N/A')} reserved, {pool.get('surplus', 'N/A')} surplus")
+
+
+def _print_disks(info, system):
+    print("----- Disk Information -----")
+    if isinstance(info['disks'], str):
+        print(f"  {info['disks']}")
+    else:
+        for disk in info['disks']:
+            if isinstance(disk, str): #error placeholder
+                print(f"  {disk}")
+                continue
+            print(f"  Drive: {disk['name']}, Size: {disk.get('size_gb', disk.get('size', 'Unknown'))} GB")
+            print(f"    Interface: {disk.get('interface', 'Unknown')}")
+            print(f"    Media Type: {disk.get('media_type', 'Unknown')}")
+            print(f"    Model: {disk.get('model', 'Unknown')}")
+            print(f"    Serial Number: {disk.get('serial_number', 'Unknown')}")
+            if 'status' in disk:
+                print(f"    Status: {disk['status']}")
+                print(f"    Availability: {disk['availability']}")
+                print(f"    Error Description: {disk['error_description']}")
+            if 'health_info' in disk:
+                print(f" {disk['health_info']}")
+
+            if 'partitions' in disk:
+                print(f"  Partitions: {disk['partitions']}")
+            if 'index' in disk:
+                print(f" Index: {disk['index']}")
+            if 'firmware_revision' in disk:
+                print(f"  Firmware Revision: {disk['firmware_revision']}")
+            if 'bytes_per_sector' in disk:
+                print(f"  Bytes per Sector: {disk['bytes_per_sector']}")
+            if 'queue_depth' in disk:
+                print(f"  Queue Depth: {disk['queue_depth']}")
+            if 'sectors_per_track' in disk:
+                print(f"  Sectors per Track: {disk['sectors_per_track']}")
+            if 'total_cylinders' in disk:
+                print(f"   Total Cylinders: {disk['total_cylinders']}")
+            if 'total_sectors' in disk:
+                print(f" Total Sectors: {disk['total_sectors']}")
+            if 'total_tracks' in disk:
+                print(f"   Total Tracks: {disk['total_tracks']}")
+
+            if 'mount_point' in disk: #show mount
+                print(f"  Mounted on: {disk['mount_point']}")
+            io = disk.get('io')
+            if isinstance(io, dict):
+                line = f"    I/O: {io['reads']} reads, {io['writes']} writes since boot"
+                if 'util_percent' in io:
+                    line += (f"; {io['read_iops']}/{io['write_iops']} IOPS, {io['read_bytes_per_sec']}/"
+                             f"{io['write_bytes_per_sec']} B/s, latency {io['read_latency_ms']}/{io['write_latency_ms']} ms,"
+                             f" queue {io['avg_queue_depth']}, {io['util_percent']}% busy")
+                print(line)
+
+
+def _print_network(info, system):
+    print("----- Network Information -----")
+    print(f"  Hostname: {info['network']['hostname']}")
+    print(f"  FQDN: {info['network'].get('fqdn', 'N/A')}")
+    print(f"  IP Address: {info['network']['ip_address']}")
+    print(f"  MAC Address: {info['network']['mac_address']}")
+    print(f"  DNS Servers: {info['network'].get('dns_servers', 'N/A')}")
+    if 'dhcp_enabled' in info['network']: #show dhcp info
+        print(f"  DHCP Enabled: {info['network']['dhcp_enabled']}")
+    print(f"  Default Gateway: {info['network'].get('default_gateway', 'N/A')}")
+
+    if 'adapters' in info['network']:
+        print("\n----- Network Adapters -----")
+        for adapter in info['network']['adapters']:
+            print(f"  Name: {adapter['name']}")
+            print(f"  Connection-specific DNS Suffix: {adapter['connection_specific_dns_suffix']}")
+            if 'dhcp_server' in adapter:
+                print(f" DHCP Server: {adapter['dhcp_server']}")
+            if 'ip_address' in adapter:
+                print(f"IP Address: {adapter['ip_address']}")
+            if 'subnet_mask' in adapter:
+                print(f"  Subnet Mask: {adapter['subnet_mask']}")
+
+    if 'interfaces' in info['network']:
+        print("\n----- Network Interfaces -----")
+        if isinstance(info['network']['interfaces'], str): #Error handling
+            print(f" Error: {info['network']['interfaces']}")
+        else:
+            traffic = info['network'].get('traffic') if isinstance(info['network'].get('traffic'), dict) else {}
+            for interface in info['network']['interfaces']:
+                line = f"  Name: {interface['name']}, IP Address: {interface.get('ip_address', 'N/A')}"
+                if 'mac_address' in interface:
+                    line += f", MAC: {interface['mac_address']}, State: {interface.get('state', 'N/A')}, MTU: {interface.get('mtu', 'N/A')}"
+                print(line)
+                if interface.get('ipv6_addresses'):
+                    print(f"    IPv6: {', '.join(interface['ipv6_addresses'])}")
+                counters = traffic.get(interface['name'])
+                if counters:
+                    line = (f"    RX: {round(counters['rx_bytes'] / 1048576, 1)} MB, {counters['rx_packets']} packets "
+                            f"({counters['rx_errors']} errors, {counters['rx_drops']} dropped); "
+                            f"TX: {round(counters['tx_bytes'] / 1048576, 1)} MB, {counters['tx_packets']} packets "
+                            f"({counters['tx_errors']} errors, {counters['tx_drops']} dropped)")
+                    if 'rx_bytes_per_sec' in counters:
+                        line += f"; {counters['rx_bytes_per_sec']} B/s in, {counters['tx_bytes_per_sec']} B/s out"
+                    print(line)
+        if isinstance(info['network'].get('traffic'), str):
+            print(f"  Traffic: {info['network']['traffic']}")
+
+
+def _print_gpu(info, system):
+    print("----- GPU Information -----")
+    if isinstance(info['gpu']['gpus'], list):
+        for gpu in info['gpu']['gpus']:
+            if isinstance(gpu, str): #error placeholder
+                print(f"  GPU: {gpu}")
+                continue
+            print(f"  GPU: {gpu['name']}")
+            if 'ram_gb' in gpu:
+                print(f"    RAM: {gpu['ram_gb']} GB")
+            if 'driver_version' in gpu:
+                print(f"    Driver Version: {gpu['driver_version']}")
+            if 'driver_date' in gpu:
+                print(f" Driver Date: {gpu['driver_date']}")
+            if 'status' in gpu:
+                print(f"   Status: {gpu['status']}")
+            if 'dac_type' in gpu:
+                print(f"    DAC Type: {gpu['dac_type']}")
+            if 'max_refresh_rate' in gpu:
+                print(f" Max Refresh Rate: {gpu['max_refresh_rate']}")
+            if 'min_refresh_rate' in gpu:
+                print(f"   Min Refresh Rate: {gpu['min_refresh_rate']}")
+            if 'installed_display_drivers' in gpu:
+                print(f" Installed Display Drivers: {gpu['installed_display_drivers']}")
+            if 'video_mode_description' in gpu:
+                print(f" Video Mode Description: {gpu['video_mode_description']}")
+            if 'video_processor' in gpu:
+                print(f"  Video Processor: {gpu['video_processor']}")
+            if 'memory_size' in gpu:
+                print(f"  Memory Size: {gpu['memory_size']}")
+            if 'revision' in gpu:
+                print(f"  Revision: {gpu['revision']}")
+            if 'pci_address' in gpu:
+                print(f"    {gpu.get('type', 'Display controller')} at {gpu['pci_address']}, NUMA Node: {gpu.get('numa_node', 'N/A')}")
+    else:
+        print(f"  GPU: {info['gpu']['gpus']}") #print error
+
+
+def _print_motherboard(info, system):
+    print("----- Motherboard Information -----")
+    if isinstance(info['motherboard'], str): #error getting motherboard info
+        print(f"  {info['motherboard']}")
+        return
+    print(f"  Manufacturer: {info['motherboard'].get('manufacturer', 'Unknown')}")
+    print(f"  Product: {info['motherboard'].get('product', 'Unknown')}")
+    print(f"  Serial Number: {info['motherboard'].get('serial_number', 'Unknown')}")
+    print(f"  Version: {info['motherboard'].get('version', 'Unknown')}")
+    print(f"  Hosting Board: {info['motherboard'].get('hosting_board', 'Unknown')}")
+    print(f"  Powered On: {info['motherboard'].get('powered_on', 'Unknown')}")
+    print(f"  Removable: {info['motherboard'].get('removable', 'Unknown')}")
+    print(f"  Replaceable: {info['motherboard'].get('replaceable', 'Unknown')}")
+
+    if 'boot_volume' in info['motherboard']:
+        print(f"  Boot Volume: {info['motherboard']['boot_volume']}")
+    bios = info['motherboard'].get('bios')
+    if isinstance(bios, dict):
+        print(f"  BIOS: {bios.get('vendor', 'Unknown')} {bios.get('version', 'Unknown')} ({bios.get('release_date', 'Unknown')})")
+    chassis = info['motherboard'].get('chassis')
+    if isinstance(chassis, dict):
+        print(f"  Chassis: {chassis.get('type', 'Unknown')}, {chassis.get('manufacturer', 'Unknown')}, "
+              f"serial {chassis.get('serial_number', 'Unknown')}")
+
+
+
+def _print_processes(info, system):
+    print("----- Processes -----")
+    processes = info['processes']
+    if isinstance(processes, str):
+        print(f"  {processes}")
+        return
+    states = ", ".join(f"{state} {count}" for state, count in sorted(processes.get('states', {}).items()))
+    print(f"  Processes: {processes.get('count', 'N/A')}, Threads: {processes.get('threads', 'N/A')}"
+          + (f" ({states})" if states else ""))
+    window = processes.get('cpu_window')
+    for label, key, unit in ((f"Top CPU ({window}s)" if isinstance(window, (int, float)) else f"Top CPU ({window})",
+                              'top_cpu', 'cpu_percent'),
+                             ("Top Memory", 'top_memory', 'rss_mb'), ("Top Disk I/O", 'top_io', None)):
+        records = processes.get(key) or []
+        if not records:
+            continue
+        print(f"  {label}:")
+        for record in records[:5]:
+            if unit == 'cpu_percent':
+                value = f"{record['cpu_percent']}%"
+            elif unit == 'rss_mb':
+                value = f"{record['rss_mb']} MB"
+            else:
+                value = f"{round(record['read_bytes'] / 1048576, 1)} MB read, {round(record['write_bytes'] / 1048576, 1)} MB written"
+            print(f"    {record['pid']:>7} {record['name'][:16]:<16} {record.get('user', 'N/A'):<10} {value}")
+
+
+# Section printers in report order; print_pc_info skips sections that weren't collected.
+SECTION_PRINTERS = [
+    ('os', _print_os),
+    ('cpu', _print_cpu),
+    ('memory', _print_memory),
+    ('disks', _print_disks),
+    ('network', _print_network),
+    ('gpu', _print_gpu),
+    ('motherboard', _print_motherboard),
+    ('processes', _print_processes),
+]
+
+
+def print_pc_info(info):
+    """Prints the PC information in an organized manner."""
+    system = info['os']['system'] if isinstance(info.get('os'), dict) else platform.system()
+    printed = False
+    for name, printer in SECTION_PRINTERS:
+        if name not in info:
+            continue
+        if printed:
+            print()
+        printer(info, system)
+        printed = True
+
+
+def print_sample(sample):
+    """Prints one watch-mode sample."""
+    print(f"----- {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sample['timestamp']))} ({sample['interval']}s) -----")
+    print(f"  Context Switches: {sample['context_switches_per_sec']}/s")
+    print(f"  Interrupts: {sample['interrupts_per_sec']}/s")
+    print("  CPU Utilization: " + ", ".join(f"{cpu} {pct}%" for cpu, pct in sample['cpu_utilization'].items()))
+    print("  Interrupts per CPU: " + ", ".join(f"CPU{i} {rate}/s" for i, rate in enumerate(sample['irq_per_cpu_per_sec'])))
+    busiest = sorted(((rate, irq) for irq, rate in sample['irq_per_sec'].items() if rate), reverse=True)[:5]
+    if busiest:
+        print("  Busiest IRQs: " + ", ".join(f"{irq} {rate}/s" for rate, irq in busiest))
+    busiest = sorted(((rates['rx_bytes'] + rates['tx_bytes'], name, rates) for name, rates in sample['network_per_sec'].items()
+                      if rates['rx_bytes'] or rates['tx_bytes']), reverse=True)[:5]
+    print(f"  Network: {sample['network_rx_bytes_per_sec']} B/s in, {sample['network_tx_bytes_per_sec']} B/s out"
+          + (" (" + ", ".join(f"{name} {rates['rx_bytes']}/{rates['tx_bytes']}" for _, name, rates in busiest) + ")"
+             if busiest else ""))
+    busiest = sorted(((io['util_percent'], device, io) for device, io in sample['disk_io'].items()
+                      if io['read_iops'] or io['write_iops']), reverse=True)[:5]
+    if busiest:
+        print("  Busiest Disks: " + ", ".join(
+            f"{device} {io['util_percent']}% ({io['read_iops']}/{io['write_iops']} IOPS, "
+            f"{io['read_bytes_per_sec']}/{io['write_bytes_per_sec']} B/s)" for _, device, io in busiest))
+    memory = sample['memory']
+    print(f"  Memory Free: {memory['free_gb']} GB, Available: {memory['available_gb']} GB, Swap Free: {memory['swap_free_gb']} GB")
+    paging = sample.get('paging_per_sec')
+    if paging:
+        print(f"  Paging: {paging['pgfault']} faults/s ({paging['pgmajfault']} major), "
+              f"{paging['pswpin']}/{paging['pswpout']} pages/s swapped in/out")
+
+
+def print_timings(timings, limit=15):
+    """Prints where a scan spent its time: per-section wall time, then the slowest probes."""
+    sections = [t for t in timings if t['kind'] == 'section']
+    probes = sorted((t for t in timings if t['kind'] != 'section'), key=lambda t: t['wall_ms'], reverse=True)
+    print("Section Timings:")
+    for t in sorted(sections, key=lambda t: t['wall_ms'], reverse=True):
+        print(f"  {t['probe']}: {t['wall_ms']:.1f} ms wall, {t['cpu_ms']:.1f} ms CPU ({t['outcome']})")
+    print(f"Slowest Probes ({min(limit, len(probes))} of {len(probes)}):")
+    for t in probes[:limit]:
+        status = f", exit {t['exit_status']}" if t['exit_status'] not in (None, 0) else ""
+        print(f"  [{t['section'] or '-'}] {t['kind']} {t['probe']}: {t['wall_ms']:.1f} ms wall, {t['cpu_ms']:.1f} ms CPU, "
+              f"{t['bytes']} bytes, {t['outcome']}{status}")
+
+
+def print_changes(changes):
+    """Prints diff.diff() changes, one per line: + added, - removed, ~ changed."""
+    from .diff import format_path
+    if not changes:
+        print("No changes.")
+        return
+    for change in changes:
+        path = format_path(change['path'])
+        if change['op'] == 'add':
+            print(f"  + {path}: {change['value']}")
+        elif change['op'] == 'remove':
+            print(f"  - {path}: {change.get('old', '')}")
+        else:
+            print(f"  ~ {path}: {change.get('old', '?')} -> {change['value']}")
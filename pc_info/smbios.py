@@ -0,0 +1,190 @@
+"""SMBIOS decoding: BIOS, baseboard, chassis and memory devices from the raw DMI table.
+
+The kernel exposes the firmware's table as /sys/firmware/dmi/tables/DMI (root
+only). It is a run of structures, each a 4-byte header (type, length, handle),
+`length` bytes of formatted fields and a set of NUL-terminated strings closed by
+an extra NUL; string fields hold a 1-based index into that set. Reading it once
+and decoding the structures replaces running dmidecode per record type.
+
+    table = probes.read_bytes(DMI_TABLE)
+    decode(table)['memory_devices']   # [{'locator': 'DIMM_A1', 'capacity_gb': 32.0, ...}, ...]
+"""
+import struct
+
+from . import probes
+
+DMI_TABLE = "/sys/firmware/dmi/tables/DMI"
+DMI_ENTRY_POINT = "/sys/firmware/dmi/tables/smbios_entry_point"
+
+BIOS, BASEBOARD, CHASSIS, MEMORY_DEVICE, END_OF_TABLE = 0, 2, 3, 17, 127
+
+# SMBIOS 3.x enumerations (DSP0134), for the fields we report.
+CHASSIS_TYPES = {
+    0x01: "Other", 0x02: "Unknown", 0x03: "Desktop", 0x04: "Low Profile Desktop", 0x05: "Pizza Box",
+    0x06: "Mini Tower", 0x07: "Tower", 0x08: "Portable", 0x09: "Laptop", 0x0A: "Notebook", 0x0B: "Hand Held",
+    0x0C: "Docking Station", 0x0D: "All In One", 0x0E: "Sub Notebook", 0x0F: "Space-saving", 0x10: "Lunch Box",
+    0x11: "Main Server Chassis", 0x12: "Expansion Chassis", 0x13: "Sub Chassis", 0x14: "Bus Expansion Chassis",
+    0x15: "Peripheral Chassis", 0x16: "RAID Chassis", 0x17: "Rack Mount Chassis", 0x18: "Sealed-case PC",
+    0x19: "Multi-system", 0x1A: "CompactPCI", 0x1B: "AdvancedTCA", 0x1C: "Blade", 0x1D: "Blade Enclosure",
+    0x1E: "Tablet", 0x1F: "Convertible", 0x20: "Detachable", 0x21: "IoT Gateway", 0x22: "Embedded PC",
+    0x23: "Mini PC", 0x24: "Stick PC",
+}
+FORM_FACTORS = {
+    0x01: "Other", 0x02: "Unknown", 0x03: "SIMM", 0x04: "SIP", 0x05: "Chip", 0x06: "DIP", 0x07: "ZIP",
+    0x08: "Proprietary Card", 0x09: "DIMM", 0x0A: "TSOP", 0x0B: "Row Of Chips", 0x0C: "RIMM", 0x0D: "SODIMM",
+    0x0E: "SRIMM", 0x0F: "FB-DIMM", 0x10: "Die",
+}
+MEMORY_TYPES = {
+    0x01: "Other", 0x02: "Unknown", 0x03: "DRAM", 0x04: "EDRAM", 0x05: "VRAM", 0x06: "SRAM", 0x07: "RAM",
+    0x08: "ROM", 0x09: "Flash", 0x0A: "EEPROM", 0x0B: "FEPROM", 0x0C: "EPROM", 0x0D: "CDRAM", 0x0E: "3DRAM",
+    0x0F: "SDRAM", 0x10: "SGRAM", 0x11: "RDRAM", 0x12: "DDR", 0x13: "DDR2", 0x14: "DDR2 FB-DIMM",
+    0x18: "DDR3", 0x19: "FBD2", 0x1A: "DDR4", 0x1B: "LPDDR", 0x1C: "LPDDR2", 0x1D: "LPDDR3", 0x1E: "LPDDR4",
+    0x1F: "Logical non-volatile device", 0x20: "HBM", 0x21: "HBM2", 0x22: "DDR5", 0x23: "LPDDR5", 0x24: "HBM3",
+}
+
+
+def structures(table):
+    """Yields (type, handle, formatted, strings) for each structure of a raw table, up to the end-of-table marker."""
+    offset, end = 0, len(table)
+    while offset + 4 <= end:
+        kind, length, handle = struct.unpack_from("<BBH", table, offset)
+        if length < 4:
+            return  # corrupt table: nothing after this can be trusted
+        strings_start = offset + length
+        strings_end = table.find(b"\0\0", strings_start)
+        if strings_end < 0:
+            return
+        formatted = table[offset:strings_start]
+        strings = table[strings_start:strings_end].split(b"\0") if strings_end > strings_start else []
+        yield kind, handle, formatted, strings
+        if kind == END_OF_TABLE:
+            return
+        offset = strings_end + 2
+
+
+def _string(formatted, strings, offset, default="Unknown"):
+    """The string field at `offset`, stripped of the padding firmware likes to add."""
+    if offset >= len(formatted) or not 0 < formatted[offset] <= len(strings):
+        return default
+    return strings[formatted[offset] - 1].decode(errors="replace").strip() or default
+
+
+def _unpack(fmt, formatted, offset):
+    """A fixed-width field, or None for fields past the end of an older, shorter structure."""
+    if offset + struct.calcsize(fmt) > len(formatted):
+        return None
+    return struct.unpack_from(fmt, formatted, offset)[0]
+
+
+def _bios(formatted, strings):
+    bios = {
+        'vendor': _string(formatted, strings, 0x04),
+        'version': _string(formatted, strings, 0x05),
+        'release_date': _string(formatted, strings, 0x08),
+    }
+    rom_size = _unpack("<B", formatted, 0x09)
+    if rom_size == 0xFF:  # 64 KB units no longer fit: extended size, bits 14-15 choosing MB or GB
+        extended = _unpack("<H", formatted, 0x18) or 0
+        bios['rom_size_kb'] = (extended & 0x3FFF) * (1024 if extended >> 14 == 0 else 1024 * 1024)
+    elif rom_size is not None:
+        bios['rom_size_kb'] = (rom_size + 1) * 64
+    major, minor = _unpack("<B", formatted, 0x14), _unpack("<B", formatted, 0x15)
+    if major not in (None, 0xFF) and minor not in (None, 0xFF):
+        bios['revision'] = f"{major}.{minor}"
+    return bios
+
+
+def _baseboard(formatted, strings):
+    return {
+        'manufacturer': _string(formatted, strings, 0x04),
+        'product': _string(formatted, strings, 0x05),
+        'version': _string(formatted, strings, 0x06),
+        'serial_number': _string(formatted, strings, 0x07),
+        'asset_tag': _string(formatted, strings, 0x08),
+    }
+
+
+def _chassis(formatted, strings):
+    kind = _unpack("<B", formatted, 0x05)
+    return {
+        'manufacturer': _string(formatted, strings, 0x04),
+        'type': CHASSIS_TYPES.get(kind & 0x7F, "Unknown") if kind is not None else "Unknown",  # bit 7: lock present
+        'version': _string(formatted, strings, 0x06),
+        'serial_number': _string(formatted, strings, 0x07),
+        'asset_tag': _string(formatted, strings, 0x08),
+    }
+
+
+def _memory_size_mb(formatted):
+    """Module size in MB, 0 for an empty slot, None if unknown."""
+    size = _unpack("<H", formatted, 0x0C)
+    if size is None or size == 0xFFFF:
+        return None
+    if size == 0x7FFF:  # 32 GB or more: the extended size field holds MB
+        extended = _unpack("<I", formatted, 0x1C)
+        return extended & 0x7FFFFFFF if extended is not None else None
+    return (size & 0x7FFF) / 1024 if size & 0x8000 else size  # bit 15 set: KB units
+
+
+def _speed(formatted, offset, extended_offset):
+    """MT/s from a speed word, or the extended speed dword it points to; "Unknown" for 0."""
+    speed = _unpack("<H", formatted, offset)
+    if speed == 0xFFFF:
+        speed = _unpack("<I", formatted, extended_offset)
+    return speed or "Unknown"
+
+
+def _memory_device(formatted, strings, size_mb):
+    return {
+        'capacity_gb': round(size_mb / 1024, 2) if size_mb is not None else "Unknown",
+        'speed_mhz': _speed(formatted, 0x15, 0x54),
+        'configured_speed_mhz': _speed(formatted, 0x20, 0x58),
+        'manufacturer': _string(formatted, strings, 0x17),
+        'part_number': _string(formatted, strings, 0x1A),
+        'serial_number': _string(formatted, strings, 0x18),
+        'form_factor': FORM_FACTORS.get(_unpack("<B", formatted, 0x0E), "Unknown"),
+        'memory_type': MEMORY_TYPES.get(_unpack("<B", formatted, 0x12), "Unknown"),
+        'locator': _string(formatted, strings, 0x10),
+        'bank_locator': _string(formatted, strings, 0x11),
+    }
+
+
+def decode(table):
+    """Decodes a raw DMI table into {'bios', 'baseboard', 'chassis', 'memory_slots', 'memory_devices'}.
+
+    The first BIOS, baseboard and chassis records are reported (None when the
+    firmware has none); memory_devices lists the populated slots only.
+    """
+    info = {'bios': None, 'baseboard': None, 'chassis': None, 'memory_slots': 0, 'memory_devices': []}
+    for kind, _, formatted, strings in structures(table):
+        if kind == BIOS and info['bios'] is None:
+            info['bios'] = _bios(formatted, strings)
+        elif kind == BASEBOARD and info['baseboard'] is None:
+            info['baseboard'] = _baseboard(formatted, strings)
+        elif kind == CHASSIS and info['chassis'] is None:
+            info['chassis'] = _chassis(formatted, strings)
+        elif kind == MEMORY_DEVICE:
+            info['memory_slots'] += 1
+            size_mb = _memory_size_mb(formatted)
+            if size_mb != 0:
+                info['memory_devices'].append(_memory_device(formatted, strings, size_mb))
+    return info
+
+
+def entry_point_version(entry_point):
+    """SMBIOS version ("3.3.0") from the entry point structure, None if unrecognized."""
+    if entry_point[:5] == b"_SM3_" and len(entry_point) >= 10:
+        return f"{entry_point[7]}.{entry_point[8]}.{entry_point[9]}"
+    if entry_point[:4] == b"_SM_" and len(entry_point) >= 8:
+        return f"{entry_point[6]}.{entry_point[7]}"
+    return None
+
+
+def read_smbios():
+    """Reads and decodes this host's SMBIOS table (needs root), with its version under 'version'."""
+    info = decode(probes.read_bytes(DMI_TABLE))
+    try:
+        info['version'] = entry_point_version(probes.read_bytes(DMI_ENTRY_POINT)) or "Unknown"
+    except OSError:
+        info['version'] = "Unknown"
+    return info
@@ -0,0 +1,243 @@
+"""Linux CPU topology from sysfs: package, core, NUMA node, shared caches and frequencies of every logical CPU.
+
+The kernel describes sharing as CPU lists (topology/thread_siblings_list,
+cache/index*/shared_cpu_list, node*/cpulist, cpufreq/policy*/related_cpus), so
+each list is read once for the whole group it describes, for the first CPU of the
+group not yet placed. A scan costs a few reads per core, cache instance, NUMA
+node and frequency policy rather than a dozen per logical CPU, which keeps it
+fast at 512+ CPUs. The result is one array.array column per attribute.
+"""
+import array
+
+from . import probes
+from .common import read_sysfs
+
+CPU_DIR = "/sys/devices/system/cpu"
+NODE_DIR = "/sys/devices/system/node"
+
+# Values of CpuTable.core_type. Hybrid Intel parts list their P- and E-cores under
+# the cpu_core and cpu_atom PMUs.
+CORE_TYPES = {0: "Unknown", 1: "Performance", 2: "Efficiency"}
+_CORE_TYPE_PMUS = ((1, "/sys/devices/cpu_core/cpus"), (2, "/sys/devices/cpu_atom/cpus"))
+
+
+def parse_cpulist(text):
+    """Expands a kernel CPU list ("0-3,8,10-11") into [0, 1, 2, 3, 8, 10, 11]."""
+    cpus = []
+    for part in (text or "").strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _cpulist(path):
+    try:
+        return parse_cpulist(read_sysfs(path))
+    except ValueError:
+        return []
+
+
+def _kb(size):
+    """Cache sizes are written like "2048K"."""
+    size = (size or "").strip().upper()
+    multiplier = {'K': 1, 'M': 1024, 'G': 1024 * 1024}.get(size[-1:], None)
+    try:
+        return int(size[:-1]) * multiplier if multiplier else int(size) // 1024
+    except ValueError:
+        return None
+
+
+class CpuTable:
+    """One row per logical CPU, one array.array per column.
+
+    package, core (a global index of physical cores), node, l2 and l3 (the index of
+    the cache instance the CPU shares) are -1 when unknown. Frequencies are in kHz,
+    0 when unknown, and core_type is a key of CORE_TYPES.
+    """
+
+    COLUMNS = ('package', 'core', 'node', 'l2', 'l3', 'cur_khz', 'min_khz', 'max_khz', 'core_type')
+
+    def __init__(self, cpus):
+        count = len(cpus)
+        self.cpus = array.array('i', cpus)
+        self.index = {cpu: i for i, cpu in enumerate(cpus)}
+        for column in ('package', 'core', 'node', 'l2', 'l3'):
+            setattr(self, column, array.array('i', [-1]) * count)
+        for column in ('cur_khz', 'min_khz', 'max_khz'):
+            setattr(self, column, array.array('i', [0]) * count)
+        self.core_type = array.array('b', [0]) * count
+        self.cache_kb = {2: [], 3: []}  # level -> size of each cache instance, by instance index
+
+    def __len__(self):
+        return len(self.cpus)
+
+    def assign(self, column, cpus, value):
+        """Sets `column` to `value` for every CPU of `cpus` that is in the table."""
+        values, index = getattr(self, column), self.index
+        for cpu in cpus:
+            i = index.get(cpu)
+            if i is not None:
+                values[i] = value
+
+    def groups(self, column):
+        """Number of distinct known values in a column (cores, packages, nodes, ...)."""
+        return len(set(getattr(self, column)) - {-1})
+
+    def as_dict(self, columns=None):
+        """Returns {'cpu': [...], column: [...]} with one list entry per CPU."""
+        table = {'cpu': self.cpus.tolist()}
+        for column in columns or self.COLUMNS:
+            table[column] = getattr(self, column).tolist()
+        return table
+
+
+def _place_groups(table, column, cpus_of, value_of=None):
+    """Fills `column` group by group: cpus_of(cpu) lists the CPUs sharing that cpu's group.
+
+    value_of(cpu, group_number) gives the value stored for the group (default: the group number).
+    """
+    values = getattr(table, column)
+    group = 0
+    for i, cpu in enumerate(table.cpus):
+        if values[i] != -1:
+            continue
+        members = cpus_of(cpu) or [cpu]
+        if cpu not in members:
+            members.append(cpu)
+        value = value_of(cpu, group) if value_of else group
+        table.assign(column, members, value)
+        group += 1
+
+
+def _place_caches(table, cpu_dir):
+    """Fills the l2/l3 columns and cache sizes from cache/index* (data and unified caches only)."""
+    first = table.cpus[0]
+    try:
+        indexes = [name for name in probes.listdir(f"{cpu_dir}/cpu{first}/cache") if name.startswith("index")]
+    except OSError:
+        return
+    for name in indexes:
+        level = read_sysfs(f"{cpu_dir}/cpu{first}/cache/{name}/level")
+        if level not in ("2", "3") or read_sysfs(f"{cpu_dir}/cpu{first}/cache/{name}/type") == "Instruction":
+            continue
+        level = int(level)
+        sizes = table.cache_kb[level]
+
+        def instance(cpu, number, name=name):
+            sizes.append(_kb(read_sysfs(f"{cpu_dir}/cpu{cpu}/cache/{name}/size")))
+            return number
+
+        _place_groups(table, f"l{level}", lambda cpu: _cpulist(f"{cpu_dir}/cpu{cpu}/cache/{name}/shared_cpu_list"),
+                      instance)
+
+
+def _place_nodes(table, node_dir):
+    try:
+        nodes = [name for name in probes.listdir(node_dir) if name.startswith("node") and name[4:].isdigit()]
+    except OSError:
+        return
+    for name in nodes:
+        table.assign('node', _cpulist(f"{node_dir}/{name}/cpulist"), int(name[4:]))
+
+
+def frequencies(cpu_dir=CPU_DIR, current_only=False):
+    """Yields (cpus, cur_khz, min_khz, max_khz) per cpufreq policy (min/max are None with current_only)."""
+    try:
+        policies = [name for name in probes.listdir(f"{cpu_dir}/cpufreq") if name.startswith("policy")]
+    except OSError:
+        return
+    for name in policies:
+        base = f"{cpu_dir}/cpufreq/{name}"
+        cpus = _cpulist(f"{base}/related_cpus") or _cpulist(f"{base}/affected_cpus")
+        files = ("scaling_cur_freq",) if current_only else ("scaling_cur_freq", "cpuinfo_min_freq", "cpuinfo_max_freq")
+        values = [read_sysfs(f"{base}/{file}") for file in files]
+        values = [int(value) if value and value.isdigit() else 0 for value in values] + [None] * (3 - len(files))
+        yield (cpus, *values)
+
+
+@probes.view
+def read_topology(cpu_dir=CPU_DIR, node_dir=NODE_DIR):
+    """Scans sysfs into a CpuTable of the online CPUs (None if sysfs doesn't list any), once per run."""
+    cpus = _cpulist(f"{cpu_dir}/online")
+    if not cpus:
+        try:
+            cpus = sorted(int(name[3:]) for name in probes.listdir(cpu_dir) if name[:3] == "cpu" and name[3:].isdigit())
+        except OSError:
+            return None
+    if not cpus:
+        return None
+    table = CpuTable(cpus)
+
+    def siblings(cpu):
+        base = f"{cpu_dir}/cpu{cpu}/topology"
+        return _cpulist(f"{base}/thread_siblings_list") or _cpulist(f"{base}/core_cpus_list")
+
+    def package_cpus(cpu):
+        base = f"{cpu_dir}/cpu{cpu}/topology"
+        return _cpulist(f"{base}/package_cpus_list") or _cpulist(f"{base}/core_siblings_list")
+
+    def package_id(cpu, number):
+        package = read_sysfs(f"{cpu_dir}/cpu{cpu}/topology/physical_package_id")
+        return int(package) if package and package.lstrip("-").isdigit() and int(package) >= 0 else number
+
+    _place_groups(table, 'core', siblings)
+    _place_groups(table, 'package', package_cpus, package_id)
+    _place_caches(table, cpu_dir)
+    _place_nodes(table, node_dir)
+    for policy_cpus, cur_khz, min_khz, max_khz in frequencies(cpu_dir):
+        table.assign('cur_khz', policy_cpus, cur_khz)
+        table.assign('min_khz', policy_cpus, min_khz)
+        table.assign('max_khz', policy_cpus, max_khz)
+    for core_type, path in _CORE_TYPE_PMUS:
+        table.assign('core_type', _cpulist(path), core_type)
+    return table
+
+
+def _cache_summary(sizes):
+    """ "2048 KB", or "131072 KB (64 x 2048 KB)" for several instances of one size."""
+    known = [size for size in sizes if size is not None]
+    if not known:
+        return "N/A"
+    total = sum(known)
+    if len(known) == 1:
+        return f"{total} KB"
+    if len(set(known)) == 1:
+        return f"{total} KB ({len(known)} x {known[0]} KB)"
+    return f"{total} KB ({len(known)} instances)"
+
+
+def cpu_summary(table):
+    """The cpu section fields the table answers: cores, threads, packages, NUMA nodes, caches, clocks and the table itself."""
+    summary = {
+        'cores': table.groups('core'),
+        'threads': len(table),
+        'packages': table.groups('package'),
+        'numa_nodes': table.groups('node') or 1,
+        'l2_cache_size': _cache_summary(table.cache_kb[2]),
+        'l3_cache_size': _cache_summary(table.cache_kb[3]),
+    }
+    max_khz = [khz for khz in table.max_khz if khz]
+    min_khz = [khz for khz in table.min_khz if khz]
+    if max_khz:
+        summary['max_clock_speed'] = round(max(max_khz) / 1000, 2)
+    if min_khz:
+        summary['min_clock_speed'] = round(min(min_khz) / 1000, 2)
+    if any(table.core_type):
+        for core_type, key in ((1, 'performance_cores'), (2, 'efficiency_cores')):
+            summary[key] = len({table.core[i] for i in range(len(table)) if table.core_type[i] == core_type})
+    summary['topology'] = table.as_dict(('package', 'core', 'node', 'l2', 'l3', 'min_khz', 'max_khz', 'core_type'))
+    summary['current_clock_speeds'] = [round(khz / 1000, 2) if khz else "N/A" for khz in table.cur_khz]
+    return summary
+
+
+def current_clock_speeds(cpus, cpu_dir=CPU_DIR):
+    """Current MHz of each of `cpus` from the cpufreq policies (one read per policy), "N/A" where unknown."""
+    index = {cpu: i for i, cpu in enumerate(cpus)}
+    speeds = ["N/A"] * len(cpus)
+    for policy_cpus, cur_khz, _, _ in frequencies(cpu_dir, current_only=True):
+        for cpu in policy_cpus:
+            if cpu in index and cur_khz:
+                speeds[index[cpu]] = round(cur_khz / 1000, 2)
+    return speeds
@@ -0,0 +1,127 @@
+"""Watch mode: per-second rates from /proc counters (Linux)."""
+import os
+import time
+
+from . import diskstats, meminfo, netstats
+from .interrupts import parse_interrupts
+
+WATCH_SOURCES = {
+    'stat': "/proc/stat",
+    'interrupts': "/proc/interrupts",
+    'meminfo': "/proc/meminfo",
+    'net_dev': "/proc/net/dev",
+    'diskstats': "/proc/diskstats",
+    'vmstat': "/proc/vmstat",  # read by a meminfo.VmstatSampler, into arrays it reuses
+}
+
+
+def _read_fd(fd):
+    """Rereads an already open procfs file from offset 0, so each tick costs no open()."""
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+
+def _parse_proc_stat(data):
+    """Returns (context_switches, {cpu: (busy_jiffies, total_jiffies)}) from /proc/stat."""
+    ctxt = 0
+    cpus = {}
+    for line in data.split(b"\n"):
+        if line.startswith(b"cpu"):
+            fields = line.split()
+            jiffies = [int(x) for x in fields[1:9]]  # user nice system idle iowait irq softirq steal
+            total = sum(jiffies)
+            cpus[fields[0].decode()] = (total - jiffies[3] - jiffies[4], total)
+        elif line.startswith(b"ctxt "):
+            ctxt = int(line[5:])
+    return ctxt, cpus
+
+
+def _watch_counters(fds):
+    ctxt, cpus = _parse_proc_stat(_read_fd(fds['stat']))
+    return {
+        'ctxt': ctxt,
+        'cpus': cpus,
+        'interrupts': parse_interrupts(_read_fd(fds['interrupts'])),
+        'meminfo': meminfo.parse_meminfo(_read_fd(fds['meminfo']).decode(errors="replace")),
+        'net_dev': netstats.parse_net_dev(_read_fd(fds['net_dev']).decode(errors="replace"), netstats.active_filter()),
+        'diskstats': diskstats.parse_diskstats(_read_fd(fds['diskstats']).decode(errors="replace")),
+    }
+
+
+def _watch_rates(previous, current, elapsed):
+    """Turns two counter snapshots taken `elapsed` seconds apart into a sample of rates."""
+    utilization = {}
+    for cpu, (busy, total) in current['cpus'].items():
+        prev_busy, prev_total = previous['cpus'].get(cpu, (busy, total))
+        d_total = total - prev_total
+        utilization[cpu] = round(100 * (busy - prev_busy) / d_total, 1) if d_total > 0 else 0.0
+
+    interrupts = current['interrupts'].delta(previous['interrupts'])
+    irq_per_sec = {irq: round(count / elapsed, 1) for irq, count in interrupts.per_irq().items()}
+
+    network = {name: dict(zip(netstats.FIELDS, rates))
+               for name, rates in netstats.rates(previous['net_dev'], current['net_dev'], elapsed).items()}
+
+    disk_io = {device: diskstats.performance(previous['diskstats'].get(device, (0,) * len(counts)), counts, elapsed)
+               for device, counts in current['diskstats'].items()}
+
+    fields = current['meminfo']
+    to_gb = lambda key: meminfo.to_gb(fields[key]) if key in fields else "N/A"
+    return {
+        'timestamp': time.time(),
+        'interval': round(elapsed, 3),
+        'context_switches_per_sec': round((current['ctxt'] - previous['ctxt']) / elapsed, 1),
+        'interrupts_per_sec': round(interrupts.total() / elapsed, 1),
+        'irq_per_sec': irq_per_sec,
+        'irq_per_cpu_per_sec': [round(count / elapsed, 1) for count in interrupts.per_cpu()],
+        'cpu_utilization': utilization,
+        'network_rx_bytes_per_sec': round(sum(rates['rx_bytes'] for rates in network.values()), 1),
+        'network_tx_bytes_per_sec': round(sum(rates['tx_bytes'] for rates in network.values()), 1),
+        'network_per_sec': network,
+        'disk_io': disk_io,
+        'memory': {
+            'free_gb': to_gb('MemFree'),
+            'available_gb': to_gb('MemAvailable'),
+            'swap_free_gb': to_gb('SwapFree'),
+        },
+    }
+
+
+def watch(interval, count=None):
+    """Yields a sample of per-second rates every `interval` seconds (Linux only).
+
+    /proc/stat, /proc/interrupts, /proc/meminfo, /proc/net/dev, /proc/diskstats and
+    /proc/vmstat stay open for the lifetime of the generator and are reread in place
+    each tick. Paging rates ('paging_per_sec') come from a VmstatSampler, whose
+    counters and read buffer are allocated once.
+    """
+    fds = {}
+    try:
+        for name, path in WATCH_SOURCES.items():
+            fds[name] = os.open(path, os.O_RDONLY)
+        vmstat = meminfo.VmstatSampler()
+        previous = _watch_counters(fds)
+        previous_time = time.monotonic()
+        vmstat.update(fds['vmstat'], previous_time)
+        next_tick = previous_time + interval
+        produced = 0
+        while count is None or produced < count:
+            time.sleep(max(0, next_tick - time.monotonic()))
+            next_tick += interval
+            current = _watch_counters(fds)
+            now = time.monotonic()
+            vmstat.update(fds['vmstat'], now)
+            sample = _watch_rates(previous, current, now - previous_time)
+            sample['paging_per_sec'] = dict(zip(meminfo.VMSTAT_FIELDS, vmstat.rates))
+            yield sample
+            previous, previous_time = current, now
+            produced += 1
+    finally:
+        for fd in fds.values():
+            os.close(fd)
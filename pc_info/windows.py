@@ -0,0 +1,293 @@
+"""Windows backend: registry and wmic/ipconfig probes."""
+import calendar
+import re
+import time
+
+from . import probes
+from .common import get_os_info, host_names  # get_os_info is re-exported as the 'os' collector
+from .parsers import parse_records, parse_titled_blocks
+from .processes import summarize
+
+_IPV4 = re.compile(r"[0-9.]+")
+_MAC = re.compile(r"[0-9A-Fa-f-]+")
+_IPCONFIG_FIELDS = ('IPv4 Address', 'Physical Address', 'DNS Servers', 'DHCP Enabled', 'Default Gateway',
+                    'Description', 'Connection-specific DNS Suffix', 'DHCP Server', 'Subnet Mask')
+
+
+def _wmic(command):
+    """Runs a `wmic ... get A, B, ... /Value` query and returns one {property: value} record per instance."""
+    properties = tuple(name.strip() for name in command.split(" get ", 1)[1].replace("/Value", "").split(","))
+    return parse_records(probes.run(command), "=", keys=properties)
+
+
+def _int_or(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def get_cpu_info():
+    """Collects CPU information."""
+
+    cpu = {}
+    try:
+        # Get CPU name from the registry (more reliable)
+        try:
+            cpu_name = probes.read_registry("HARDWARE\\DESCRIPTION\\System\\CentralProcessor\\0", "ProcessorNameString")
+        except Exception as e:
+            cpu_name = f"Error getting CPU name from registry: {e}"
+
+        records = _wmic("wmic cpu get CurrentClockSpeed, L2CacheSize, L3CacheSize, MaxClockSpeed, DataWidth, NumberOfCores, NumberOfLogicalProcessors, SocketDesignation, Manufacturer, Family, DeviceID /Value")
+        first = records[0] if records else {}  # first socket
+
+        cpu['name'] = cpu_name
+        cpu['current_clock_speed'] = int(first['CurrentClockSpeed']) if 'CurrentClockSpeed' in first else "N/A"
+        cpu['l2_cache_size'] = int(first['L2CacheSize']) if 'L2CacheSize' in first else "N/A"
+        cpu['l3_cache_size'] = int(first['L3CacheSize']) if 'L3CacheSize' in first else "N/A"
+        cpu['max_clock_speed'] = int(first['MaxClockSpeed']) if 'MaxClockSpeed' in first else "N/A"
+        cpu['architecture'] = first.get('DataWidth', "N/A")
+        cpu['cores'] = int(first['NumberOfCores']) if 'NumberOfCores' in first else "N/A"
+        cpu['threads'] = int(first['NumberOfLogicalProcessors']) if 'NumberOfLogicalProcessors' in first else "N/A" # added logical processors (threads)
+        cpu['socket'] = first.get('SocketDesignation', "N/A")  # Socket information
+        cpu['manufacturer'] = first.get('Manufacturer', "N/A") #Added manufacturer (e.g. Intel, AMD)
+        cpu['family'] = first.get('Family', "N/A")
+        cpu['device_id'] = first.get('DeviceID', "N/A") #Alternate cpu name
+
+    except Exception as e:
+        cpu['name'] = f"Error getting CPU info: {e}"
+    return cpu
+
+
+def get_memory_info():
+    """Collects memory information (total, modules, page files)."""
+
+    memory = {}
+    try:
+        output = probes.run("wmic computersystem get TotalPhysicalMemory")
+        mem_bytes = int(output.split('\n')[1].strip())
+        memory['total_gb'] = round(mem_bytes / (1024 ** 3), 2)
+        memory['total_bytes'] = mem_bytes
+
+        memory_modules = []
+        for chip in _wmic("wmic memorychip get Capacity, Speed, Manufacturer, PartNumber, SerialNumber, FormFactor, MemoryType, ConfiguredClockSpeed /Value"):
+            if 'Capacity' not in chip:
+                continue
+            capacity = _int_or(chip['Capacity'], None)
+            memory_modules.append({
+                'capacity_gb': round(capacity / (1024 ** 3), 2) if capacity is not None else "Unknown",
+                'speed_mhz': chip.get('Speed', "Unknown"),
+                'manufacturer': chip.get('Manufacturer', "Unknown"),
+                'part_number': chip.get('PartNumber', "Unknown"),
+                'serial_number': chip.get('SerialNumber', "Unknown"),
+                'form_factor': chip.get('FormFactor', "Unknown"),
+                'memory_type': chip.get('MemoryType', "Unknown"),
+                'configured_speed_mhz': chip.get('ConfiguredClockSpeed', "Unknown"),
+            })
+
+        memory['modules'] = memory_modules
+
+        try: #get virtual memory info (page file)
+            pagefiles = []
+            for pagefile in _wmic("wmic pagefile get AllocatedBaseSize, CurrentUsage, Name /Value"):
+                if 'AllocatedBaseSize' not in pagefile:
+                    continue
+                pagefiles.append({
+                    'name': pagefile.get('Name', "Unknown"),
+                    'allocated_mb': int(pagefile['AllocatedBaseSize']),
+                    'current_usage_mb': int(pagefile['CurrentUsage']) if 'CurrentUsage' in pagefile else "Unknown"
+                })
+            memory['pagefiles'] = pagefiles
+
+        except Exception as e:
+            memory['pagefiles'] = f"Error getting pagefile info: {e}"
+
+    except Exception as e:
+        memory['total_gb'] = f"Error getting memory info: {e}"
+    return memory
+
+
+def get_disk_info():
+    """Collects disk information."""
+
+    disks = []
+    try:
+        drives = _wmic("wmic diskdrive get Caption,Size, InterfaceType, MediaType, Model, SerialNumber, Partitions, Index, FirmwareRevision, BytesPerSector, SectorsPerTrack, TotalCylinders, TotalSectors, TotalTracks /Value") #Serial, partions, index
+
+        try: #get drive health (one query for every drive), requires admin
+            health, health_error = _wmic("wmic diskdrive get Status, Availability, ErrorDescription /Value"), None
+        except Exception as e:
+            health, health_error = [], e
+
+        for i, drive in enumerate(record for record in drives if 'Caption' in record):
+            size = _int_or(drive.get('Size'), None)
+            disk_info = { #store disk details.
+                'name': drive['Caption'],
+                'size_gb': round(size / (1024 ** 3), 2) if size is not None else "Unknown", #Handle disks where size is invalid.
+                'interface': drive.get('InterfaceType', "Unknown"),
+                'media_type': drive.get('MediaType', "Unknown"),
+                'model': drive.get('Model', "Unknown"),
+                'serial_number': drive.get('SerialNumber', "Unknown"),
+                'partitions': drive.get('Partitions', "Unknown"),
+                'index': drive.get('Index', "Unknown"),
+                'firmware_revision': drive.get('FirmwareRevision', "Unknown"),
+                'bytes_per_sector': drive.get('BytesPerSector', "Unknown"),
+                'sectors_per_track': drive.get('SectorsPerTrack', "Unknown"),
+                'total_cylinders': drive.get('TotalCylinders', "Unknown"),
+                'total_sectors': drive.get('TotalSectors', "Unknown"),
+                'total_tracks': drive.get('TotalTracks', "Unknown")
+            }
+            if health_error is None:
+                drive_health = health[i] if i < len(health) else {}
+                disk_info['status'] = drive_health.get('Status', "Unknown")
+                disk_info['availability'] = drive_health.get('Availability', "Unknown")
+                disk_info['error_description'] = drive_health.get('ErrorDescription', "None")
+            else:
+                disk_info['health_info'] = f"Unable to get drive health. Admin required. Error: {health_error}"
+
+            disks.append(disk_info) #add dik info.
+
+    except Exception as e:
+        disks.append(f"Error getting disk info: {e}")
+    return disks
+
+
+def get_network_info():
+    """Collects network information."""
+
+    network = {}
+    try:
+        network.update(host_names())
+
+        blocks = parse_titled_blocks(probes.run("ipconfig /all"), ":", _IPCONFIG_FIELDS)
+        first = {}  # first value of each field across the whole output, like the old re.search
+        for _, fields in blocks:
+            for key, value in fields.items():
+                first.setdefault(key, value)
+
+        ip_match = _IPV4.match(first.get('IPv4 Address', ""))
+        network['ip_address'] = ip_match.group(0) if ip_match else 'Not Found'
+
+        mac_match = _MAC.match(first.get('Physical Address', ""))
+        network['mac_address'] = mac_match.group(0) if mac_match else "Not Found"
+
+        dns_servers = [fields['DNS Servers'] for _, fields in blocks if 'DNS Servers' in fields]
+        network['dns_servers'] = dns_servers if dns_servers else "N/A"
+
+        network['dhcp_enabled'] = first['DHCP Enabled'] if first.get('DHCP Enabled') in ("Yes", "No") else "N/A" #dhcp info
+        network['default_gateway'] = first.get('Default Gateway', "N/A") #added gateway
+
+        adapters = [] #get adapters (ethernet)
+        for title, fields in blocks:
+            if not title or not title.startswith(("Ethernet adapter", "Wireless LAN adapter")):
+                continue
+            ip_address = fields.get('IPv4 Address', "")
+            adapters.append({
+                'name': fields.get('Description', "Unknown"),
+                'connection_specific_dns_suffix': fields.get('Connection-specific DNS Suffix', "N/A"),
+                'dhcp_server': fields.get('DHCP Server', "N/A"), #add dhcp info
+                'ip_address': ip_address.split("(Preferred")[0].strip() if "(Preferred" in ip_address else "N/A", #get the preferred address
+                'subnet_mask': fields.get('Subnet Mask', "N/A")
+            })
+        network['adapters'] = adapters
+
+
+    except Exception as e:
+        network['hostname'] = f"Error getting hostname: {e}"
+        network['ip_address'] = f"Error getting IP address: {e}"
+        network['mac_address'] = f"Error getting MAC address: {e}"
+    return network
+
+
+def get_gpu_info():
+    """Collects graphics card (GPU) information."""
+
+    gpu = {}
+    try:
+        controllers = _wmic("wmic path win32_VideoController get Name, AdapterRAM, DriverVersion, DriverDate, Status, AdapterDACType, MaxRefreshRate, MinRefreshRate, InstalledDisplayDrivers, VideoModeDescription, VideoProcessor /Value") #added more fields
+
+        gpus = []
+        for controller in controllers:
+            if 'Name' not in controller:
+                continue
+            ram = _int_or(controller.get('AdapterRAM'), None)
+            gpus.append({
+                'name': controller['Name'],
+                'ram_gb': round(ram / (1024 ** 3), 2) if ram is not None else 'Unknown',
+                'driver_version': controller.get('DriverVersion', "Unknown"),
+                'driver_date': controller.get('DriverDate', "Unknown"),
+                'status': controller.get('Status', "Unknown"),
+                'dac_type': controller.get('AdapterDACType', "Unknown"),
+                'max_refresh_rate': controller.get('MaxRefreshRate', "Unknown"),
+                'min_refresh_rate': controller.get('MinRefreshRate', "Unknown"),
+                'installed_display_drivers': controller.get('InstalledDisplayDrivers', "Unknown"),
+                'video_mode_description': controller.get('VideoModeDescription', "Unknown"),
+                'video_processor': controller.get('VideoProcessor', "Unknown")
+            })
+        gpu['gpus'] = gpus #Changed from 'name' to 'gpus' since it will be a list
+
+    except Exception as e:
+        gpu['gpus'] = [f"Error getting GPU info: {e}"]
+    return gpu
+
+
+def get_motherboard_info():
+    """Collects motherboard information."""
+
+    motherboard = {}
+    try:
+        records = _wmic("wmic baseboard get Manufacturer, Product, SerialNumber, Version, HostingBoard, PoweredOn, Removable, Replaceable /Value")
+        board = records[0] if records else {}
+
+        motherboard['manufacturer'] = board.get('Manufacturer', "Unknown")
+        motherboard['product'] = board.get('Product', "Unknown")
+        motherboard['serial_number'] = board.get('SerialNumber', "Unknown")
+        motherboard['version'] = board.get('Version', "Unknown")
+        motherboard['hosting_board'] = board.get('HostingBoard', "Unknown")
+        motherboard['powered_on'] = board.get('PoweredOn', "Unknown")
+        motherboard['removable'] = board.get('Removable', "Unknown")
+        motherboard['replaceable'] = board.get('Replaceable', "Unknown")
+
+    except Exception as e:
+        motherboard = f"Error getting motherboard info: {e}"
+    return motherboard
+
+
+def _wmi_timestamp(value):
+    """Seconds since the epoch from a CIM datetime ("20240108091502.123456+060"), None if malformed."""
+    try:
+        if not value[:14].isdigit() or len(value) < 22:
+            return None
+        # fixed-width fields sliced by hand: time.strptime per process dominated the process table parse
+        stamp = calendar.timegm((int(value[:4]), int(value[4:6]), int(value[6:8]), int(value[8:10]), int(value[10:12]),
+                                 int(value[12:14])))
+        return stamp + float(value[14:21]) - int(value[21:]) * 60  # the suffix is minutes east of UTC
+    except (TypeError, ValueError):
+        return None
+
+
+def get_process_info():
+    """Collects process counts and the heaviest processes by CPU, memory and I/O."""
+    try:
+        now = time.time()
+        records = []
+        for process in _wmic("wmic process get ProcessId, ParentProcessId, Name, ThreadCount, WorkingSetSize, VirtualSize, ReadTransferCount, WriteTransferCount, KernelModeTime, UserModeTime, CreationDate /Value"):
+            # CPU% since the process started, as CPU times are all wmic has (in 100 ns units)
+            started = _wmi_timestamp(process.get('CreationDate'))
+            cpu_seconds = (_int_or(process.get('KernelModeTime'), 0) + _int_or(process.get('UserModeTime'), 0)) / 1e7
+            records.append({
+                'pid': _int_or(process.get('ProcessId'), "N/A"),
+                'ppid': _int_or(process.get('ParentProcessId'), "N/A"),
+                'name': process.get('Name', "Unknown"),
+                'user': "N/A",
+                'state': "N/A",
+                'threads': _int_or(process.get('ThreadCount'), "N/A"),
+                'cpu_percent': round(100 * cpu_seconds / (now - started), 1) if started and now > started else "N/A",
+                'rss_mb': round(int(process['WorkingSetSize']) / (1024 * 1024), 1) if process.get('WorkingSetSize', "").isdigit() else "N/A",
+                'vms_mb': round(int(process['VirtualSize']) / (1024 * 1024), 1) if process.get('VirtualSize', "").isdigit() else "N/A",
+                'read_bytes': _int_or(process.get('ReadTransferCount'), "N/A"),  # all I/O, not just storage
+                'write_bytes': _int_or(process.get('WriteTransferCount'), "N/A"),
+            })
+        return summarize(records, "since start")
+    except Exception as e:
+        return f"Error getting process info: {e}"
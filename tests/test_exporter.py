@@ -0,0 +1,55 @@
+import http.client
+import threading
+
+import pytest
+
+from pc_info.exporter import OPENMETRICS_TYPE, PROMETHEUS_TYPE, Exporter, make_server
+
+
+@pytest.fixture(scope="module")
+def server():
+    exporter = Exporter(interval=3600, sections=['cpu', 'memory']).start()
+    server = make_server(exporter, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    exporter.stop()
+
+
+def scrape(server, path="/metrics", headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read().decode()
+    finally:
+        connection.close()
+
+
+def gauge(body, name):
+    for line in body.splitlines():
+        if line.startswith(f"{name} "):
+            return float(line.split()[1])
+    raise AssertionError(f"{name} not in the scrape")
+
+
+def test_prometheus_scrape(server):
+    status, content_type, body = scrape(server)
+    assert status == 200
+    assert content_type == PROMETHEUS_TYPE
+    assert "# TYPE pc_info_memory_total_bytes gauge" in body
+    assert gauge(body, "pc_info_memory_total_bytes") > 0
+
+
+def test_openmetrics_scrape(server):
+    status, content_type, body = scrape(server, headers={"Accept": "application/openmetrics-text"})
+    assert status == 200
+    assert content_type == OPENMETRICS_TYPE
+    assert body.endswith("# EOF\n")
+    assert gauge(body, "pc_info_memory_total_bytes") > 0
+
+
+def test_unknown_path(server):
+    status, _, _ = scrape(server, "/")
+    assert status == 404
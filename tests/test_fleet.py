@@ -0,0 +1,20 @@
+from pc_info import core
+from pc_info.fleet import collect_fleet
+
+SECTIONS = ['cpu', 'memory']
+
+
+def test_local_fleet_reports_every_section_of_every_host():
+    dataset = collect_fleet(["host-a", "host-b"], SECTIONS, transport="local", timeout=30, host_timeout=60)
+    assert sorted(dataset) == ["host-a", "host-b"]
+    for host, info in dataset.items():
+        assert isinstance(info, dict), f"{host}: {info}"
+        assert sorted(info) == SECTIONS
+        assert isinstance(info['cpu'], dict) and 'name' in info['cpu']
+        assert isinstance(info['memory'], dict) and 'total_gb' in info['memory']
+
+
+def test_local_fleet_matches_a_local_collection():
+    local = core.collect(['memory'])
+    remote = collect_fleet(["host-a"], ['memory'], transport="local", timeout=30, host_timeout=60)["host-a"]
+    assert remote['memory']['total_gb'] == local['memory']['total_gb']